@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+검색 백엔드 비교 벤치마크
+같은 합성 볼트에서 scan / index / sqlite 백엔드의 색인 생성 시간과 쿼리 지연을 비교합니다.
+
+사용법:
+    python benchmarks/search_backends.py --notes 3000 --repeat 20
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from loguru import logger
+
+from mcp_obsidian.config.obsidian_settings import ObsidianSettings
+from mcp_obsidian.tools.search_backends import SEARCH_BACKENDS
+from mcp_obsidian.tools.vault_manager import VaultManager
+
+
+WORDS = (
+    "검색 엔진 색인 노트 문서 프로젝트 회의 요약 아이디어 설계 구현 테스트 배포 성능 캐시 "
+    "search engine index note vault project meeting summary design build deploy cache "
+    "latency throughput python fastapi sqlite markdown obsidian graph backlink"
+).split()
+
+QUERIES = [
+    ("검색", "content", False),
+    ("engine", "content", False),
+    ("latency throughput", "content", False),
+    ("needle", "content", False),
+    ("프로젝트", "content", True),
+    ("cache", "content", True),
+    ("note", "title", False),
+]
+
+
+def build_vault(path: Path, note_count: int, words_per_note: int, seed: int = 42) -> None:
+    """합성 볼트 생성 (폴더, 헤딩, 태그, 위키링크 포함)"""
+    rng = random.Random(seed)
+    for i in range(note_count):
+        folder = path / f"folder{i % 20}"
+        folder.mkdir(exist_ok=True)
+        body = " ".join(rng.choice(WORDS) for _ in range(words_per_note))
+        tags = " ".join(f"#{rng.choice(WORDS[15:])}" for _ in range(2))
+        link = f"[[note{rng.randrange(note_count)}]]"
+        (folder / f"note{i}.md").write_text(
+            f"# {rng.choice(WORDS)} {rng.choice(WORDS)}\n\n{body}\n\n{tags} {link}\n",
+            encoding="utf-8"
+        )
+    # 한 노트에만 있는 단어 (선택도 높은 쿼리)
+    with open(path / "folder0" / f"note{note_count // 2}.md", "a", encoding="utf-8") as f:
+        f.write("\nneedle 희귀단어\n")
+
+
+async def measure(vault_path: Path, backend: str, repeat: int) -> dict:
+    settings = ObsidianSettings()
+    settings.set_search_setting("backend", backend)
+    vault_manager = VaultManager(str(vault_path), settings)
+    notes = await vault_manager.list_notes(recursive=True)
+
+    started = time.perf_counter()
+    await vault_manager.search_backend.prepare(notes)
+    build = time.perf_counter() - started
+
+    latencies = {}
+    for query, search_type, ranked in QUERIES:
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            await vault_manager.search_notes(query, search_type, limit=10, ranked=ranked)
+            samples.append((time.perf_counter() - started) * 1000)
+        latencies[(query, search_type, ranked)] = statistics.median(samples)
+
+    await vault_manager.flush_indexes()
+    return {"build": build, "latencies": latencies}
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="검색 백엔드 비교 벤치마크")
+    parser.add_argument("--notes", type=int, default=3000, help="합성 노트 수")
+    parser.add_argument("--words", type=int, default=200, help="노트당 단어 수")
+    parser.add_argument("--repeat", type=int, default=20, help="쿼리당 반복 횟수")
+    parser.add_argument("--backends", nargs="+", default=list(SEARCH_BACKENDS), help="비교할 백엔드")
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        vault_path = Path(temp_dir)
+        build_vault(vault_path, args.notes, args.words)
+        print(f"합성 볼트: {args.notes}개 노트, 노트당 {args.words}단어")
+
+        results = {}
+        for backend in args.backends:
+            results[backend] = await measure(vault_path, backend, args.repeat)
+
+        header = f"{'쿼리':<32}" + "".join(f"{backend:>12}" for backend in args.backends)
+        print(header)
+        print("-" * len(header))
+        print(f"{'색인 생성 (s)':<32}" + "".join(
+            f"{results[backend]['build']:>12.3f}" for backend in args.backends
+        ))
+        for query, search_type, ranked in QUERIES:
+            label = f"{query} [{search_type}{', ranked' if ranked else ''}] (ms)"
+            print(f"{label:<32}" + "".join(
+                f"{results[backend]['latencies'][(query, search_type, ranked)]:>12.2f}"
+                for backend in args.backends
+            ))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
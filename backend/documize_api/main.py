@@ -3,9 +3,12 @@ FastAPI 기반 백그라운드 서버
 옵시디언 플러그인과 통신하는 API 서버입니다.
 """
 import sys
-from fastapi import FastAPI, HTTPException
+import json
+from contextlib import asynccontextmanager, aclosing
+from fastapi import FastAPI, HTTPException, Request, Response, Header
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Dict, Any, List, Optional
+from fastapi.responses import StreamingResponse
+from typing import Dict, Any, List, Optional, AsyncIterator
 from loguru import logger
 import uvicorn
 
@@ -29,16 +32,32 @@ mcp_obsidian_path = Path(__file__).parent.parent / "mcp_obsidian"
 sys.path.insert(0, str(mcp_obsidian_path))
 
 from mcp_server import AIProvider, OutputFormat
-from mcp_server.models.schemas import AIRequest, AIResponse, HealthResponse
+from mcp_server.models.schemas import (
+    AIRequest, AIResponse, HealthResponse, BatchReadRequest, BatchWriteRequest
+)
 from mcp_server.config.settings import settings, validate_api_keys
 from mcp_obsidian import ObsidianEngine
+from mcp_obsidian.indexes import select_fields
 # MCP 서버는 더 이상 사용하지 않음
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 수명주기 - AI 제공자 연결 풀, 볼트 감시자, 자동 백업 시작/종료"""
+    engine = get_obsidian_engine()
+    await engine.provider_manager.open()
+    await engine.start_vault_watcher()
+    await engine.start_backup_scheduler()
+    yield
+    await engine.stop_backup_scheduler()
+    await engine.stop_vault_watcher()
+    await engine.provider_manager.aclose()
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="Obsidian AI Engine",
     description="옵시디언 플러그인용 AI 엔진 백엔드",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -62,6 +81,99 @@ def get_obsidian_engine():
 
 # MCP 서버는 더 이상 사용하지 않음
 
+STREAM_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream"
+}
+
+# 일괄 읽기/쓰기 요청당 최대 항목 수
+MAX_BATCH_ITEMS = 500
+
+def resolve_stream_format(request: Request, stream_format: Optional[str]) -> str:
+    """스트리밍 형식 결정 (명시값 우선, 없으면 Accept 헤더)"""
+    if stream_format is None:
+        accept = request.headers.get("accept", "")
+        stream_format = "sse" if "text/event-stream" in accept else "ndjson"
+    
+    if stream_format not in STREAM_MEDIA_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"지원하지 않는 스트리밍 형식입니다: {stream_format}"
+        )
+    return stream_format
+
+def wants_event_stream(request: Request, stream: bool) -> bool:
+    """AI 생성 스트리밍 요청 여부 (stream 필드 또는 Accept: text/event-stream)"""
+    return stream or "text/event-stream" in request.headers.get("accept", "")
+
+def resolve_expected_hash(if_match: Optional[str], expected_hash: Optional[str]) -> Optional[str]:
+    """If-Match 헤더 또는 쿼리의 기대 해시 (따옴표와 약한 ETag 접두사 제거)"""
+    value = expected_hash or if_match
+    if not value or value.strip() == "*":
+        return None
+    value = value.strip()
+    if value.startswith("W/"):
+        value = value[2:]
+    return value.strip('"')
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더에 현재 ETag가 포함되는지 (약한 비교)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return any((tag[2:] if tag.startswith("W/") else tag) == etag for tag in tags)
+
+def parse_byte_range(range_header: str, size: int) -> Optional[tuple]:
+    """
+    Range 헤더(bytes=a-b, bytes=a-, bytes=-n)를 (시작, 길이)로 변환
+    
+    단일 범위만 지원하며, 형식이 다르면 None, 만족할 수 없는 범위면 ValueError를 발생시킵니다.
+    """
+    unit, _, spec = range_header.partition("=")
+    if unit.strip() != "bytes" or "," in spec:
+        return None
+    first, _, last = spec.strip().partition("-")
+    try:
+        if not first:
+            suffix = int(last)
+            start = max(0, size - suffix)
+            end = size - 1
+        else:
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+    except ValueError:
+        return None
+    if start >= size or end < start:
+        raise ValueError("만족할 수 없는 범위입니다.")
+    return start, end - start + 1
+
+def create_stream_response(
+    events: AsyncIterator[Dict[str, Any]],
+    stream_format: str
+) -> StreamingResponse:
+    """
+    이벤트 딕셔너리 스트림을 NDJSON 또는 SSE 응답으로 변환
+    
+    클라이언트 연결이 끊기면 Starlette가 응답 태스크를 취소하고,
+    aclosing을 통해 원본 제너레이터(볼트 스캔 등)까지 정리됩니다.
+    """
+    async def encode() -> AsyncIterator[str]:
+        async with aclosing(events) as stream:
+            async for event in stream:
+                payload = json.dumps(event, ensure_ascii=False)
+                if stream_format == "sse":
+                    yield f"event: {event.get('type', 'message')}\ndata: {payload}\n\n"
+                else:
+                    yield payload + "\n"
+    
+    return StreamingResponse(
+        encode(),
+        media_type=STREAM_MEDIA_TYPES[stream_format],
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.get("/", response_model=Dict[str, str])
 async def root():
     """루트 엔드포인트"""
@@ -75,7 +187,8 @@ async def health_check():
         return HealthResponse(
             status="healthy",  # 서버가 실행 중이면 항상 healthy
             api_keys_valid=True,  # 헬스 체크에서는 API 키 검증 생략
-            missing_keys=[]  # 빈 리스트로 설정
+            missing_keys=[],  # 빈 리스트로 설정
+            providers=get_obsidian_engine().provider_manager.get_health()  # 서킷 브레이커 상태 (메모리 조회)
         )
     except Exception as e:
         logger.error(f"헬스 체크 중 오류: {str(e)}")
@@ -86,8 +199,8 @@ async def health_check():
         )
 
 @app.post("/generate", response_model=AIResponse)
-async def generate_ai_response(request: AIRequest):
-    """AI 응답 생성 엔드포인트"""
+async def generate_ai_response(request: AIRequest, http_request: Request):
+    """AI 응답 생성 엔드포인트 (stream=true 또는 Accept: text/event-stream이면 SSE)"""
     try:
         try:
             output_format = OutputFormat(request.output_format)
@@ -106,13 +219,30 @@ async def generate_ai_response(request: AIRequest):
             )
         
         engine = get_obsidian_engine()
+        if wants_event_stream(http_request, request.stream):
+            return create_stream_response(
+                engine.stream_response(
+                    prompt=request.prompt,
+                    output_format=output_format,
+                    provider=provider,
+                    model=request.model,
+                    api_key=request.api_key,
+                    language=request.language,
+                    bypass_cache=request.bypass_cache,
+                    refresh_cache=request.refresh_cache
+                ),
+                "sse"
+            )
+        
         result = await engine.generate_response(
             prompt=request.prompt,
             output_format=output_format,
             provider=provider,
             model=request.model,
             api_key=request.api_key,
-            language=request.language
+            language=request.language,
+            bypass_cache=request.bypass_cache,
+            refresh_cache=request.refresh_cache
         )
         
         return AIResponse(**result)
@@ -206,8 +336,8 @@ async def set_ai_mode(mode: str):
 
 # 기본 AI 요청과 고급 기능을 구분하는 엔드포인트들
 @app.post("/ai/basic/generate")
-async def basic_ai_generate(request: AIRequest):
-    """기본 AI 생성 요청 - 간단한 텍스트 생성"""
+async def basic_ai_generate(request: AIRequest, http_request: Request):
+    """기본 AI 생성 요청 - 간단한 텍스트 생성 (stream=true면 SSE)"""
     try:
         # 기본 요청은 항상 텍스트 형식으로 처리
         basic_request = AIRequest(
@@ -221,12 +351,28 @@ async def basic_ai_generate(request: AIRequest):
         
         # Obsidian 엔진을 통한 처리
         engine = get_obsidian_engine()
+        if wants_event_stream(http_request, request.stream):
+            return create_stream_response(
+                engine.stream_response(
+                    prompt=basic_request.prompt,
+                    output_format=OutputFormat.TEXT,
+                    provider=AIProvider(basic_request.provider),
+                    model=basic_request.model,
+                    api_key=basic_request.api_key,
+                    bypass_cache=request.bypass_cache,
+                    refresh_cache=request.refresh_cache
+                ),
+                "sse"
+            )
+        
         result = await engine.generate_response(
             prompt=basic_request.prompt,
             output_format=OutputFormat.TEXT,
             provider=AIProvider(basic_request.provider),
             model=basic_request.model,
-            api_key=basic_request.api_key
+            api_key=basic_request.api_key,
+            bypass_cache=request.bypass_cache,
+            refresh_cache=request.refresh_cache
         )
         
         return AIResponse(**result)
@@ -236,8 +382,8 @@ async def basic_ai_generate(request: AIRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/ai/advanced/generate")
-async def advanced_ai_generate(request: AIRequest):
-    """고급 AI 생성 요청 - 구조화된 문서 생성"""
+async def advanced_ai_generate(request: AIRequest, http_request: Request):
+    """고급 AI 생성 요청 - 구조화된 문서 생성 (stream=true면 SSE)"""
     try:
         # 고급 요청은 문서 형식으로 처리
         advanced_request = AIRequest(
@@ -251,13 +397,30 @@ async def advanced_ai_generate(request: AIRequest):
         
         # Obsidian 엔진을 통한 처리
         engine = get_obsidian_engine()
+        if wants_event_stream(http_request, request.stream):
+            return create_stream_response(
+                engine.stream_response(
+                    prompt=advanced_request.prompt,
+                    output_format=OutputFormat.DOCUMENT,
+                    provider=AIProvider(advanced_request.provider),
+                    model=advanced_request.model,
+                    api_key=advanced_request.api_key,
+                    language=advanced_request.language,
+                    bypass_cache=request.bypass_cache,
+                    refresh_cache=request.refresh_cache
+                ),
+                "sse"
+            )
+        
         result = await engine.generate_response(
             prompt=advanced_request.prompt,
             output_format=OutputFormat.DOCUMENT,
             provider=AIProvider(advanced_request.provider),
             model=advanced_request.model,
             api_key=advanced_request.api_key,
-            language=advanced_request.language
+            language=advanced_request.language,
+            bypass_cache=request.bypass_cache,
+            refresh_cache=request.refresh_cache
         )
         
         return AIResponse(**result)
@@ -266,6 +429,27 @@ async def advanced_ai_generate(request: AIRequest):
         logger.error(f"고급 AI 생성 중 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/ai/cache/stats")
+async def get_ai_cache_stats():
+    """AI 응답 캐시 통계 조회 - 메모리/디스크 적중, 미스, 우회, 적중률"""
+    try:
+        engine = get_obsidian_engine()
+        return engine.get_response_cache_stats()
+    except Exception as e:
+        logger.error(f"AI 응답 캐시 통계 조회 중 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/ai/cache/clear")
+async def clear_ai_cache():
+    """AI 응답 캐시 비우기"""
+    try:
+        engine = get_obsidian_engine()
+        removed = await engine.clear_response_cache()
+        return {"success": True, "removed": removed}
+    except Exception as e:
+        logger.error(f"AI 응답 캐시 삭제 중 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 # 옵시디언 특화 API 엔드포인트들
 @app.post("/obsidian/note/process")
 async def process_note_with_ai(
@@ -273,9 +457,11 @@ async def process_note_with_ai(
     operation: str,
     prompt: str,
     provider: str = "perplexity",
-    api_key: Optional[str] = None
+    api_key: Optional[str] = None,
+    expected_hash: Optional[str] = None,
+    if_match: Optional[str] = Header(None)
 ):
-    """노트를 AI로 처리"""
+    """노트를 AI로 처리 (If-Match 해시가 현재 노트와 다르면 412)"""
     try:
         engine = get_obsidian_engine()
         result = await engine.process_note_with_ai(
@@ -283,9 +469,16 @@ async def process_note_with_ai(
             operation=operation,
             prompt=prompt,
             provider=AIProvider(provider),
-            api_key=api_key
+            api_key=api_key,
+            expected_hash=resolve_expected_hash(if_match, expected_hash)
         )
+        if result.get("conflict") and not result.get("success"):
+            raise HTTPException(status_code=412, detail=result)
+        if result.get("too_large"):
+            raise HTTPException(status_code=413, detail=result)
         return result
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"노트 AI 처리 중 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -294,80 +487,359 @@ async def process_note_with_ai(
 async def search_vault(
     query: str,
     search_type: str = "content",
-    limit: int = 10
+    limit: int = 10,
+    ranked: bool = False
 ):
-    """볼트 검색"""
+    """볼트 검색 (search_type: content, title, tag, link, query - 쿼리 언어)"""
     try:
         engine = get_obsidian_engine()
-        result = await engine.search_vault(query, search_type, limit)
+        result = await engine.search_vault(query, search_type, limit, ranked)
         return result
     except Exception as e:
         logger.error(f"볼트 검색 중 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/obsidian/vault/search/stream")
+async def stream_search_vault(
+    request: Request,
+    query: str,
+    search_type: str = "content",
+    limit: int = 10,
+    ranked: bool = False,
+    stream_format: Optional[str] = None
+):
+    """볼트 검색 스트리밍 - 결과를 찾는 즉시 NDJSON 또는 SSE로 전송"""
+    stream_format = resolve_stream_format(request, stream_format)
+    engine = get_obsidian_engine()
+    return create_stream_response(
+        engine.stream_search_vault(query, search_type, limit, ranked),
+        stream_format
+    )
+
+@app.get("/obsidian/vault/tags")
+async def list_tags():
+    """태그 목록과 태그별 노트 수 조회"""
+    try:
+        engine = get_obsidian_engine()
+        result = await engine.list_tags()
+        return result
+    except Exception as e:
+        logger.error(f"태그 목록 조회 중 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/obsidian/vault/tags/notes")
+async def get_notes_by_tag(tag: str):
+    """태그가 달린 노트 조회"""
+    try:
+        engine = get_obsidian_engine()
+        result = await engine.get_notes_by_tag(tag)
+        return result
+    except Exception as e:
+        logger.error(f"태그별 노트 조회 중 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/obsidian/vault/structure")
-async def get_vault_structure():
-    """볼트 구조 조회"""
+async def get_vault_structure(response: Response, if_none_match: Optional[str] = Header(None)):
+    """볼트 구조 조회 (ETag: 구조 세대 - 변경이 없으면 304)"""
     try:
         engine = get_obsidian_engine()
+        etag = await engine.get_vault_structure_etag()
+        if etag is not None and etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
         result = await engine.get_vault_structure()
+        if etag is not None and result.get("success"):
+            structure = result["structure"]
+            response.headers["ETag"] = f'"{structure["epoch"]}-{structure["generation"]}"'
         return result
     except Exception as e:
         logger.error(f"볼트 구조 조회 중 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/obsidian/vault/structure/delta")
+async def get_vault_structure_delta(since: int = 0, epoch: Optional[str] = None):
+    """세대 since 이후 추가/수정/삭제된 파일만 조회 (reset이면 전체 구조를 다시 조회)"""
+    try:
+        engine = get_obsidian_engine()
+        result = await engine.get_vault_structure_delta(since, epoch)
+        return result
+    except Exception as e:
+        logger.error(f"볼트 구조 변경분 조회 중 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/obsidian/vault/set-path")
 async def set_vault_path(vault_path: str):
     """볼트 경로 설정"""
     try:
         engine = get_obsidian_engine()
-        engine.vault_manager.set_vault_path(vault_path)
+        engine.set_vault_path(vault_path)
         return {"success": True, "vault_path": vault_path}
     except Exception as e:
         logger.error(f"볼트 경로 설정 중 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/obsidian/note/list")
-async def list_notes(directory: str = "", recursive: bool = True):
-    """노트 목록 조회"""
+async def list_notes(
+    directory: str = "",
+    recursive: bool = True,
+    sort_by: Optional[str] = None,
+    descending: bool = True,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None
+):
+    """
+    노트 목록 조회
+    
+    limit, cursor, sort_by(mtime, size, name) 중 하나라도 주면 정렬된 페이지와 next_cursor를 반환하고,
+    fields(쉼표 구분)를 주면 해당 필드만 포함합니다.
+    """
     try:
         engine = get_obsidian_engine()
-        notes = await engine.vault_manager.list_notes(directory, recursive)
-        return {"success": True, "notes": notes}
+        field_list = [field.strip() for field in fields.split(",") if field.strip()] if fields else None
+        if limit is None and cursor is None and sort_by is None:
+            notes = await engine.vault_manager.list_notes(directory, recursive)
+            return {"success": True, "notes": [select_fields(note, field_list) for note in notes]}
+        
+        page = await engine.vault_manager.list_notes_page(
+            directory,
+            recursive,
+            sort_by or "mtime",
+            descending,
+            max(1, min(limit, 10000)) if limit is not None else None,
+            cursor,
+            field_list
+        )
+        return {"success": True, **page}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"노트 목록 조회 중 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/obsidian/note/read")
-async def read_note(note_path: str):
-    """노트 읽기"""
+async def read_note(
+    note_path: str,
+    response: Response,
+    offset: Optional[int] = None,
+    length: Optional[int] = None,
+    stream: bool = False,
+    chunk_size: int = 64 * 1024,
+    range_header: Optional[str] = Header(None, alias="Range")
+):
+    """
+    노트 읽기 (ETag: 본문 해시 - 쓰기 시 If-Match로 전달)
+    
+    offset/length를 주면 해당 바이트 범위(UTF-8 문자 경계로 맞춤)와 next_offset을 반환하고,
+    stream=true면 원본 바이트를 청크 단위로 스트리밍합니다 (Range 헤더 지원, 206).
+    """
     try:
         engine = get_obsidian_engine()
-        content = await engine.vault_manager.read_note(note_path)
-        if content is None:
+        if stream:
+            return await stream_note(engine, note_path, offset, length, chunk_size, range_header)
+        if offset is not None or length is not None:
+            result = await engine.vault_manager.read_note_range(note_path, offset or 0, length)
+            if result is None:
+                raise HTTPException(status_code=404, detail="노트를 찾을 수 없습니다.")
+            return {"success": True, **result}
+        
+        note = await engine.vault_manager.read_parsed_note(note_path)
+        if note is None:
             raise HTTPException(status_code=404, detail="노트를 찾을 수 없습니다.")
-        return {"success": True, "content": content}
+        response.headers["ETag"] = f'"{note.content_hash}"'
+        return {"success": True, "content": note.content, "hash": note.content_hash}
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"노트 읽기 중 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+async def stream_note(
+    engine: ObsidianEngine,
+    note_path: str,
+    offset: Optional[int],
+    length: Optional[int],
+    chunk_size: int,
+    range_header: Optional[str]
+) -> StreamingResponse:
+    """노트 원본 바이트 스트리밍 응답"""
+    size = await engine.vault_manager.get_note_size(note_path)
+    if size is None:
+        raise HTTPException(status_code=404, detail="노트를 찾을 수 없습니다.")
+    
+    status_code = 200
+    headers = {"Accept-Ranges": "bytes", "X-Note-Size": str(size)}
+    start = min(max(offset or 0, 0), size)
+    count = size - start if length is None else min(max(length, 0), size - start)
+    if range_header:
+        try:
+            byte_range = parse_byte_range(range_header, size)
+        except ValueError as e:
+            raise HTTPException(status_code=416, detail=str(e), headers={"Content-Range": f"bytes */{size}"})
+        if byte_range is not None:
+            start, count = byte_range
+            status_code = 206
+            headers["Content-Range"] = f"bytes {start}-{start + count - 1}/{size}"
+    headers["Content-Length"] = str(count)
+    
+    return StreamingResponse(
+        engine.vault_manager.iter_note_bytes(note_path, start, count, max(4096, min(chunk_size, 4 * 1024 * 1024))),
+        status_code=status_code,
+        media_type="text/plain; charset=utf-8",
+        headers=headers
+    )
+
+@app.get("/obsidian/note/backlinks")
+async def get_backlinks(note_path: str):
+    """노트 백링크 조회 - 이 노트를 링크하는 노트와 나가는 링크, 태그"""
+    try:
+        engine = get_obsidian_engine()
+        result = await engine.get_backlinks(note_path)
+        return result
+    except Exception as e:
+        logger.error(f"백링크 조회 중 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/obsidian/note/validate")
+async def validate_note(note_path: str):
+    """노트 구조 검증 - 제목, 섹션, 태그, 링크 확인"""
+    try:
+        engine = get_obsidian_engine()
+        result = await engine.validate_note(note_path)
+        return result
+    except Exception as e:
+        logger.error(f"노트 구조 검증 중 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/obsidian/cache/stats")
+async def get_cache_stats():
+    """노트 캐시 통계 조회 - 항목 수, 사용 바이트, 적중/미스, 적중률"""
+    try:
+        engine = get_obsidian_engine()
+        return engine.get_cache_stats()
+    except Exception as e:
+        logger.error(f"캐시 통계 조회 중 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/obsidian/changes")
+async def get_changes(since: int = 0, limit: int = 1000):
+    """변경 저널 조회 - 순번 since 이후의 쓰기/생성/삭제/AI 편집 (다음 요청에는 next_since 사용)"""
+    try:
+        engine = get_obsidian_engine()
+        result = await engine.get_changes(since, max(1, min(limit, 10000)))
+        return result
+    except Exception as e:
+        logger.error(f"변경 조회 중 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/obsidian/backups")
+async def list_backups():
+    """백업 스냅샷 목록 조회 (최신순)"""
+    try:
+        engine = get_obsidian_engine()
+        result = await engine.list_backups()
+        return result
+    except Exception as e:
+        logger.error(f"스냅샷 목록 조회 중 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/obsidian/backups")
+async def create_backup():
+    """증분 백업 스냅샷 생성 - 바뀐 파일만 저장"""
+    try:
+        engine = get_obsidian_engine()
+        result = await engine.create_backup()
+        return result
+    except Exception as e:
+        logger.error(f"스냅샷 생성 중 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/obsidian/backups/{snapshot_id}/note")
+async def read_backup_note(snapshot_id: int, note_path: str):
+    """스냅샷 시점의 노트 조회"""
+    try:
+        engine = get_obsidian_engine()
+        result = await engine.read_backup_note(snapshot_id, note_path)
+        return result
+    except Exception as e:
+        logger.error(f"스냅샷 노트 조회 중 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/obsidian/backups/{snapshot_id}/restore")
+async def restore_backup_note(snapshot_id: int, note_path: str):
+    """스냅샷 시점의 내용으로 노트 복원 - 현재 내용은 먼저 백업"""
+    try:
+        engine = get_obsidian_engine()
+        result = await engine.restore_backup_note(snapshot_id, note_path)
+        return result
+    except Exception as e:
+        logger.error(f"노트 복원 중 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/obsidian/note/write")
-async def write_note(note_path: str, content: str):
-    """노트 쓰기"""
+async def write_note(
+    note_path: str,
+    content: str,
+    response: Response,
+    expected_hash: Optional[str] = None,
+    if_match: Optional[str] = Header(None)
+):
+    """노트 쓰기 - 내용이 같으면 쓰지 않고, If-Match 해시가 현재 노트와 다르면 412"""
     try:
         engine = get_obsidian_engine()
-        success = await engine.vault_manager.write_note(note_path, content)
-        if not success:
+        result = await engine.vault_manager.save_note(
+            note_path, content, resolve_expected_hash(if_match, expected_hash)
+        )
+        if result.get("conflict") and not result.get("success"):
+            raise HTTPException(status_code=412, detail=result)
+        if not result.get("success"):
             raise HTTPException(status_code=500, detail="노트 쓰기에 실패했습니다.")
-        return {"success": True, "note_path": note_path}
+        if result.get("hash"):
+            response.headers["ETag"] = f'"{result["hash"]}"'
+        return {"note_path": note_path, **result}
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"노트 쓰기 중 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/obsidian/note/batch-read")
+async def batch_read_notes(request: BatchReadRequest):
+    """여러 노트를 한 번에 읽기 (항목별 content/hash 또는 error)"""
+    if len(request.paths) > MAX_BATCH_ITEMS:
+        raise HTTPException(status_code=413, detail=f"한 번에 최대 {MAX_BATCH_ITEMS}개까지 읽을 수 있습니다.")
+    try:
+        engine = get_obsidian_engine()
+        results = await engine.vault_manager.read_notes(request.paths)
+        return {"success": all(result["success"] for result in results), "results": results}
+    except Exception as e:
+        logger.error(f"일괄 노트 읽기 중 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/obsidian/note/batch-write")
+async def batch_write_notes(request: BatchWriteRequest):
+    """
+    여러 노트를 한 번에 쓰기
+    
+    atomic=true면 충돌(expected_hash 불일치)이나 실패가 하나라도 있을 때 아무것도 쓰지 않고 412/500을 반환합니다.
+    """
+    if len(request.items) > MAX_BATCH_ITEMS:
+        raise HTTPException(status_code=413, detail=f"한 번에 최대 {MAX_BATCH_ITEMS}개까지 쓸 수 있습니다.")
+    try:
+        engine = get_obsidian_engine()
+        result = await engine.vault_manager.write_notes(
+            [item.model_dump() for item in request.items],
+            atomic=request.atomic
+        )
+        if request.atomic and not result["success"]:
+            conflict = any(item.get("conflict") for item in result["results"])
+            raise HTTPException(status_code=412 if conflict else 500, detail=result)
+        return result
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"일괄 노트 쓰기 중 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/obsidian/note/create")
 async def create_note(note_path: str, content: str = ""):
     """새 노트 생성"""
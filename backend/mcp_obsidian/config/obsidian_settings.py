@@ -18,6 +18,7 @@ class ObsidianSettings:
             "default_note_format": "markdown",
             "auto_backup": True,
             "backup_interval": 3600,  # 초
+            "backup_retention": 100,  # 유지할 스냅샷 수
             "max_note_size": 1024 * 1024,  # 1MB
             "supported_extensions": [".md", ".txt", ".json", ".yaml", ".yml"],
             "ai_enhancement": {
@@ -30,19 +31,33 @@ class ObsidianSettings:
                 "case_sensitive": False,
                 "use_regex": False,
                 "include_metadata": True,
-                "max_results": 50
+                "max_results": 50,
+                "backend": "index",  # 검색 백엔드: scan, index, sqlite
+                "read_batch_size": 64,  # 한 번에 읽을 노트 수
+                "read_concurrency": 8  # 동시 읽기 워커 수
             },
             "note_processing": {
                 "auto_format": True,
                 "validate_structure": True,
                 "suggest_links": True,
-                "extract_metadata": True
+                "extract_metadata": True,
+                "cache_max_bytes": 64 * 1024 * 1024  # 파싱된 노트 캐시 메모리 예산
             },
             "vault_operations": {
                 "create_backup_before_edit": True,
                 "track_changes": True,
                 "auto_save": True,
-                "conflict_resolution": "prompt"  # prompt, auto, skip
+                "conflict_resolution": "prompt",  # prompt, auto, skip
+                "atomic_writes": True  # 임시 파일 + fsync + 이름 교체로 쓰기
+            },
+            "watcher": {
+                "enabled": True,
+                "debounce_ms": 500,
+                "poll_interval": 5.0,  # 초 (폴링 모드)
+                "force_polling": False,
+                # 감시자가 꺼져 있을 때 외부 제자리 수정을 감지하기 위해 모든 파일을 다시 stat하는 간격
+                # (초, None이면 디렉토리 mtime만 확인 - 목록 조회가 O(볼트)가 되므로 필요할 때만 지정)
+                "stat_interval": None
             }
         }
         self.settings = self.default_settings.copy()
@@ -154,6 +169,14 @@ class ObsidianSettings:
         """볼트 작업 설정 변경"""
         return self.set_setting(f"vault_operations.{key}", value)
     
+    def get_watcher_settings(self) -> Dict[str, Any]:
+        """볼트 감시자 설정 조회"""
+        return self.get_setting("watcher", {})
+    
+    def set_watcher_setting(self, key: str, value: Any) -> bool:
+        """볼트 감시자 설정 변경"""
+        return self.set_setting(f"watcher.{key}", value)
+    
     def validate_settings(self) -> Dict[str, Any]:
         """설정 유효성 검사"""
         issues = []
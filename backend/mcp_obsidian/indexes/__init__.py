@@ -0,0 +1,30 @@
+"""
+MCP Obsidian Indexes
+볼트 검색 및 조회를 위한 색인 모듈들
+"""
+
+from .search_index import SearchIndex, INDEX_DIR_NAME, get_search_index
+from .trigram_index import TrigramIndex, normalize_text, tokenize
+from .link_graph import LinkGraph
+from .sqlite_index import SQLiteIndex, get_sqlite_index
+from .markdown_tokenizer import MarkdownStructure, tokenize_markdown
+from .vault_query import VaultQuery, VaultQueryError, QueryPlanner, parse_vault_query
+from .note_catalog import (
+    NoteCatalog, get_note_catalog, SORT_KEYS, select_page, select_fields, encode_cursor, decode_cursor
+)
+from .note_cache import NoteCache, ParsedNote, content_hash, get_note_cache
+from .section_index import Section, SectionIndex, SectionPatch, apply_patch
+from .change_journal import ChangeJournal, get_change_journal
+
+__all__ = [
+    "SearchIndex", "INDEX_DIR_NAME", "get_search_index",
+    "TrigramIndex", "normalize_text", "tokenize",
+    "LinkGraph", "SQLiteIndex", "get_sqlite_index",
+    "MarkdownStructure", "tokenize_markdown",
+    "VaultQuery", "VaultQueryError", "QueryPlanner", "parse_vault_query",
+    "NoteCatalog", "get_note_catalog",
+    "SORT_KEYS", "select_page", "select_fields", "encode_cursor", "decode_cursor",
+    "NoteCache", "ParsedNote", "content_hash", "get_note_cache",
+    "Section", "SectionIndex", "SectionPatch", "apply_patch",
+    "ChangeJournal", "get_change_journal"
+]
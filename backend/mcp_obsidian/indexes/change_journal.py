@@ -0,0 +1,172 @@
+"""
+변경 저널
+볼트 쓰기/생성/삭제/AI 편집을 순번과 함께 줄 단위 JSON으로 추가 기록하여
+클라이언트와 색인이 마지막으로 본 순번 이후의 변경분만 받아 동기화할 수 있게 합니다.
+"""
+import bisect
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+from loguru import logger
+
+from .search_index import INDEX_DIR_NAME
+
+
+JOURNAL_FILE_NAME = "changes.jsonl"
+# 기록 수가 이 값을 넘고 경로별 최신 기록의 2배를 넘으면 압축
+DEFAULT_COMPACT_THRESHOLD = 10000
+
+_journals: Dict[str, "ChangeJournal"] = {}
+_journals_lock = threading.Lock()
+
+
+def get_change_journal(vault_path: Path) -> "ChangeJournal":
+    """볼트별 공유 변경 저널 조회 (프로세스 단위)"""
+    key = str(Path(vault_path).absolute())
+    with _journals_lock:
+        journal = _journals.get(key)
+        if journal is None:
+            journal = ChangeJournal(Path(vault_path) / INDEX_DIR_NAME / JOURNAL_FILE_NAME)
+            _journals[key] = journal
+        return journal
+
+
+class ChangeJournal:
+    """추가 전용 변경 저널"""
+
+    def __init__(self, journal_path: Path, compact_threshold: int = DEFAULT_COMPACT_THRESHOLD):
+        self.journal_path = Path(journal_path)
+        self.compact_threshold = compact_threshold
+        self.entries: List[Dict[str, Any]] = []
+        self._seqs: List[int] = []
+        # 경로 -> 최신 기록 순번
+        self._latest: Dict[str, int] = {}
+        # 이 순번까지는 압축되어 경로별 최신 기록만 남음
+        self.compacted_through = 0
+        self.loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def latest_seq(self) -> int:
+        with self._lock:
+            self._load()
+            return self._seqs[-1] if self._seqs else self.compacted_through
+
+    def append(
+        self,
+        operation: str,
+        path: str,
+        content_hash: Optional[str] = None,
+        size: Optional[int] = None
+    ) -> int:
+        """
+        변경 기록 추가
+
+        Args:
+            operation: create, write, ai_edit, restore, delete, external_write, external_delete
+            path: 볼트 기준 상대 경로
+            content_hash: 쓴 내용의 해시 (알 수 있는 경우)
+            size: 파일 크기
+
+        Returns:
+            기록 순번
+        """
+        with self._lock:
+            self._load()
+            seq = (self._seqs[-1] if self._seqs else self.compacted_through) + 1
+            entry = {"seq": seq, "time": time.time(), "op": operation, "path": path}
+            if content_hash is not None:
+                entry["hash"] = content_hash
+            if size is not None:
+                entry["size"] = size
+
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+            self._add(entry)
+
+            if len(self.entries) >= self.compact_threshold and len(self.entries) > 2 * len(self._latest):
+                self._compact()
+            return seq
+
+    def changes(self, since: int = 0, limit: int = 1000) -> Dict[str, Any]:
+        """
+        순번 since 이후의 변경 조회
+
+        since가 압축된 구간에 있으면 그 구간의 중간 기록 없이 경로별 최신 기록만 반환하며,
+        이 경우에도 변경된 경로의 최종 상태는 빠짐없이 포함됩니다.
+        """
+        with self._lock:
+            self._load()
+            start = bisect.bisect_right(self._seqs, since)
+            changes = self.entries[start:start + limit]
+            latest_seq = self._seqs[-1] if self._seqs else self.compacted_through
+            return {
+                "since": since,
+                "latest_seq": latest_seq,
+                "next_since": changes[-1]["seq"] if changes else max(since, latest_seq),
+                "has_more": start + limit < len(self.entries),
+                "compacted": since < self.compacted_through,
+                "changes": changes
+            }
+
+    def compact(self) -> int:
+        """경로별 최신 기록만 남기도록 저널 압축"""
+        with self._lock:
+            self._load()
+            return self._compact()
+
+    def _compact(self) -> int:
+        before = len(self.entries)
+        kept = [entry for entry in self.entries if self._latest.get(entry["path"]) == entry["seq"]]
+        dropped = [entry["seq"] for entry in self.entries if self._latest.get(entry["path"]) != entry["seq"]]
+        compacted_through = max(self.compacted_through, max(dropped, default=0))
+
+        temp_path = self.journal_path.with_suffix(".tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({"compacted_through": compacted_through}) + "\n")
+            for entry in kept:
+                f.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+        os.replace(temp_path, self.journal_path)
+
+        self.entries = kept
+        self._seqs = [entry["seq"] for entry in kept]
+        self.compacted_through = compacted_through
+        logger.info(f"변경 저널 압축: {before}개 -> {len(kept)}개")
+        return before - len(kept)
+
+    def _load(self) -> None:
+        """저널 파일 로드 (최초 1회, 중간에 끊긴 마지막 줄은 무시)"""
+        if self.loaded:
+            return
+
+        self.loaded = True
+        if not self.journal_path.exists():
+            return
+
+        try:
+            line = ""
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if "compacted_through" in record:
+                        self.compacted_through = record["compacted_through"]
+                    elif not self._seqs or record["seq"] > self._seqs[-1]:
+                        self._add(record)
+            if line and not line.endswith("\n"):
+                # 끊긴 줄 뒤에 이어 쓰지 않도록 줄바꿈 보정
+                with open(self.journal_path, 'a', encoding='utf-8') as f:
+                    f.write("\n")
+        except Exception as e:
+            logger.error(f"변경 저널 로드 실패: {str(e)}")
+
+    def _add(self, entry: Dict[str, Any]) -> None:
+        self.entries.append(entry)
+        self._seqs.append(entry["seq"])
+        self._latest[entry["path"]] = entry["seq"]
@@ -0,0 +1,109 @@
+"""
+태그/링크 그래프
+노트별 태그와 위키링크의 순방향/역방향 인접 목록을 유지하여
+백링크, 태그별 노트, 태그 개수를 한 번의 조회로 응답합니다.
+"""
+import os
+from typing import Dict, Iterable, List, Set
+
+from .trigram_index import normalize_text
+
+
+def link_target(link: str) -> str:
+    """
+    위키링크 대상 키 추출
+
+    별칭(|), 헤딩(#), 블록 참조(^)와 .md 확장자를 제거하고 정규화합니다.
+    ("Other Note#Section|보기" -> "other note")
+    """
+    target = link.split("|", 1)[0].split("#", 1)[0].split("^", 1)[0].strip()
+    if target.lower().endswith(".md"):
+        target = target[:-3]
+    return normalize_text(target.replace("\\", "/"))
+
+
+def note_keys(path: str) -> List[str]:
+    """노트를 가리킬 수 있는 링크 대상 키 (파일명, 확장자 없는 볼트 상대 경로)"""
+    stem = os.path.splitext(path.replace(os.sep, "/"))[0]
+    keys = [normalize_text(os.path.basename(stem))]
+    full_key = normalize_text(stem)
+    if full_key != keys[0]:
+        keys.append(full_key)
+    return keys
+
+
+def normalize_tag(tag: str) -> str:
+    """태그 키 정규화 (# 접두사 유무와 대소문자 무시)"""
+    tag = normalize_text(tag.strip())
+    return tag if tag.startswith("#") else f"#{tag}"
+
+
+class LinkGraph:
+    """노트 태그/링크 인접 그래프 클래스"""
+
+    def __init__(self):
+        # 순방향: 경로 -> 태그 / 링크 대상
+        self.note_tags: Dict[str, List[str]] = {}
+        self.note_links: Dict[str, List[str]] = {}
+        # 역방향: 태그 -> 경로, 링크 대상 -> 경로
+        self.tag_notes: Dict[str, Set[str]] = {}
+        self.link_notes: Dict[str, Set[str]] = {}
+
+    def add_note(self, path: str, tags: Iterable[str], links: Iterable[str]) -> None:
+        """노트의 태그와 링크 반영 (기존 항목은 교체)"""
+        self.remove_note(path)
+
+        tags = sorted(set(tags))
+        targets = sorted({link_target(link) for link in links} - {""})
+        if tags:
+            self.note_tags[path] = tags
+        if targets:
+            self.note_links[path] = targets
+        for tag in tags:
+            self.tag_notes.setdefault(tag, set()).add(path)
+        for target in targets:
+            self.link_notes.setdefault(target, set()).add(path)
+
+    def remove_note(self, path: str) -> None:
+        """노트를 그래프에서 제거"""
+        for tag in self.note_tags.pop(path, ()):
+            self._discard(self.tag_notes, tag, path)
+        for target in self.note_links.pop(path, ()):
+            self._discard(self.link_notes, target, path)
+
+    def backlinks(self, path: str) -> Set[str]:
+        """노트를 링크하는 노트 경로 (자기 자신 제외)"""
+        linked: Set[str] = set()
+        for key in note_keys(path):
+            linked.update(self.link_notes.get(key, ()))
+        linked.discard(path)
+        return linked
+
+    def outgoing_links(self, path: str) -> List[str]:
+        """노트가 링크하는 대상 키 목록"""
+        return list(self.note_links.get(path, ()))
+
+    def tags_of(self, path: str) -> List[str]:
+        """노트의 태그 목록"""
+        return list(self.note_tags.get(path, ()))
+
+    def notes_with_tag(self, tag: str) -> Set[str]:
+        """태그가 달린 노트 경로"""
+        return set(self.tag_notes.get(normalize_tag(tag), ()))
+
+    def notes_linking_to(self, target: str) -> Set[str]:
+        """링크 대상(노트 이름 또는 경로)을 링크하는 노트 경로"""
+        return set(self.link_notes.get(link_target(target), ()))
+
+    def tag_counts(self) -> Dict[str, int]:
+        """태그별 노트 수"""
+        return {tag: len(paths) for tag, paths in self.tag_notes.items()}
+
+    @staticmethod
+    def _discard(adjacency: Dict[str, Set[str]], key: str, path: str) -> None:
+        paths = adjacency.get(key)
+        if paths is None:
+            return
+        paths.discard(path)
+        if not paths:
+            del adjacency[key]
@@ -0,0 +1,173 @@
+"""
+마크다운 토크나이저
+노트를 한 번만 순회하여 프론트매터, 코드 블록, 헤딩, 태그, 위키링크, 마크다운 링크를
+하나의 구조 레코드로 추출합니다. 코드 블록과 인라인 코드 안의 태그/링크는 무시합니다.
+"""
+import re
+from typing import List, NamedTuple, Optional, Tuple
+
+
+HEADING_PATTERN = re.compile(r' {0,3}(#{1,6})[ \t]+(.*?)(?:[ \t]+#+)?[ \t]*$')
+FENCE_PATTERN = re.compile(r' {0,3}(`{3,}|~{3,})')
+FRONTMATTER_DELIMITER = "---"
+
+# 한 줄 안의 인라인 요소 (왼쪽부터 하나의 정규식으로 순회, 먼저 매칭된 요소가 우선)
+INLINE_PATTERN = re.compile(
+    r'(?P<code>(?P<ticks>`+).+?(?P=ticks))'
+    r'|(?P<embed>!)?\[\[(?P<wikilink>[^\[\]]+)\]\]'
+    r'|!?\[(?P<text>[^\[\]]*)\]\((?P<url>[^()\s]+)(?:\s+"[^"]*")?\)'
+    r'|(?<![\w#&/])#(?P<tag>[\w/-]+)'
+)
+
+
+class Heading(NamedTuple):
+    level: int
+    text: str
+    start: int  # 헤딩 줄 시작 오프셋
+    end: int  # 헤딩 줄 끝 오프셋 (줄바꿈 포함)
+    line: int  # 1부터 시작하는 줄 번호
+
+
+class Tag(NamedTuple):
+    name: str  # # 제외
+    offset: int
+
+
+class WikiLink(NamedTuple):
+    raw: str  # [[ ]] 안의 원문
+    target: str  # 노트 이름/경로 (헤딩·별칭 포함 전)
+    display: Optional[str]  # 별칭
+    embed: bool  # ![[ ]] 임베드 여부
+    offset: int
+
+
+class MarkdownLink(NamedTuple):
+    text: str
+    url: str
+    offset: int
+
+
+class MarkdownStructure:
+    """노트 구조 레코드"""
+
+    __slots__ = (
+        "frontmatter", "frontmatter_span", "code_spans", "headings",
+        "tags", "wikilinks", "markdown_links", "line_count", "word_count"
+    )
+
+    def __init__(self):
+        self.frontmatter: Optional[str] = None
+        self.frontmatter_span: Optional[Tuple[int, int]] = None
+        # 코드 블록/인라인 코드 [시작, 끝) 오프셋
+        self.code_spans: List[Tuple[int, int]] = []
+        self.headings: List[Heading] = []
+        self.tags: List[Tag] = []
+        self.wikilinks: List[WikiLink] = []
+        self.markdown_links: List[MarkdownLink] = []
+        self.line_count = 0
+        self.word_count = 0
+
+    @property
+    def title(self) -> Optional[str]:
+        """첫 번째 1단계 헤딩"""
+        for heading in self.headings:
+            if heading.level == 1:
+                return heading.text
+        return None
+
+    @property
+    def tag_names(self) -> List[str]:
+        """중복 제거된 태그 이름 (등장 순서)"""
+        return list(dict.fromkeys(tag.name for tag in self.tags))
+
+    @property
+    def link_texts(self) -> List[str]:
+        """중복 제거된 위키링크 원문 (등장 순서)"""
+        return list(dict.fromkeys(link.raw for link in self.wikilinks))
+
+
+def tokenize_markdown(content: str) -> MarkdownStructure:
+    """
+    노트 구조 추출 (단일 순회)
+
+    줄 단위로 한 번 순회하면서 프론트매터와 펜스 코드 블록 상태를 추적하고,
+    코드 블록 밖의 줄에서만 헤딩과 인라인 요소를 찾습니다.
+    """
+    structure = MarkdownStructure()
+    lines = content.splitlines(keepends=True)
+    structure.line_count = len(content.split('\n'))
+
+    offset = 0
+    index = 0
+    if lines and lines[0].rstrip('\r\n') == FRONTMATTER_DELIMITER:
+        # 닫는 구분자가 있어야 프론트매터로 인정
+        end_offset = len(lines[0])
+        for i in range(1, len(lines)):
+            if lines[i].rstrip('\r\n').strip() in (FRONTMATTER_DELIMITER, "..."):
+                structure.frontmatter = "".join(lines[1:i])
+                structure.frontmatter_span = (0, end_offset + len(lines[i]))
+                structure.word_count += sum(len(line.split()) for line in lines[:i + 1])
+                offset = structure.frontmatter_span[1]
+                index = i + 1
+                break
+            end_offset += len(lines[i])
+
+    fence: Optional[str] = None
+    fence_start = 0
+    for line_number in range(index, len(lines)):
+        line = lines[line_number]
+        text = line.rstrip('\r\n')
+        structure.word_count += len(text.split())
+
+        fence_match = FENCE_PATTERN.match(text)
+        if fence is not None:
+            # 같은 문자로 같거나 더 긴 펜스가 나오면 코드 블록 종료
+            if fence_match and fence_match.group(1)[0] == fence[0] and len(fence_match.group(1)) >= len(fence) \
+                    and not text[fence_match.end():].strip():
+                structure.code_spans.append((fence_start, offset + len(line)))
+                fence = None
+        elif fence_match:
+            fence = fence_match.group(1)
+            fence_start = offset
+        else:
+            heading_match = HEADING_PATTERN.match(text)
+            if heading_match:
+                structure.headings.append(Heading(
+                    len(heading_match.group(1)),
+                    heading_match.group(2).strip(),
+                    offset,
+                    offset + len(line),
+                    line_number + 1
+                ))
+            _scan_inline(structure, text, offset)
+
+        offset += len(line)
+
+    if fence is not None:
+        # 닫히지 않은 코드 블록은 문서 끝까지
+        structure.code_spans.append((fence_start, offset))
+    return structure
+
+
+def _scan_inline(structure: MarkdownStructure, text: str, offset: int) -> None:
+    """한 줄의 인라인 요소 추출"""
+    if '#' not in text and '[' not in text and '`' not in text:
+        return
+
+    for match in INLINE_PATTERN.finditer(text):
+        position = offset + match.start()
+        if match.group("code") is not None:
+            structure.code_spans.append((position, offset + match.end()))
+        elif match.group("wikilink") is not None:
+            raw = match.group("wikilink")
+            target, _, display = raw.partition("|")
+            structure.wikilinks.append(WikiLink(
+                raw, target.strip(), display.strip() or None, bool(match.group("embed")), position
+            ))
+        elif match.group("url") is not None:
+            structure.markdown_links.append(MarkdownLink(match.group("text"), match.group("url"), position))
+        else:
+            name = match.group("tag").rstrip("/")
+            # 숫자로만 된 #123은 태그가 아님
+            if name and not name.replace("/", "").isdigit():
+                structure.tags.append(Tag(name, position))
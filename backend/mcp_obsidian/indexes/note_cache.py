@@ -0,0 +1,202 @@
+"""
+파싱된 노트 캐시
+(경로, mtime, 크기)가 같으면 디스크 읽기와 마크다운 파싱을 건너뛰는 프로세스 단위 LRU 캐시입니다.
+메모리 사용량은 바이트 예산으로 제한합니다.
+"""
+import hashlib
+import os
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Optional, Union
+
+from .markdown_tokenizer import MarkdownStructure, tokenize_markdown
+
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# 파싱 레코드 항목(헤딩, 태그, 링크 등) 하나당 대략적인 메모리 비용
+STRUCTURE_ITEM_BYTES = 160
+
+_note_cache: Optional["NoteCache"] = None
+_note_cache_lock = threading.Lock()
+
+
+def content_hash(content: str) -> str:
+    """노트 본문 해시 (쓰기 생략/충돌 감지용)"""
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def get_note_cache(max_bytes: Optional[int] = None) -> "NoteCache":
+    """프로세스 공유 노트 캐시 조회 (max_bytes가 주어지면 예산 갱신)"""
+    global _note_cache
+    with _note_cache_lock:
+        if _note_cache is None:
+            _note_cache = NoteCache(max_bytes or DEFAULT_MAX_BYTES)
+        elif max_bytes:
+            _note_cache.resize(max_bytes)
+        return _note_cache
+
+
+class ParsedNote:
+    """캐시된 노트 (본문과 지연 파싱되는 구조 레코드)"""
+
+    __slots__ = ("path", "content", "mtime_ns", "size", "cost", "_structure", "_hash", "_cache")
+
+    def __init__(self, path: str, content: str, mtime_ns: int, size: int, cache: "NoteCache"):
+        self.path = path
+        self.content = content
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.cost = sys.getsizeof(content)
+        self._structure: Optional[MarkdownStructure] = None
+        self._hash: Optional[str] = None
+        self._cache = cache
+
+    @property
+    def content_hash(self) -> str:
+        """본문 해시 (처음 접근할 때 한 번만 계산)"""
+        if self._hash is None:
+            self._hash = content_hash(self.content)
+        return self._hash
+
+    @property
+    def structure(self) -> MarkdownStructure:
+        """마크다운 구조 (처음 접근할 때 한 번만 파싱)"""
+        if self._structure is None:
+            structure = tokenize_markdown(self.content)
+            self._structure = structure
+            self._cache._account(self, STRUCTURE_ITEM_BYTES * (
+                len(structure.headings) + len(structure.tags) + len(structure.wikilinks)
+                + len(structure.markdown_links) + len(structure.code_spans) + 1
+            ))
+        return self._structure
+
+
+class NoteCache:
+    """파싱된 노트 LRU 캐시"""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, ParsedNote]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def load(self, path: Union[str, Path]) -> Optional[ParsedNote]:
+        """
+        노트 조회 (mtime/크기가 같으면 캐시, 다르면 다시 읽음)
+
+        Returns:
+            캐시된 노트 (파일이 없으면 None)
+
+        Raises:
+            OSError, UnicodeDecodeError: 파일을 읽을 수 없는 경우
+        """
+        key = self._key(path)
+        try:
+            stat = os.stat(key)
+        except FileNotFoundError:
+            self.invalidate(key)
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        with open(key, 'r', encoding='utf-8') as f:
+            content = f.read()
+        return self._store(key, content, stat)
+
+    def read(self, path: Union[str, Path]) -> Optional[str]:
+        """노트 본문 조회"""
+        entry = self.load(path)
+        return entry.content if entry is not None else None
+
+    def put(
+        self,
+        path: Union[str, Path],
+        content: str,
+        content_digest: Optional[str] = None
+    ) -> Optional[ParsedNote]:
+        """방금 쓴 내용을 캐시에 반영 (쓰기 후 다시 읽지 않도록)"""
+        key = self._key(path)
+        try:
+            stat = os.stat(key)
+        except FileNotFoundError:
+            self.invalidate(key)
+            return None
+        entry = self._store(key, content, stat)
+        entry._hash = content_digest
+        return entry
+
+    def invalidate(self, path: Union[str, Path]) -> None:
+        """캐시 항목 제거"""
+        with self._lock:
+            entry = self._entries.pop(self._key(path), None)
+            if entry is not None:
+                self.current_bytes -= entry.cost
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def resize(self, max_bytes: int) -> None:
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중/미스 통계"""
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / requests, 4) if requests else 0.0
+            }
+
+    def _store(self, key: str, content: str, stat: os.stat_result) -> ParsedNote:
+        entry = ParsedNote(key, content, stat.st_mtime_ns, stat.st_size, self)
+        # 예산의 1/4을 넘는 노트는 다른 항목을 모두 밀어내므로 캐시하지 않음
+        if entry.cost > self.max_bytes // 4:
+            self.invalidate(key)
+            return entry
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous.cost
+            self._entries[key] = entry
+            self.current_bytes += entry.cost
+            self._evict()
+        return entry
+
+    def _account(self, entry: ParsedNote, extra: int) -> None:
+        """파싱 레코드 비용 반영"""
+        with self._lock:
+            entry.cost += extra
+            if self._entries.get(entry.path) is entry:
+                self.current_bytes += extra
+                self._evict()
+
+    def _evict(self) -> None:
+        while self.current_bytes > self.max_bytes and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self.current_bytes -= entry.cost
+            self.evictions += 1
+
+    @staticmethod
+    def _key(path: Union[str, Path]) -> str:
+        return os.path.abspath(path)
@@ -0,0 +1,575 @@
+"""
+노트 카탈로그
+os.scandir 한 번의 순회로 볼트 파일 메타데이터를 메모리에 유지하고,
+이후에는 mtime이 바뀐 디렉토리만 다시 읽습니다.
+항목이 추가/수정/삭제될 때마다 세대 번호를 올려 클라이언트가 변경분만 받을 수 있게 합니다.
+"""
+import base64
+import heapq
+import itertools
+import json
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Set, Iterable, Iterator, Tuple, Callable
+from loguru import logger
+
+from .search_index import INDEX_DIR_NAME
+
+
+DEFAULT_EXTENSIONS = frozenset({'.md', '.txt', '.json', '.yaml', '.yml'})
+# 삭제 기록 최대 보관 수 (넘으면 오래된 절반을 버리고 그 이전 세대의 변경분 요청은 전체 재조회로 응답)
+MAX_TOMBSTONES = 10000
+
+# 정렬 기준 -> 항목의 (정렬 값, 경로) 키 (경로로 동순위를 구분하여 커서가 항목 하나를 가리키게 함)
+SORT_KEYS: Dict[str, Callable[[Dict[str, Any]], tuple]] = {
+    "mtime": lambda entry: (entry["modified"], entry["path"]),
+    "size": lambda entry: (entry["size"], entry["path"]),
+    "name": lambda entry: (os.path.basename(entry["path"]).lower(), entry["path"]),
+}
+
+_catalogs: Dict[tuple, "NoteCatalog"] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_note_catalog(
+    vault_path: Path,
+    supported_extensions: Optional[Iterable[str]] = None
+) -> "NoteCatalog":
+    """볼트별 공유 카탈로그 인스턴스 조회 (프로세스 단위)"""
+    extensions = frozenset(supported_extensions or DEFAULT_EXTENSIONS)
+    key = (str(Path(vault_path).absolute()), extensions)
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = NoteCatalog(Path(vault_path), extensions)
+            _catalogs[key] = catalog
+        return catalog
+
+
+def encode_cursor(sort_by: str, descending: bool, key: tuple) -> str:
+    """마지막 항목의 정렬 키를 불투명 커서 문자열로 변환"""
+    payload = json.dumps([sort_by, descending, list(key)], ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str, descending: bool) -> tuple:
+    """커서 문자열을 정렬 키로 변환 (형식이나 정렬 조건이 다르면 ValueError)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, cursor_descending, key = json.loads(base64.urlsafe_b64decode(padded))
+    except Exception:
+        raise ValueError("잘못된 커서입니다.")
+    if cursor_sort != sort_by or cursor_descending != descending:
+        raise ValueError("커서의 정렬 조건이 요청과 다릅니다.")
+    return tuple(key)
+
+
+def select_page(
+    items: Iterable[Dict[str, Any]],
+    sort_key: Callable[[Dict[str, Any]], tuple],
+    descending: bool = False,
+    limit: Optional[int] = None,
+    after: Optional[tuple] = None
+) -> Tuple[List[Dict[str, Any]], Optional[tuple]]:
+    """
+    정렬 순서상 after 다음 항목 limit개 선택
+
+    limit개 크기의 힙만 유지하므로 전체 목록을 정렬하거나 복사하지 않습니다.
+
+    Returns:
+        (페이지 항목, 다음 페이지가 있으면 마지막 항목의 정렬 키)
+    """
+    if after is not None:
+        if descending:
+            items = (item for item in items if sort_key(item) < after)
+        else:
+            items = (item for item in items if sort_key(item) > after)
+
+    if limit is None:
+        return sorted(items, key=sort_key, reverse=descending), None
+
+    select = heapq.nlargest if descending else heapq.nsmallest
+    page = select(limit + 1, items, key=sort_key)
+    if len(page) <= limit:
+        return page, None
+    page = page[:limit]
+    return page, sort_key(page[-1])
+
+
+def select_fields(item: Dict[str, Any], fields: Optional[Iterable[str]]) -> Dict[str, Any]:
+    """요청한 필드만 남긴 항목 (fields가 없으면 그대로)"""
+    if not fields:
+        return item
+    return {field: item[field] for field in fields if field in item}
+
+
+class NoteCatalog:
+    """볼트 노트 메타데이터 카탈로그"""
+
+    def __init__(self, vault_path: Path, supported_extensions: Iterable[str] = DEFAULT_EXTENSIONS):
+        self.vault_path = Path(vault_path)
+        self.supported_extensions = frozenset(supported_extensions)
+        # 상대 경로 -> 노트 정보 (list_notes 형식)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        # 상대 디렉토리 경로 ("" = 볼트 루트) -> mtime
+        self.directories: Dict[str, float] = {}
+        # 디렉토리 -> 직속 파일 (순서 유지) / 직속 하위 디렉토리
+        self._dir_files: Dict[str, Dict[str, None]] = {}
+        self._dir_children: Dict[str, Set[str]] = {}
+        # 프로세스마다 새로 시작하는 세대 번호를 구분하기 위한 식별자
+        self.epoch = uuid.uuid4().hex[:12]
+        self.generation = 0
+        # 상대 경로 -> (변경 세대, 생성 세대, 크기, 수정 시각), 변경 세대 오름차순 유지
+        self._versions: Dict[str, Tuple[int, int, int, float]] = {}
+        # 삭제된 경로 -> 삭제 세대 (삭제 세대 오름차순)
+        self._tombstones: Dict[str, int] = {}
+        self._tombstone_floor = 0
+        self.loaded = False
+        # 파일 변경을 반영 중인 감시자 수 (있으면 refresh가 디렉토리를 확인하지 않음)
+        self.watchers = 0
+        # 감시자가 없을 때 모든 파일을 다시 stat하는 최소 간격 (초, None이면 하지 않음)
+        self.stat_interval: Optional[float] = None
+        self._last_stat_check = 0.0
+        self._lock = threading.RLock()
+
+    def refresh(self) -> int:
+        """
+        카탈로그 갱신
+
+        최초 호출 시 전체 볼트를 순회합니다. 이후 감시자가 붙어 있으면 감시자 이벤트로 반영되므로
+        아무것도 확인하지 않고, 감시자가 없으면 mtime이 바뀐 디렉토리만 다시 읽습니다.
+        이 프로세스의 쓰기는 update_note/apply_changes로 바로 반영됩니다.
+
+        디렉토리 mtime은 파일 추가/삭제/이름 변경만 알려주므로, 감시자 없이 외부 프로그램이
+        기존 파일을 제자리 수정한 것은 stat_interval을 지정한 경우에만(그 간격마다 모든 파일을 stat,
+        O(볼트) 비용) 반영됩니다.
+
+        Returns:
+            다시 읽은 디렉토리 수
+        """
+        with self._lock:
+            if self.loaded and self.watchers:
+                return 0
+            return self._refresh_directories()
+
+    def _refresh_directories(self) -> int:
+        """최초 전체 순회 또는 mtime이 바뀐 디렉토리 재순회"""
+        with self._lock:
+            if not self.loaded:
+                self._clear()
+                scanned = self._scan_tree("")
+                for path in self._versions.keys() - self.entries.keys():
+                    self._drop_entry(path)
+                self.loaded = True
+                logger.info(f"노트 카탈로그 생성: {len(self.entries)}개 노트, {scanned}개 디렉토리")
+                return scanned
+
+            scanned = 0
+            for directory in list(self.directories):
+                if directory not in self.directories:
+                    continue  # 상위 디렉토리 재스캔 중 제거됨
+                try:
+                    mtime = os.stat(self._abs(directory)).st_mtime
+                except FileNotFoundError:
+                    self._purge_directory(directory)
+                    continue
+                if mtime != self.directories[directory]:
+                    scanned += self._scan_directory(directory, recursive_new=True)
+
+            if self.stat_interval is not None and not self.watchers:
+                now = time.monotonic()
+                if now - self._last_stat_check >= self.stat_interval:
+                    self._last_stat_check = now
+                    for path in list(self.entries):
+                        self.update_note(path)
+            return scanned
+
+    def attach_watcher(self) -> None:
+        """감시자 시작 (파일 변경은 감시자가 apply_changes/poll_changes로 반영)"""
+        with self._lock:
+            self.watchers += 1
+
+    def detach_watcher(self) -> None:
+        """감시자 종료"""
+        with self._lock:
+            self.watchers = max(0, self.watchers - 1)
+
+    def invalidate(self) -> None:
+        """다음 refresh에서 전체 재순회"""
+        with self._lock:
+            self.loaded = False
+
+    def changes_since(self, since: int, epoch: Optional[str] = None) -> Dict[str, Any]:
+        """
+        세대 since 이후 추가/수정/삭제된 항목 조회
+
+        다른 프로세스의 세대이거나 삭제 기록이 정리된 세대라면 reset=True를 반환하며,
+        이 경우 클라이언트는 전체 목록을 다시 받아야 합니다.
+        """
+        with self._lock:
+            result = {"epoch": self.epoch, "generation": self.generation, "since": since}
+            if (
+                (epoch is not None and epoch != self.epoch)
+                or since > self.generation
+                or since < self._tombstone_floor
+            ):
+                return {**result, "reset": True, "added": [], "modified": [], "removed": []}
+
+            added, modified = [], []
+            for path, (generation, created, _, _) in reversed(self._versions.items()):
+                if generation <= since:
+                    break
+                (added if created > since else modified).append(dict(self.entries[path]))
+
+            removed = []
+            for path, generation in reversed(self._tombstones.items()):
+                if generation <= since:
+                    break
+                removed.append(path)
+
+            return {**result, "reset": False, "added": added, "modified": modified, "removed": removed}
+
+    def list_notes(self, directory: str = "", recursive: bool = True) -> List[Dict[str, Any]]:
+        """카탈로그에서 노트 목록 조회"""
+        directory = self._normalize(directory)
+        with self._lock:
+            if recursive:
+                directories = self._subtree_dirs(directory)
+            else:
+                directories = [directory] if directory in self._dir_files else []
+
+            notes = []
+            for d in directories:
+                for path in self._dir_files[d]:
+                    notes.append(dict(self.entries[path]))
+            return notes
+
+    def list_page(
+        self,
+        directory: str = "",
+        recursive: bool = True,
+        sort_by: str = "mtime",
+        descending: bool = True,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        정렬된 노트 목록의 한 페이지 조회
+
+        Args:
+            sort_by: mtime, size, name
+            limit: 페이지 크기 (None이면 전체)
+            cursor: 이전 페이지의 next_cursor
+            predicate: 추가 필터
+
+        Returns:
+            (노트 정보 목록, 다음 페이지 커서)
+        """
+        sort_key = SORT_KEYS.get(sort_by)
+        if sort_key is None:
+            raise ValueError(f"지원하지 않는 정렬 기준입니다: {sort_by}")
+        after = decode_cursor(cursor, sort_by, descending) if cursor else None
+
+        with self._lock:
+            items = self._iter_entries(self._normalize(directory), recursive)
+            if predicate is not None:
+                items = (entry for entry in items if predicate(entry))
+            page, next_key = select_page(items, sort_key, descending, limit, after)
+            notes = [dict(entry) for entry in page]
+
+        next_cursor = encode_cursor(sort_by, descending, next_key) if next_key is not None else None
+        return notes, next_cursor
+
+    def get_note(self, path: str) -> Optional[Dict[str, Any]]:
+        """단일 노트 정보 조회"""
+        with self._lock:
+            entry = self.entries.get(self._normalize(path))
+            return dict(entry) if entry else None
+
+    def update_note(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        단일 파일 항목 갱신 (직접 쓰기/삭제 후 호출)
+
+        파일 내용만 바뀌면 디렉토리 mtime이 변하지 않으므로 쓰기 경로에서 직접 반영합니다.
+
+        Returns:
+            갱신된 노트 정보 (삭제되었거나 대상이 아니면 None)
+        """
+        path = self._normalize(path)
+        with self._lock:
+            if not self.loaded:
+                return None
+
+            directory = os.path.dirname(path)
+            name = os.path.basename(path)
+            extension = os.path.splitext(name)[1]
+            try:
+                stat = os.stat(self._abs(path))
+            except FileNotFoundError:
+                self._drop_entry(path)
+                self._dir_files.get(directory, {}).pop(path, None)
+                return None
+
+            if extension not in self.supported_extensions or directory not in self._dir_files:
+                # 새 디렉토리 등은 다음 refresh에서 디렉토리 mtime으로 반영
+                return None
+
+            entry = {
+                "path": path,
+                "name": os.path.splitext(name)[0],
+                "extension": extension,
+                "size": stat.st_size,
+                "modified": stat.st_mtime
+            }
+            self._set_entry(path, entry)
+            self._dir_files[directory][path] = None
+            return dict(entry)
+
+    def apply_changes(self, paths: Iterable[str]) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        감시자 이벤트 반영
+
+        알려진 디렉토리의 파일은 해당 항목만 다시 stat하고, 디렉토리 이벤트나
+        처음 보는 디렉토리의 파일은 가장 가까운 알려진 상위 디렉토리를 다시 읽습니다.
+
+        Args:
+            paths: 변경된 경로 목록 (볼트 기준 상대 경로)
+
+        Returns:
+            (추가/수정된 노트 정보 목록, 제거된 노트 경로 목록)
+        """
+        changed: Dict[str, Dict[str, Any]] = {}
+        removed: Set[str] = set()
+        rescan: Set[str] = set()
+
+        with self._lock:
+            if not self.loaded:
+                return [], []
+
+            for path in paths:
+                path = self._normalize(path)
+                if not path or path.startswith(os.pardir) or INDEX_DIR_NAME in path.split(os.sep):
+                    continue
+
+                directory = os.path.dirname(path)
+                if (
+                    path not in self.directories
+                    and directory in self._dir_files
+                    and not os.path.isdir(self._abs(path))
+                ):
+                    existed = path in self.entries
+                    entry = self.update_note(path)
+                    if entry:
+                        changed[path] = entry
+                        removed.discard(path)
+                    elif existed:
+                        removed.add(path)
+                        changed.pop(path, None)
+                    continue
+
+                while directory and directory not in self.directories:
+                    directory = os.path.dirname(directory)
+                rescan.add(directory)
+
+            for directory in sorted(rescan, key=len):
+                if directory not in self.directories:
+                    continue  # 상위 디렉토리 재스캔 중 제거됨
+                before = self._subtree_entries(directory)
+                self._scan_directory(directory, recursive_new=True)
+                after = self._subtree_entries(directory)
+
+                for path in before.keys() - after.keys():
+                    removed.add(path)
+                    changed.pop(path, None)
+                for path, entry in after.items():
+                    previous = before.get(path)
+                    if (
+                        previous is None
+                        or previous["modified"] != entry["modified"]
+                        or previous["size"] != entry["size"]
+                    ):
+                        changed[path] = dict(entry)
+                        removed.discard(path)
+
+        return list(changed.values()), sorted(removed)
+
+    def poll_changes(self) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        폴링 방식 변경 감지 (네이티브 감시자를 쓸 수 없을 때 사용)
+
+        디렉토리 mtime 갱신 후 모든 파일을 다시 stat하므로 O(볼트) 비용이 듭니다.
+        """
+        with self._lock:
+            if not self.loaded:
+                self._refresh_directories()
+                return [], []
+
+            before = dict(self.entries)
+            self._refresh_directories()
+            for path in list(self.entries):
+                self.update_note(path)
+
+            changed = []
+            for path, entry in self.entries.items():
+                previous = before.get(path)
+                if (
+                    previous is None
+                    or previous["modified"] != entry["modified"]
+                    or previous["size"] != entry["size"]
+                ):
+                    changed.append(dict(entry))
+            removed = sorted(before.keys() - self.entries.keys())
+            return changed, removed
+
+    def _subtree_dirs(self, directory: str) -> List[str]:
+        """디렉토리와 모든 하위 디렉토리 목록"""
+        prefix = directory + os.sep if directory else ""
+        return [
+            d for d in self._dir_files
+            if not directory or d == directory or d.startswith(prefix)
+        ]
+
+    def _iter_entries(self, directory: str, recursive: bool) -> Iterator[Dict[str, Any]]:
+        """디렉토리(와 하위) 노트 항목 순회 (복사하지 않음, 잠금 안에서 사용)"""
+        if recursive:
+            directories = self._subtree_dirs(directory)
+        else:
+            directories = [directory] if directory in self._dir_files else []
+        for d in directories:
+            for path in self._dir_files[d]:
+                yield self.entries[path]
+
+    def _subtree_entries(self, directory: str) -> Dict[str, Dict[str, Any]]:
+        """디렉토리 하위 전체 노트 항목"""
+        return {
+            path: self.entries[path]
+            for d in self._subtree_dirs(directory)
+            for path in self._dir_files[d]
+        }
+
+    def _clear(self) -> None:
+        self.entries.clear()
+        self.directories.clear()
+        self._dir_files.clear()
+        self._dir_children.clear()
+
+    def _scan_tree(self, directory: str) -> int:
+        """디렉토리와 하위 디렉토리 전체 순회"""
+        scanned = 0
+        pending = [directory]
+        while pending:
+            current = pending.pop()
+            scanned += 1
+            pending.extend(self._read_directory(current))
+        return scanned
+
+    def _scan_directory(self, directory: str, recursive_new: bool = False) -> int:
+        """단일 디렉토리 재스캔 (새 하위 디렉토리는 전체 순회)"""
+        previous_children = set(self._dir_children.get(directory, ()))
+        previous_files = list(self._dir_files.get(directory, {}))
+
+        children = self._read_directory(directory)
+        scanned = 1
+
+        current_files = self._dir_files.get(directory, {})
+        for path in previous_files:
+            if path not in current_files:
+                self._drop_entry(path)
+
+        for child in previous_children - set(children):
+            self._purge_directory(child)
+        if recursive_new:
+            for child in children:
+                if child not in previous_children:
+                    scanned += self._scan_tree(child)
+        return scanned
+
+    def _read_directory(self, directory: str) -> List[str]:
+        """
+        디렉토리 직속 항목 읽기 (항목당 stat 1회)
+
+        Returns:
+            직속 하위 디렉토리 목록
+        """
+        abs_dir = self._abs(directory)
+        files: Dict[str, None] = {}
+        children: List[str] = []
+
+        try:
+            self.directories[directory] = os.stat(abs_dir).st_mtime
+            with os.scandir(abs_dir) as it:
+                for entry in it:
+                    relative = os.path.join(directory, entry.name) if directory else entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name != INDEX_DIR_NAME:
+                            children.append(relative)
+                        continue
+
+                    extension = os.path.splitext(entry.name)[1]
+                    if extension not in self.supported_extensions or not entry.is_file():
+                        continue
+
+                    stat = entry.stat()
+                    self._set_entry(relative, {
+                        "path": relative,
+                        "name": os.path.splitext(entry.name)[0],
+                        "extension": extension,
+                        "size": stat.st_size,
+                        "modified": stat.st_mtime
+                    })
+                    files[relative] = None
+        except FileNotFoundError:
+            self._purge_directory(directory)
+            return []
+        except Exception as e:
+            logger.warning(f"디렉토리 스캔 실패 ({abs_dir}): {str(e)}")
+
+        self._dir_files[directory] = files
+        self._dir_children[directory] = set(children)
+        return children
+
+    def _purge_directory(self, directory: str) -> None:
+        """디렉토리와 하위 항목을 카탈로그에서 제거"""
+        for child in self._dir_children.pop(directory, set()):
+            self._purge_directory(child)
+        for path in self._dir_files.pop(directory, {}):
+            self._drop_entry(path)
+        self.directories.pop(directory, None)
+
+    def _set_entry(self, path: str, entry: Dict[str, Any]) -> None:
+        """항목 저장 (크기나 수정 시각이 바뀌었을 때만 세대 증가)"""
+        self.entries[path] = entry
+        version = self._versions.get(path)
+        if version is not None and version[2] == entry["size"] and version[3] == entry["modified"]:
+            return
+
+        self.generation += 1
+        created = version[1] if version is not None else self.generation
+        # 다시 넣어 변경 세대 오름차순 유지
+        self._versions.pop(path, None)
+        self._versions[path] = (self.generation, created, entry["size"], entry["modified"])
+        self._tombstones.pop(path, None)
+
+    def _drop_entry(self, path: str) -> None:
+        """항목 제거 및 삭제 기록"""
+        self.entries.pop(path, None)
+        if self._versions.pop(path, None) is None:
+            return
+
+        self.generation += 1
+        self._tombstones[path] = self.generation
+        if len(self._tombstones) > MAX_TOMBSTONES:
+            for oldest in list(itertools.islice(self._tombstones, len(self._tombstones) // 2)):
+                self._tombstone_floor = self._tombstones.pop(oldest)
+
+    def _abs(self, directory: str) -> str:
+        return os.path.join(str(self.vault_path), directory) if directory else str(self.vault_path)
+
+    @staticmethod
+    def _normalize(path: str) -> str:
+        path = os.path.normpath(path) if path else ""
+        return "" if path == "." else path
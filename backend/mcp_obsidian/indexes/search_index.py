@@ -0,0 +1,409 @@
+"""
+볼트 역색인
+노트 본문을 다시 읽지 않고 검색할 수 있도록 용어-포스팅 색인을 디스크에 유지합니다.
+"""
+import heapq
+import json
+import math
+import os
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Set, Iterable, Tuple
+from loguru import logger
+
+from .trigram_index import TrigramIndex, tokenize, normalize_text
+from .link_graph import LinkGraph
+from .markdown_tokenizer import MarkdownStructure, tokenize_markdown
+
+
+# 볼트 내부에 색인 파일을 저장하는 디렉토리 이름
+INDEX_DIR_NAME = ".documize"
+
+_indexes: Dict[str, "SearchIndex"] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_search_index(vault_path: Path) -> "SearchIndex":
+    """볼트별 공유 검색 색인 조회 (최초 호출 시 디스크에서 로드)"""
+    key = str(Path(vault_path).absolute())
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = SearchIndex.for_vault(Path(vault_path))
+            _indexes[key] = index
+        return index
+
+
+class SearchIndex:
+    """볼트 역색인 클래스"""
+
+    INDEX_VERSION = 5
+
+    # BM25 파라미터와 필드 가중치
+    BM25_K1 = 1.2
+    BM25_B = 0.75
+    TITLE_BOOST = 3.0
+    HEADING_BOOST = 1.5
+    PARTIAL_MATCH_WEIGHT = 0.5
+    INDEX_FILE_NAME = "search_index.json"
+
+    def __init__(self, index_path: Optional[Path] = None):
+        self.index_path = index_path
+        # 경로 -> 문서 정보 (mtime, size, name, 용어 빈도, 제목/헤딩 용어, 태그, 링크)
+        self.documents: Dict[str, Dict[str, Any]] = {}
+        # 용어 -> {경로: 빈도}
+        self.postings: Dict[str, Dict[str, int]] = {}
+        # 제목(파일명) 용어 -> 경로
+        self.title_postings: Dict[str, Set[str]] = {}
+        self.total_tokens = 0
+        # 본문이 빈 노트 (검색 대상에서 제외)
+        self.empty_documents: Set[str] = set()
+        # 태그/링크 순방향·역방향 인접 그래프
+        self.graph = LinkGraph()
+        # 용어 사전 n-gram 색인 (첫 부분 문자열 조회 시 생성)
+        self._term_grams: Optional[TrigramIndex] = None
+        self._title_grams: Optional[TrigramIndex] = None
+        self.dirty = False
+
+    @classmethod
+    def for_vault(cls, vault_path: Path) -> "SearchIndex":
+        """볼트 경로에 저장된 색인 로드 (없으면 빈 색인)"""
+        index = cls(vault_path / INDEX_DIR_NAME / cls.INDEX_FILE_NAME)
+        index.load()
+        return index
+
+    @classmethod
+    def exists_for(cls, vault_path: Path) -> bool:
+        """볼트에 저장된 색인 파일 존재 여부"""
+        return (vault_path / INDEX_DIR_NAME / cls.INDEX_FILE_NAME).exists()
+
+    @staticmethod
+    def tokenize(text: str) -> List[str]:
+        """정규화된 단어 토큰 추출 (한글/비한글 경계 분리)"""
+        return tokenize(text)
+
+    def load(self) -> bool:
+        """디스크에서 색인 로드"""
+        if not self.index_path or not self.index_path.exists():
+            return False
+
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            if data.get("version") != self.INDEX_VERSION:
+                logger.info("색인 버전이 달라 새로 생성합니다.")
+                return False
+
+            self.documents = {}
+            self.postings = {}
+            self.title_postings = {}
+            self.total_tokens = 0
+            self.empty_documents = set()
+            self.graph = LinkGraph()
+            self._term_grams = None
+            self._title_grams = None
+            for path, document in data.get("documents", {}).items():
+                self._add_postings(path, document)
+            self.dirty = False
+            return True
+        except Exception as e:
+            logger.error(f"색인 로드 실패: {str(e)}")
+            return False
+
+    def save(self) -> bool:
+        """색인을 디스크에 저장 (순방향 색인만 저장하고 역색인은 로드 시 재구성)"""
+        if not self.index_path:
+            return False
+
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.index_path.with_suffix(".tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(
+                    {"version": self.INDEX_VERSION, "documents": self.documents},
+                    f,
+                    ensure_ascii=False,
+                    separators=(",", ":")
+                )
+            os.replace(temp_path, self.index_path)
+            self.dirty = False
+            return True
+        except Exception as e:
+            logger.error(f"색인 저장 실패: {str(e)}")
+            return False
+
+    def is_stale(self, note: Dict[str, Any]) -> bool:
+        """노트의 mtime 또는 크기가 색인 이후 변경되었는지 확인"""
+        document = self.documents.get(note["path"])
+        if document is None:
+            return True
+        return document["mtime"] != note["modified"] or document["size"] != note["size"]
+
+    def sync(self, notes: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        노트 목록과 색인 동기화
+
+        사라진 노트는 색인에서 제거하고, 다시 읽어야 하는 노트 목록을 반환합니다.
+        """
+        stale = []
+        seen = set()
+        for note in notes:
+            seen.add(note["path"])
+            if self.is_stale(note):
+                stale.append(note)
+
+        for path in [path for path in self.documents if path not in seen]:
+            self.remove_document(path)
+
+        return stale
+
+    def add_document(
+        self,
+        note: Dict[str, Any],
+        content: str,
+        structure: Optional[MarkdownStructure] = None
+    ) -> None:
+        """
+        노트 색인 (기존 항목은 교체)
+
+        Args:
+            note: 노트 정보 (path, name, size, modified)
+            content: 노트 본문
+            structure: 토크나이저 결과 (없으면 본문에서 추출) - 헤딩, 태그, 링크
+        """
+        path = note["path"]
+        self.remove_document(path)
+        structure = structure or tokenize_markdown(content)
+
+        tokens = self.tokenize(content)
+        heading_tokens = [token for heading in structure.headings for token in self.tokenize(heading.text)]
+        document = {
+            "name": note["name"],
+            "mtime": note["modified"],
+            "size": note["size"],
+            "length": len(content),
+            "tokens": len(tokens),
+            "terms": dict(Counter(tokens)),
+            "title_terms": dict(Counter(self.tokenize(note["name"]))),
+            "heading_terms": dict(Counter(heading_tokens)),
+            # 코드 블록과 위키링크 헤딩 참조([[노트#헤딩]]) 안의 #은 태그가 아님
+            "tags": sorted({normalize_text(f"#{tag}") for tag in structure.tag_names}),
+            "links": sorted({normalize_text(link) for link in structure.link_texts})
+        }
+        self._add_postings(path, document)
+        self.dirty = True
+
+    def remove_document(self, path: str) -> None:
+        """노트를 색인에서 제거"""
+        document = self.documents.pop(path, None)
+        if document is None:
+            return
+
+        for term in document["terms"]:
+            self._discard(self.postings, term, path, self._term_grams)
+        for term in document["title_terms"]:
+            self._discard(self.title_postings, term, path, self._title_grams)
+        self.total_tokens -= document["tokens"]
+        self.empty_documents.discard(path)
+        self.graph.remove_note(path)
+        self.dirty = True
+
+    def search(self, query: str, search_type: str = "content") -> Set[str]:
+        """
+        색인으로 후보 노트 경로 조회
+
+        Args:
+            query: 검색 쿼리
+            search_type: 검색 타입 (content, title, tag, link)
+
+        Returns:
+            매칭된 노트 경로 집합. needs_verification()이 True이면 후보 집합입니다.
+        """
+        query_lower = normalize_text(query)
+        if search_type == "content":
+            tokens = self.tokenize(query_lower)
+            if not tokens:
+                return self.documents.keys() - self.empty_documents
+
+            candidates = None
+            # 선택도가 높은(긴) 토큰부터 교집합
+            for token in sorted(set(tokens), key=len, reverse=True):
+                matched = self._postings_union(self.postings, self._match_terms(token))
+                candidates = matched if candidates is None else candidates & matched
+                if not candidates:
+                    return set()
+            return candidates - self.empty_documents
+        elif search_type == "title":
+            return {
+                path for path, document in self.documents.items()
+                if document["length"] > 0 and query_lower in normalize_text(document["name"])
+            }
+        elif search_type == "tag":
+            return self._match_vocabulary(self.graph.tag_notes, query_lower) - self.empty_documents
+        elif search_type == "link":
+            return self._match_vocabulary(self.graph.link_notes, query_lower) - self.empty_documents
+
+        return set()
+
+    def needs_verification(self, query: str, search_type: str = "content") -> bool:
+        """
+        색인 결과를 본문으로 재확인해야 하는지 여부
+
+        단일 단어 쿼리의 부분 문자열 검색은 용어 사전만으로 정확히 판정되지만,
+        공백이나 구두점이 포함된 쿼리는 후보 노트 본문에서 확인해야 합니다.
+        """
+        if search_type != "content":
+            return False
+        return self.tokenize(query) != [normalize_text(query)]
+
+    def rank(
+        self,
+        query: str,
+        limit: int = 10,
+        within: Optional[Set[str]] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        BM25 관련도 순위 검색
+
+        모든 쿼리 용어가 본문 또는 제목에 (부분 문자열로) 포함된 노트를 BM25로 점수화하고,
+        제목과 헤딩 용어에는 필드 가중치를 더합니다. 상위 limit개만 힙으로 유지합니다.
+        within이 주어지면 해당 경로 안에서만 순위를 매깁니다.
+
+        Returns:
+            (경로, 점수) 목록 - 점수 내림차순
+        """
+        tokens = list(dict.fromkeys(self.tokenize(query)))
+        if not tokens or limit <= 0 or not self.documents:
+            return []
+
+        candidates: Optional[Set[str]] = None
+        expansions: List[Tuple[str, Set[str]]] = []
+        for token in tokens:
+            terms = self._match_terms(token) | self._match_terms(token, title=True)
+            matched: Set[str] = set()
+            for term in terms:
+                matched.update(self.postings.get(term, ()))
+                matched.update(self.title_postings.get(term, ()))
+            if candidates is None:
+                candidates = matched if within is None else matched & within
+            else:
+                candidates &= matched
+            if not candidates:
+                return []
+            expansions.append((token, terms))
+
+        document_count = len(self.documents)
+        average_length = self.total_tokens / document_count or 1.0
+        idf = {}
+        for _, terms in expansions:
+            for term in terms:
+                df = max(len(self.postings.get(term, ())), len(self.title_postings.get(term, ())))
+                idf[term] = math.log(1 + (document_count - df + 0.5) / (df + 0.5))
+
+        def score(path: str) -> float:
+            document = self.documents[path]
+            norm = self.BM25_K1 * (1 - self.BM25_B + self.BM25_B * document["tokens"] / average_length)
+            total = 0.0
+            for token, terms in expansions:
+                for term in terms:
+                    tf = (
+                        document["terms"].get(term, 0)
+                        + self.TITLE_BOOST * document["title_terms"].get(term, 0)
+                        + self.HEADING_BOOST * document["heading_terms"].get(term, 0)
+                    )
+                    if not tf:
+                        continue
+                    weight = 1.0 if term == token else self.PARTIAL_MATCH_WEIGHT
+                    total += weight * idf[term] * tf * (self.BM25_K1 + 1) / (tf + norm)
+            return total
+
+        scored = ((score(path), path) for path in candidates - self.empty_documents)
+        return [(path, value) for value, path in heapq.nlargest(limit, scored)]
+
+    def estimate(self, query: str) -> int:
+        """
+        내용 검색 결과 크기 추정 (쿼리 계획용)
+
+        포스팅을 합치지 않고 토큰별 매칭 용어의 포스팅 길이 합 중 최솟값을 사용합니다.
+        """
+        tokens = set(self.tokenize(query))
+        if not tokens:
+            return len(self.documents)
+        return min(
+            sum(len(self.postings[term]) for term in self._match_terms(token))
+            for token in tokens
+        )
+
+    def _match_terms(self, fragment: str, title: bool = False) -> Set[str]:
+        """부분 문자열을 포함하는 용어 조회 (n-gram 색인, 짧은 조각은 선형 탐색)"""
+        if title:
+            if self._title_grams is None:
+                self._title_grams = TrigramIndex(self.title_postings)
+            grams, postings = self._title_grams, self.title_postings
+        else:
+            if self._term_grams is None:
+                self._term_grams = TrigramIndex(self.postings)
+            grams, postings = self._term_grams, self.postings
+
+        terms = grams.lookup(fragment)
+        if terms is None:
+            terms = {term for term in postings if fragment in term}
+        return terms
+
+    @staticmethod
+    def _postings_union(postings: Dict[str, Any], keys: Iterable[str]) -> Set[str]:
+        """여러 키의 포스팅 합집합"""
+        matched: Set[str] = set()
+        for key in keys:
+            matched.update(postings.get(key, ()))
+        return matched
+
+    def _match_vocabulary(self, postings: Dict[str, Any], fragment: str) -> Set[str]:
+        """용어 사전에서 부분 문자열이 포함된 항목의 포스팅 합집합"""
+        matched: Set[str] = set()
+        for term, paths in postings.items():
+            if fragment in term:
+                matched.update(paths)
+        return matched
+
+    def _add_postings(self, path: str, document: Dict[str, Any]) -> None:
+        """문서 정보를 역색인에 반영"""
+        self.documents[path] = document
+        for term, count in document["terms"].items():
+            if term not in self.postings:
+                self.postings[term] = {}
+                if self._term_grams is not None:
+                    self._term_grams.add(term)
+            self.postings[term][path] = count
+        for term in document["title_terms"]:
+            if term not in self.title_postings:
+                self.title_postings[term] = set()
+                if self._title_grams is not None:
+                    self._title_grams.add(term)
+            self.title_postings[term].add(path)
+        self.total_tokens += document["tokens"]
+        if document["length"] == 0:
+            self.empty_documents.add(path)
+        self.graph.add_note(path, document["tags"], document["links"])
+
+    @staticmethod
+    def _discard(
+        postings: Dict[str, Any],
+        key: str,
+        path: str,
+        grams: Optional[TrigramIndex] = None
+    ) -> None:
+        """포스팅에서 경로 제거 (비면 키 삭제)"""
+        paths = postings.get(key)
+        if paths is None:
+            return
+        if isinstance(paths, dict):
+            paths.pop(path, None)
+        else:
+            paths.discard(path)
+        if not paths:
+            del postings[key]
+            if grams is not None:
+                grams.discard(key)
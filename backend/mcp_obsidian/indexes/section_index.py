@@ -0,0 +1,75 @@
+"""
+섹션 색인
+헤딩 오프셋으로 각 섹션의 [시작, 끝) 범위를 계산하여
+노트 전체를 다시 만들지 않고 해당 범위만 교체하는 패치를 만듭니다.
+"""
+from typing import List, NamedTuple, Optional
+
+from .markdown_tokenizer import Heading, MarkdownStructure, tokenize_markdown
+
+
+class Section(NamedTuple):
+    level: int
+    title: str
+    start: int  # 헤딩 줄 시작 오프셋
+    body_start: int  # 헤딩 줄 다음 오프셋
+    end: int  # 다음 같은/상위 단계 헤딩 시작 (없으면 문서 끝)
+
+
+class SectionPatch(NamedTuple):
+    """content[start:end]를 replacement로 교체하는 패치"""
+    start: int
+    end: int
+    replacement: str
+
+
+def apply_patch(content: str, patch: SectionPatch) -> str:
+    """패치를 적용한 본문"""
+    return content[:patch.start] + patch.replacement + content[patch.end:]
+
+
+class SectionIndex:
+    """노트 섹션 색인 클래스"""
+
+    def __init__(self, content: str, structure: Optional[MarkdownStructure] = None):
+        structure = structure or tokenize_markdown(content)
+        self.length = len(content)
+        self.ends_with_newline = content.endswith("\n")
+        self.headings: List[Heading] = structure.headings
+        self.sections: List[Section] = []
+
+        # 뒤에서부터 같은/상위 단계 헤딩 위치를 추적하여 한 번에 끝 오프셋 계산
+        next_start_by_level = [self.length] * 7
+        for heading in reversed(self.headings):
+            end = min(next_start_by_level[1:heading.level + 1])
+            self.sections.append(Section(heading.level, heading.text, heading.start, heading.end, end))
+            next_start_by_level[heading.level] = heading.start
+        self.sections.reverse()
+
+    def find(self, title: str, level: Optional[int] = None) -> Optional[Section]:
+        """제목(과 단계)이 일치하는 첫 섹션"""
+        for section in self.sections:
+            if section.title == title and (level is None or section.level == level):
+                return section
+        return None
+
+    def first_heading(self) -> Optional[Section]:
+        return self.sections[0] if self.sections else None
+
+    def own_end(self, section: Section) -> int:
+        """하위 섹션을 뺀 섹션 본문의 끝 (첫 하위 헤딩 시작, 없으면 섹션 끝)"""
+        for heading in self.headings:
+            if section.body_start <= heading.start < section.end:
+                return heading.start
+        return section.end
+
+    def replace_own(self, section: Section, replacement: str) -> SectionPatch:
+        """헤딩과 본문만 교체하고 하위 섹션은 남기는 패치"""
+        return SectionPatch(section.start, self.own_end(section), replacement)
+
+    def insert_at(self, offset: int, text: str) -> SectionPatch:
+        return SectionPatch(offset, offset, text)
+
+    def append(self, text: str) -> SectionPatch:
+        """문서 끝에 추가하는 패치"""
+        return SectionPatch(self.length, self.length, text)
@@ -0,0 +1,247 @@
+"""
+SQLite FTS5 색인
+볼트 옆(.documize/search.db)에 FTS5 전문 검색 데이터베이스를 유지합니다.
+WAL 모드로 색인 갱신 중에도 읽기 연결이 동시에 검색할 수 있습니다.
+"""
+import re
+import sqlite3
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterable, Tuple
+from loguru import logger
+
+from .search_index import INDEX_DIR_NAME
+
+
+QUERY_TERM_PATTERN = re.compile(r'"([^"]+)"|(\S+)')
+
+_sqlite_indexes: Dict[str, "SQLiteIndex"] = {}
+_sqlite_indexes_lock = threading.Lock()
+
+
+def get_sqlite_index(vault_path: Path) -> "SQLiteIndex":
+    """볼트별 공유 SQLite 색인 조회"""
+    key = str(Path(vault_path).absolute())
+    with _sqlite_indexes_lock:
+        index = _sqlite_indexes.get(key)
+        if index is None:
+            index = SQLiteIndex.for_vault(Path(vault_path))
+            _sqlite_indexes[key] = index
+        return index
+
+
+def is_fts5_available() -> bool:
+    """SQLite 빌드의 FTS5 지원 여부"""
+    try:
+        connection = sqlite3.connect(":memory:")
+        try:
+            connection.execute("CREATE VIRTUAL TABLE probe USING fts5(content)")
+            return True
+        finally:
+            connection.close()
+    except sqlite3.Error:
+        return False
+
+
+class SQLiteIndex:
+    """SQLite FTS5 색인 클래스"""
+
+    SCHEMA_VERSION = 1
+    DB_FILE_NAME = "search.db"
+    # 검색 대상 컬럼 (FTS 컬럼 인덱스: path=0, name=1, content=2)
+    COLUMNS = {"content": ("content", 2), "title": ("name", 1)}
+    # bm25 컬럼 가중치 (path, name, content)
+    BM25_WEIGHTS = (0.0, 3.0, 1.0)
+    SNIPPET_TOKENS = 16
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._write_lock = threading.Lock()
+        self._local = threading.local()
+        self._readers: List[sqlite3.Connection] = []
+        self._writer: Optional[sqlite3.Connection] = None
+
+    @classmethod
+    def for_vault(cls, vault_path: Path) -> "SQLiteIndex":
+        return cls(vault_path / INDEX_DIR_NAME / cls.DB_FILE_NAME)
+
+    @classmethod
+    def exists_for(cls, vault_path: Path) -> bool:
+        return (vault_path / INDEX_DIR_NAME / cls.DB_FILE_NAME).exists()
+
+    def sync(self, notes: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        노트 목록과 색인 동기화
+
+        사라진 노트는 삭제하고, mtime 또는 크기가 바뀌어 다시 읽어야 하는 노트 목록을 반환합니다.
+        """
+        indexed = {
+            path: (mtime, size)
+            for path, mtime, size in self._reader().execute("SELECT path, mtime, size FROM notes")
+        }
+        stale = []
+        seen = set()
+        for note in notes:
+            seen.add(note["path"])
+            if indexed.get(note["path"]) != (note["modified"], note["size"]):
+                stale.append(note)
+
+        removed = [path for path in indexed if path not in seen]
+        if removed:
+            self.remove_documents(removed)
+        return stale
+
+    def add_documents(self, documents: Iterable[Tuple[Dict[str, Any], str]]) -> None:
+        """노트 여러 개를 한 트랜잭션으로 색인 (기존 항목은 교체)"""
+        with self._write_lock:
+            connection = self._get_writer()
+            with connection:
+                for note, content in documents:
+                    self._delete(connection, note["path"])
+                    cursor = connection.execute(
+                        "INSERT INTO notes (path, name, mtime, size) VALUES (?, ?, ?, ?)",
+                        (note["path"], note["name"], note["modified"], note["size"])
+                    )
+                    connection.execute(
+                        "INSERT INTO notes_fts (rowid, path, name, content) VALUES (?, ?, ?, ?)",
+                        (
+                            cursor.lastrowid,
+                            note["path"],
+                            unicodedata.normalize("NFC", note["name"]),
+                            unicodedata.normalize("NFC", content)
+                        )
+                    )
+
+    def remove_documents(self, paths: Iterable[str]) -> None:
+        """노트를 색인에서 제거"""
+        with self._write_lock:
+            connection = self._get_writer()
+            with connection:
+                for path in paths:
+                    self._delete(connection, path)
+
+    def search(
+        self,
+        query: str,
+        search_type: str = "content",
+        limit: int = 10,
+        ranked: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        FTS5 검색
+
+        쿼리 단어는 접두사 검색("검색" -> 검색엔진)으로, 따옴표로 묶은 구절은 구절 검색으로
+        처리하며 모든 단어가 포함된 노트만 반환합니다.
+
+        Returns:
+            [{"path", "snippet", "highlight", "score"}] - ranked이면 bm25 점수 순
+        """
+        column, column_index = self.COLUMNS.get(search_type, (None, None))
+        expression = self.build_match_expression(query)
+        if column is None or not expression or limit <= 0:
+            return []
+
+        weights = ", ".join(str(weight) for weight in self.BM25_WEIGHTS)
+        sql = (
+            "SELECT path,"
+            f" snippet(notes_fts, {column_index}, '', '', '…', {self.SNIPPET_TOKENS}),"
+            f" snippet(notes_fts, {column_index}, '**', '**', '…', {self.SNIPPET_TOKENS}),"
+            f" bm25(notes_fts, {weights})"
+            " FROM notes_fts WHERE notes_fts MATCH ?"
+        )
+        if ranked:
+            sql += " ORDER BY 4"
+        sql += " LIMIT ?"
+
+        try:
+            rows = self._reader().execute(sql, (f"{column} : ({expression})", limit)).fetchall()
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5 쿼리 실패 ({query}): {str(e)}")
+            return []
+
+        # bm25()는 관련도가 높을수록 작은(음수) 값을 반환
+        return [
+            {"path": path, "snippet": snippet, "highlight": highlight, "score": -score}
+            for path, snippet, highlight, score in rows
+        ]
+
+    @staticmethod
+    def build_match_expression(query: str) -> str:
+        """사용자 쿼리를 FTS5 MATCH 식으로 변환 (단어는 접두사, 따옴표는 구절)"""
+        terms = []
+        for phrase, word in QUERY_TERM_PATTERN.findall(unicodedata.normalize("NFC", query)):
+            text = (phrase or word).replace('"', '""')
+            if not re.search(r'\w', text):
+                continue
+            terms.append(f'"{text}"' if phrase else f'"{text}"*')
+        return " AND ".join(terms)
+
+    def count(self) -> int:
+        return self._reader().execute("SELECT count(*) FROM notes").fetchone()[0]
+
+    def close(self) -> None:
+        """모든 연결 종료 (다음 사용 시 다시 연결)"""
+        with self._write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            for reader in self._readers:
+                reader.close()
+            self._readers = []
+            self._local = threading.local()
+
+    def _delete(self, connection: sqlite3.Connection, path: str) -> None:
+        row = connection.execute("SELECT id FROM notes WHERE path = ?", (path,)).fetchone()
+        if row is None:
+            return
+        connection.execute("DELETE FROM notes_fts WHERE rowid = ?", row)
+        connection.execute("DELETE FROM notes WHERE id = ?", row)
+
+    def _get_writer(self) -> sqlite3.Connection:
+        if self._writer is None:
+            self._writer = self._connect()
+            self._ensure_schema(self._writer)
+        return self._writer
+
+    def _reader(self) -> sqlite3.Connection:
+        """스레드별 읽기 연결 (WAL 모드에서 쓰기와 동시에 읽기)"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            with self._write_lock:
+                self._get_writer()
+            connection = self._connect()
+            self._local.connection = connection
+            with self._write_lock:
+                self._readers.append(connection)
+        return connection
+
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def _ensure_schema(self, connection: sqlite3.Connection) -> None:
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        if version == self.SCHEMA_VERSION:
+            return
+
+        if version:
+            logger.info("SQLite 색인 스키마가 달라 새로 생성합니다.")
+        with connection:
+            connection.execute("DROP TABLE IF EXISTS notes_fts")
+            connection.execute("DROP TABLE IF EXISTS notes")
+            connection.execute(
+                "CREATE TABLE notes ("
+                "id INTEGER PRIMARY KEY, path TEXT UNIQUE NOT NULL,"
+                " name TEXT, mtime REAL, size INTEGER)"
+            )
+            # 접두사 쿼리용 2/3글자 접두사 색인, 발음 구별 기호 무시
+            connection.execute(
+                "CREATE VIRTUAL TABLE notes_fts USING fts5("
+                "path UNINDEXED, name, content,"
+                " tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+            )
+            connection.execute(f"PRAGMA user_version={self.SCHEMA_VERSION}")
@@ -0,0 +1,103 @@
+"""
+n-gram 부분 문자열 색인
+용어 사전의 부분 문자열 조회를 n-gram 포스팅 교집합과 검증으로 처리합니다.
+한글 음절은 한 글자가 담는 정보가 많아 2-gram, 그 외 문자는 3-gram을 사용합니다.
+"""
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Set
+
+
+HANGUL_SYLLABLE_PATTERN = r'가-힣'
+HANGUL_JAMO_PATTERN = r'ᄀ-ᇿ㄰-㆏'
+
+# \w 연속 구간을 한글/비한글 경계에서 분리 ("API를" -> "api", "를")
+TOKEN_PATTERN = re.compile(
+    rf'[{HANGUL_SYLLABLE_PATTERN}{HANGUL_JAMO_PATTERN}]+'
+    rf'|[^\W{HANGUL_SYLLABLE_PATTERN}{HANGUL_JAMO_PATTERN}]+'
+)
+
+
+def normalize_text(text: str) -> str:
+    """검색용 정규화 (NFC 조합 + 소문자) - NFD로 저장된 한글도 음절 단위로 비교"""
+    return unicodedata.normalize("NFC", text).lower()
+
+
+def tokenize(text: str) -> List[str]:
+    """한글 인식 토큰화 (정규화된 단어를 문자 체계 경계에서 분리)"""
+    return TOKEN_PATTERN.findall(normalize_text(text))
+
+
+def is_hangul_syllable(char: str) -> bool:
+    return '가' <= char <= '힣'
+
+
+def gram_size(char: str) -> int:
+    """해당 문자로 시작하는 n-gram 길이"""
+    return 2 if is_hangul_syllable(char) else 3
+
+
+def extract_grams(text: str) -> Set[str]:
+    """
+    n-gram 추출
+
+    각 위치의 n은 시작 문자로만 결정되므로, 문서와 쿼리에서 같은 부분 문자열은
+    항상 같은 n-gram을 만듭니다.
+    """
+    grams = set()
+    length = len(text)
+    for i, char in enumerate(text):
+        n = gram_size(char)
+        if i + n <= length:
+            grams.add(text[i:i + n])
+    return grams
+
+
+class TrigramIndex:
+    """용어 n-gram 색인 클래스"""
+
+    def __init__(self, terms: Iterable[str] = ()):
+        # n-gram -> 해당 n-gram을 포함하는 용어
+        self.postings: Dict[str, Set[str]] = {}
+        for term in terms:
+            self.add(term)
+
+    def add(self, term: str) -> None:
+        """용어 추가"""
+        for gram in extract_grams(term):
+            self.postings.setdefault(gram, set()).add(term)
+
+    def discard(self, term: str) -> None:
+        """용어 제거"""
+        for gram in extract_grams(term):
+            terms = self.postings.get(gram)
+            if terms is None:
+                continue
+            terms.discard(term)
+            if not terms:
+                del self.postings[gram]
+
+    def lookup(self, fragment: str) -> Optional[Set[str]]:
+        """
+        부분 문자열을 포함하는 용어 조회
+
+        Returns:
+            매칭 용어 집합. 조각이 너무 짧아 n-gram이 없으면 None (호출자가 선형 탐색)
+        """
+        grams = extract_grams(fragment)
+        if not grams:
+            return None
+
+        # 가장 짧은 포스팅부터 교집합
+        posting_lists = sorted((self.postings.get(gram, set()) for gram in grams), key=len)
+        if not posting_lists[0]:
+            return set()
+
+        candidates = set(posting_lists[0])
+        for terms in posting_lists[1:]:
+            candidates &= terms
+            if not candidates:
+                return set()
+
+        # n-gram 교집합은 후보이므로 실제 포함 여부 검증
+        return {term for term in candidates if fragment in term}
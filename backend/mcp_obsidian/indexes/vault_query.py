@@ -0,0 +1,261 @@
+"""
+볼트 쿼리 언어
+`tag:foo path:projects/ modified>2026-01-01 size<10k "exact phrase" -excluded` 형식의
+구조화 쿼리를 파싱하고, 선택도가 높은 색인 조회부터 교집합하는 실행 계획으로 변환합니다.
+"""
+import re
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Set, Tuple, Callable
+
+from .search_index import SearchIndex
+from .link_graph import normalize_tag
+from .trigram_index import normalize_text
+
+
+# 색인으로 조회하는 필드 / 노트 메타데이터로 거르는 필드
+INDEX_FIELDS = {"tag", "link", "content"}
+FILTER_FIELDS = {"path", "title", "ext", "modified", "size"}
+FIELD_ALIASES = {"name": "title", "file": "title", "extension": "ext", "mtime": "modified"}
+COMPARISON_FIELDS = {"modified", "size"}
+
+CLAUSE_PATTERN = re.compile(
+    r'(?P<negated>-)?'
+    r'(?:(?P<field>[A-Za-z]+)(?P<operator>:|>=|<=|>|<|=))?'
+    r'(?:"(?P<phrase>[^"]*)"|(?P<word>\S+))'
+)
+SIZE_PATTERN = re.compile(r'^(\d+(?:\.\d+)?)\s*(b|k|kb|m|mb|g|gb)?$', re.IGNORECASE)
+SIZE_UNITS = {"b": 1, "k": 1024, "kb": 1024, "m": 1024 ** 2, "mb": 1024 ** 2, "g": 1024 ** 3, "gb": 1024 ** 3}
+DATE_FORMATS = ("%Y-%m-%d", "%Y-%m-%dT%H:%M", "%Y-%m-%d %H:%M", "%Y-%m-%dT%H:%M:%S")
+
+
+class VaultQueryError(ValueError):
+    """쿼리 구문 오류"""
+
+
+class QueryClause:
+    """쿼리 조건 하나 (필드, 연산자, 값, 부정 여부)"""
+
+    def __init__(
+        self,
+        field: str,
+        value: str,
+        operator: str = ":",
+        negated: bool = False,
+        phrase: bool = False
+    ):
+        self.field = field
+        self.value = value
+        self.operator = operator
+        self.negated = negated
+        self.phrase = phrase
+
+    def __str__(self) -> str:
+        value = f'"{self.value}"' if self.phrase else self.value
+        prefix = "-" if self.negated else ""
+        if self.field == "content":
+            return f"{prefix}{value}"
+        return f"{prefix}{self.field}{self.operator}{value}"
+
+    __repr__ = __str__
+
+
+class VaultQuery:
+    """파싱된 볼트 쿼리 (모든 조건의 AND)"""
+
+    def __init__(self, clauses: List[QueryClause]):
+        self.clauses = clauses
+
+    @property
+    def text_terms(self) -> List[str]:
+        """본문에서 찾는 긍정 단어/구절 (컨텍스트 추출과 순위용)"""
+        return [
+            clause.value for clause in self.clauses
+            if clause.field == "content" and not clause.negated
+        ]
+
+    def __str__(self) -> str:
+        return " ".join(str(clause) for clause in self.clauses)
+
+
+def parse_vault_query(text: str) -> VaultQuery:
+    """
+    쿼리 문자열 파싱
+
+    알 수 없는 필드(예: URL의 "https:")는 일반 단어로 취급합니다.
+
+    Raises:
+        VaultQueryError: 날짜/크기 값이나 비교 연산자가 올바르지 않은 경우
+    """
+    clauses = []
+    for match in CLAUSE_PATTERN.finditer(text):
+        negated = bool(match.group("negated"))
+        field = (match.group("field") or "").lower()
+        field = FIELD_ALIASES.get(field, field)
+        operator = match.group("operator") or ":"
+        phrase = match.group("phrase") is not None
+        value = match.group("phrase") if phrase else match.group("word")
+
+        if field and field not in INDEX_FIELDS | FILTER_FIELDS:
+            # 필드가 아니면 원문 그대로 본문 단어
+            raw = match.group(0)[1:] if negated else match.group(0)
+            field, operator, value, phrase = "content", ":", raw, False
+        elif not field:
+            field = "content"
+
+        if not value:
+            continue
+        if operator != ":" and field not in COMPARISON_FIELDS:
+            raise VaultQueryError(f"'{field}' 필드는 비교 연산자를 지원하지 않습니다: {match.group(0)}")
+        if field in COMPARISON_FIELDS:
+            _parse_comparison_value(field, value)
+
+        clauses.append(QueryClause(field, value, operator, negated, phrase))
+    return VaultQuery(clauses)
+
+
+def _parse_comparison_value(field: str, value: str) -> Tuple[float, float]:
+    """
+    비교 값을 [시작, 끝) 범위로 변환
+
+    날짜는 지정한 단위 구간(하루 또는 1분/1초)을, 크기는 바이트 값 하나를 범위로 봅니다.
+    """
+    if field == "size":
+        match = SIZE_PATTERN.match(value)
+        if not match:
+            raise VaultQueryError(f"크기 형식이 올바르지 않습니다: {value} (예: 10k, 2mb)")
+        size = float(match.group(1)) * SIZE_UNITS[(match.group(2) or "b").lower()]
+        return size, size + 1
+
+    for date_format in DATE_FORMATS:
+        try:
+            start = datetime.strptime(value, date_format)
+        except ValueError:
+            continue
+        step = timedelta(days=1) if date_format == "%Y-%m-%d" else (
+            timedelta(seconds=1) if date_format.endswith("%S") else timedelta(minutes=1)
+        )
+        return start.timestamp(), (start + step).timestamp()
+    raise VaultQueryError(f"날짜 형식이 올바르지 않습니다: {value} (예: 2026-01-01)")
+
+
+def _comparison_predicate(clause: QueryClause) -> Callable[[Dict[str, Any]], bool]:
+    start, end = _parse_comparison_value(clause.field, clause.value)
+    key = "modified" if clause.field == "modified" else "size"
+    operator = clause.operator
+    if operator == ">":
+        return lambda note: note[key] >= end
+    if operator == ">=":
+        return lambda note: note[key] >= start
+    if operator == "<":
+        return lambda note: note[key] < start
+    if operator == "<=":
+        return lambda note: note[key] < end
+    return lambda note: start <= note[key] < end
+
+
+def _filter_predicate(clause: QueryClause) -> Callable[[Dict[str, Any]], bool]:
+    """메타데이터 필터 조건 (부정 미적용)"""
+    if clause.field in COMPARISON_FIELDS:
+        return _comparison_predicate(clause)
+
+    value = normalize_text(clause.value)
+    if clause.field == "path":
+        value = value.replace("\\", "/")
+        return lambda note: value in normalize_text(note["path"]).replace("\\", "/")
+    if clause.field == "title":
+        return lambda note: value in normalize_text(note["name"])
+    # ext
+    extension = value if value.startswith(".") else f".{value}"
+    return lambda note: note["extension"].lower() == extension
+
+
+class QueryPlan:
+    """쿼리 실행 결과 (후보 경로, 본문 확인 조건, 실행 단계)"""
+
+    def __init__(self, paths: Set[str], content_checks: List[Tuple[str, bool]], steps: List[Dict[str, Any]]):
+        self.paths = paths
+        # (정규화된 본문 문자열, 부정 여부) - 색인만으로 확정할 수 없는 조건
+        self.content_checks = content_checks
+        self.steps = steps
+
+
+class QueryPlanner:
+    """
+    쿼리 실행 계획기
+
+    색인 조건(태그, 링크, 본문 단어)은 예상 결과 크기가 작은 순서로 조회하며 교집합하고,
+    후보가 비면 즉시 중단합니다. 메타데이터 필터는 남은 후보에만 적용하고,
+    색인으로 확정할 수 없는 구절/부정 조건만 본문 확인 대상으로 남깁니다.
+    """
+
+    def __init__(self, index: SearchIndex, notes: List[Dict[str, Any]]):
+        self.index = index
+        self.notes_by_path = {note["path"]: note for note in notes}
+
+    def execute(self, query: VaultQuery) -> QueryPlan:
+        steps: List[Dict[str, Any]] = []
+        content_checks: List[Tuple[str, bool]] = []
+
+        positive = [c for c in query.clauses if c.field in INDEX_FIELDS and not c.negated]
+        estimated = sorted(((self._estimate(c), c) for c in positive), key=lambda item: item[0])
+
+        candidates: Optional[Set[str]] = None
+        for estimate, clause in estimated:
+            paths = self._lookup(clause)
+            candidates = paths if candidates is None else candidates & paths
+            steps.append({"clause": str(clause), "estimate": estimate, "remaining": len(candidates)})
+            if not self._is_exact(clause):
+                content_checks.append((normalize_text(clause.value), False))
+            if not candidates:
+                return QueryPlan(set(), [], steps)
+
+        if candidates is None:
+            candidates = set(self.notes_by_path)
+            steps.append({"clause": "*", "estimate": len(candidates), "remaining": len(candidates)})
+        else:
+            candidates &= self.notes_by_path.keys()
+
+        filters = [
+            (clause, _filter_predicate(clause))
+            for clause in query.clauses if clause.field in FILTER_FIELDS
+        ]
+        for clause, predicate in filters:
+            candidates = {
+                path for path in candidates
+                if predicate(self.notes_by_path[path]) != clause.negated
+            }
+            steps.append({"clause": str(clause), "remaining": len(candidates)})
+            if not candidates:
+                return QueryPlan(set(), [], steps)
+
+        for clause in query.clauses:
+            if clause.field not in INDEX_FIELDS or not clause.negated:
+                continue
+            if self._is_exact(clause):
+                candidates -= self._lookup(clause)
+                steps.append({"clause": str(clause), "remaining": len(candidates)})
+            else:
+                content_checks.append((normalize_text(clause.value), True))
+
+        return QueryPlan(candidates, content_checks, steps)
+
+    def _estimate(self, clause: QueryClause) -> int:
+        graph = self.index.graph
+        if clause.field == "tag":
+            return len(graph.tag_notes.get(normalize_tag(clause.value), ()))
+        if clause.field == "link":
+            return len(graph.notes_linking_to(clause.value))
+        return self.index.estimate(clause.value)
+
+    def _lookup(self, clause: QueryClause) -> Set[str]:
+        if clause.field == "tag":
+            return self.index.graph.notes_with_tag(clause.value)
+        if clause.field == "link":
+            return self.index.graph.notes_linking_to(clause.value)
+        return set(self.index.search(clause.value, "content"))
+
+    def _is_exact(self, clause: QueryClause) -> bool:
+        """색인 조회만으로 조건이 확정되는지 여부 (단일 단어 부분 문자열은 용어 사전으로 확정)"""
+        if clause.field != "content":
+            return True
+        return not self.index.needs_verification(clause.value)
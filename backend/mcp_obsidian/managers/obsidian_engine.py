@@ -3,7 +3,8 @@
 MCPEngine을 상속받아 옵시디언 볼트 조작 기능을 추가합니다.
 """
 import asyncio
-from typing import Dict, Any, Optional, List
+from contextlib import aclosing
+from typing import Dict, Any, Optional, List, AsyncIterator
 from pathlib import Path
 from loguru import logger
 
@@ -17,8 +18,11 @@ from mcp_server.managers.mcp_engine import MCPEngine
 from mcp_server.models.enums import OutputFormat, AIProvider
 
 from ..tools.vault_manager import VaultManager
-from ..tools.note_processor import NoteProcessor
+from ..indexes.vault_query import parse_vault_query
+from ..indexes.note_cache import ParsedNote
+from ..tools.backup_manager import BackupManager
 from ..config.obsidian_settings import ObsidianSettings
+from .vault_watcher import VaultWatcher
 
 
 class ObsidianEngine(MCPEngine):
@@ -26,9 +30,41 @@ class ObsidianEngine(MCPEngine):
     
     def __init__(self, vault_path: Optional[str] = None):
         super().__init__()
-        self.vault_manager = VaultManager(vault_path)
-        self.note_processor = NoteProcessor()
         self.obsidian_settings = ObsidianSettings()
+        self.vault_manager = VaultManager(vault_path, self.obsidian_settings)
+        self.note_processor = self.vault_manager.note_processor
+        self.backup_manager = BackupManager(self.vault_manager, self.obsidian_settings)
+        
+        watcher_settings = self.obsidian_settings.get_watcher_settings()
+        self.vault_watcher = VaultWatcher(
+            self.vault_manager,
+            debounce_ms=watcher_settings.get("debounce_ms", 500),
+            poll_interval=watcher_settings.get("poll_interval", 5.0),
+            force_polling=watcher_settings.get("force_polling", False)
+        )
+    
+    async def start_vault_watcher(self) -> None:
+        """볼트 감시자 시작 (설정에서 비활성화된 경우 무시)"""
+        if self.obsidian_settings.get_setting("watcher.enabled", True):
+            await self.vault_watcher.start()
+    
+    async def stop_vault_watcher(self) -> None:
+        """볼트 감시자 종료 및 보류 중인 색인 저장"""
+        await self.vault_watcher.stop()
+        await self.vault_manager.flush_indexes()
+    
+    async def start_backup_scheduler(self) -> None:
+        """자동 백업 시작 (auto_backup 설정이 꺼져 있으면 무시)"""
+        await self.backup_manager.start()
+    
+    async def stop_backup_scheduler(self) -> None:
+        """자동 백업 종료"""
+        await self.backup_manager.stop()
+    
+    def set_vault_path(self, vault_path: str) -> None:
+        """볼트 경로 설정 후 감시 대상 교체"""
+        self.vault_manager.set_vault_path(vault_path)
+        self.vault_watcher.restart()
     
     async def generate_response(
         self,
@@ -38,7 +74,9 @@ class ObsidianEngine(MCPEngine):
         model: str = "gpt-4",
         api_key: Optional[str] = None,
         language: Optional[str] = None,
-        vault_context: Optional[Dict[str, Any]] = None
+        vault_context: Optional[Dict[str, Any]] = None,
+        bypass_cache: bool = False,
+        refresh_cache: bool = False
     ) -> Dict[str, Any]:
         """
         옵시디언 컨텍스트를 포함한 AI 응답 생성
@@ -51,6 +89,8 @@ class ObsidianEngine(MCPEngine):
             api_key: API 키
             language: 프로그래밍 언어
             vault_context: 볼트 컨텍스트 정보
+            bypass_cache: 응답 캐시 사용 안 함
+            refresh_cache: 응답 캐시를 새 응답으로 갱신
         
         Returns:
             AI 응답 딕셔너리
@@ -69,7 +109,9 @@ class ObsidianEngine(MCPEngine):
                 provider=provider,
                 model=model,
                 api_key=api_key,
-                language=language
+                language=language,
+                bypass_cache=bypass_cache,
+                refresh_cache=refresh_cache
             )
             
             return result
@@ -83,6 +125,35 @@ class ObsidianEngine(MCPEngine):
                 "output_format": output_format.value
             }
     
+    async def stream_response(
+        self,
+        prompt: str,
+        output_format: OutputFormat,
+        provider: AIProvider = AIProvider.PERPLEXITY,
+        model: str = "gpt-4",
+        api_key: Optional[str] = None,
+        language: Optional[str] = None,
+        vault_context: Optional[Dict[str, Any]] = None,
+        bypass_cache: bool = False,
+        refresh_cache: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """옵시디언 컨텍스트를 포함한 AI 응답 스트리밍 (delta/done/error 이벤트)"""
+        if vault_context:
+            prompt = self._enhance_prompt_with_vault_context(prompt, vault_context)
+        
+        async with aclosing(super().stream_response(
+            prompt=prompt,
+            output_format=output_format,
+            provider=provider,
+            model=model,
+            api_key=api_key,
+            language=language,
+            bypass_cache=bypass_cache,
+            refresh_cache=refresh_cache
+        )) as events:
+            async for event in events:
+                yield event
+    
     def _enhance_prompt_with_vault_context(self, prompt: str, vault_context: Dict[str, Any]) -> str:
         """볼트 컨텍스트로 프롬프트 강화"""
         context_info = []
@@ -114,7 +185,8 @@ class ObsidianEngine(MCPEngine):
         operation: str,
         prompt: str,
         provider: AIProvider = AIProvider.PERPLEXITY,
-        api_key: Optional[str] = None
+        api_key: Optional[str] = None,
+        expected_hash: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         노트를 AI로 처리
@@ -125,15 +197,29 @@ class ObsidianEngine(MCPEngine):
             prompt: AI 프롬프트
             provider: AI 제공자
             api_key: API 키
+            expected_hash: 호출자가 본 노트 해시 (If-Match) - 다르면 AI 호출 전에 실패
         
         Returns:
             처리 결과
         """
         try:
-            # 노트 읽기
-            note_content = await self.vault_manager.read_note(note_path)
+            # 너무 큰 노트는 읽기 전에 거절 (max_note_size)
+            too_large = self._check_note_size(await self.vault_manager.get_note_size(note_path))
+            if too_large:
+                return too_large
+            
+            # 노트 읽기 (변경되지 않은 노트는 캐시에서)
+            note = await self.vault_manager.read_parsed_note(note_path)
+            note_content = note.content if note is not None else None
             if not note_content:
                 return {"success": False, "error": "노트를 읽을 수 없습니다."}
+            if expected_hash is not None and expected_hash != note.content_hash:
+                return {
+                    "success": False,
+                    "conflict": True,
+                    "hash": note.content_hash,
+                    "error": "노트가 다른 곳에서 변경되었습니다."
+                }
             
             # 작업별 프롬프트 생성
             operation_prompt = self._create_operation_prompt(operation, prompt, note_content)
@@ -147,19 +233,21 @@ class ObsidianEngine(MCPEngine):
             )
             
             if result.get("success"):
-                # 결과를 노트에 적용
-                processed_content = self.note_processor.apply_ai_result(
-                    note_content, result["content"], operation
-                )
+                # 편집 전 백업 (create_backup_before_edit)
+                await self.backup_manager.backup_before_edit(note_path)
                 
-                # 노트 저장
-                await self.vault_manager.write_note(note_path, processed_content)
+                # 결과를 노트에 적용 (바뀌는 섹션 범위만 다시 씀)
+                saved = await self._apply_ai_result_to_note(note_path, note, result["content"], operation)
+                if not saved["success"]:
+                    return {**saved, "ai_result": result["content"]}
                 
                 return {
                     "success": True,
                     "operation": operation,
                     "note_path": note_path,
-                    "ai_result": result["content"]
+                    "ai_result": result["content"],
+                    "written": saved["written"],
+                    "hash": saved.get("hash")
                 }
             else:
                 return result
@@ -168,6 +256,52 @@ class ObsidianEngine(MCPEngine):
             logger.error(f"노트 AI 처리 실패: {str(e)}")
             return {"success": False, "error": str(e)}
     
+    async def _apply_ai_result_to_note(
+        self,
+        note_path: str,
+        note: ParsedNote,
+        ai_result: str,
+        operation: str
+    ) -> Dict[str, Any]:
+        """
+        AI 결과 저장 (읽은 뒤 노트가 바뀌었으면 conflict_resolution에 따라 처리)
+        
+        prompt는 충돌을 반환하고, skip은 쓰지 않고 성공으로 처리하며,
+        auto는 최신 본문을 다시 읽어 결과를 한 번 더 적용합니다.
+        """
+        patch = self.note_processor.plan_ai_result(note.content, ai_result, operation, note.structure)
+        saved = await self.vault_manager.patch_note(note_path, note, patch)
+        if not saved.get("conflict"):
+            return saved
+        
+        resolution = self.vault_manager.conflict_resolution
+        if resolution == "skip":
+            return {**saved, "success": True, "skipped": True}
+        if resolution != "auto":
+            return saved
+        
+        latest = await self.vault_manager.read_parsed_note(note_path)
+        if latest is None:
+            return {"success": False, "written": False, "error": "노트를 읽을 수 없습니다."}
+        too_large = self._check_note_size(latest.size)
+        if too_large:
+            return {**too_large, "written": False}
+        patch = self.note_processor.plan_ai_result(latest.content, ai_result, operation, latest.structure)
+        return await self.vault_manager.patch_note(note_path, latest, patch)
+    
+    def _check_note_size(self, size: Optional[int]) -> Optional[Dict[str, Any]]:
+        """노트 크기가 max_note_size를 넘으면 실패 결과, 아니면 None"""
+        max_note_size = self.vault_manager.max_note_size
+        if size is None or not max_note_size or size <= max_note_size:
+            return None
+        return {
+            "success": False,
+            "too_large": True,
+            "size": size,
+            "max_note_size": max_note_size,
+            "error": f"노트가 너무 큽니다 ({size} 바이트, 최대 {max_note_size} 바이트)."
+        }
+    
     def _create_operation_prompt(self, operation: str, user_prompt: str, note_content: str) -> str:
         """작업별 프롬프트 생성"""
         operation_templates = {
@@ -184,21 +318,145 @@ class ObsidianEngine(MCPEngine):
         self,
         query: str,
         search_type: str = "content",
-        limit: int = 10
+        limit: int = 10,
+        ranked: bool = False
     ) -> Dict[str, Any]:
-        """볼트 검색"""
+        """
+        볼트 검색 (ranked=True면 BM25 관련도 순)
+        
+        search_type이 "query"일 때만 쿼리 언어(tag:, link:, path:, title:, ext:, modified>, size<,
+        "구절", -제외)로 구조화 검색하고, "content"는 입력 그대로의 부분 문자열 검색입니다.
+        """
         try:
-            results = await self.vault_manager.search_notes(query, search_type, limit)
+            search_type = self._resolve_search_type(query, search_type)
+            results = await self.vault_manager.search_notes(query, search_type, limit, ranked)
             return {
                 "success": True,
                 "query": query,
                 "search_type": search_type,
+                "ranked": ranked,
                 "results": results
             }
         except Exception as e:
             logger.error(f"볼트 검색 실패: {str(e)}")
             return {"success": False, "error": str(e)}
     
+    async def stream_search_vault(
+        self,
+        query: str,
+        search_type: str = "content",
+        limit: int = 10,
+        ranked: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        볼트 검색 스트리밍
+        
+        검색 결과를 찾는 즉시 {"type": "result"} 이벤트로 내보내고,
+        마지막에 {"type": "done"} 또는 {"type": "error"} 이벤트를 보냅니다.
+        """
+        count = 0
+        try:
+            search_type = self._resolve_search_type(query, search_type)
+            async with aclosing(self.vault_manager.iter_search_notes(query, search_type, limit, ranked)) as results:
+                async for result in results:
+                    count += 1
+                    yield {"type": "result", "result": result}
+            yield {"type": "done", "query": query, "search_type": search_type, "count": count}
+        except Exception as e:
+            logger.error(f"볼트 검색 스트리밍 실패: {str(e)}")
+            yield {"type": "error", "error": str(e)}
+    
+    @staticmethod
+    def _resolve_search_type(query: str, search_type: str) -> str:
+        """쿼리 언어 검색이면 미리 파싱하여 구문 오류를 VaultQueryError로 전달"""
+        if search_type == "query":
+            parse_vault_query(query)
+        return search_type
+    
+    async def get_backlinks(self, note_path: str) -> Dict[str, Any]:
+        """노트 백링크 조회"""
+        try:
+            result = await self.vault_manager.get_backlinks(note_path)
+            if result is None:
+                return {"success": False, "error": "볼트 밖의 경로입니다."}
+            return {"success": True, **result}
+        except Exception as e:
+            logger.error(f"백링크 조회 실패: {str(e)}")
+            return {"success": False, "error": str(e)}
+    
+    async def list_tags(self) -> Dict[str, Any]:
+        """태그 목록과 태그별 노트 수 조회"""
+        try:
+            tags = await self.vault_manager.list_tags()
+            return {"success": True, "total": len(tags), "tags": tags}
+        except Exception as e:
+            logger.error(f"태그 목록 조회 실패: {str(e)}")
+            return {"success": False, "error": str(e)}
+    
+    async def get_notes_by_tag(self, tag: str) -> Dict[str, Any]:
+        """태그별 노트 조회"""
+        try:
+            notes = await self.vault_manager.get_notes_by_tag(tag)
+            return {"success": True, "tag": tag, "count": len(notes), "notes": notes}
+        except Exception as e:
+            logger.error(f"태그별 노트 조회 실패: {str(e)}")
+            return {"success": False, "error": str(e)}
+    
+    async def validate_note(self, note_path: str) -> Dict[str, Any]:
+        """노트 구조 검증 (캐시된 파싱 결과 사용)"""
+        try:
+            note = await self.vault_manager.read_parsed_note(note_path)
+            if note is None:
+                return {"success": False, "error": "노트를 읽을 수 없습니다."}
+            result = self.note_processor.validate_note_structure(note.content, note.structure)
+            return {"success": True, "note_path": note_path, **result}
+        except Exception as e:
+            logger.error(f"노트 구조 검증 실패: {str(e)}")
+            return {"success": False, "error": str(e)}
+    
+    async def create_backup(self) -> Dict[str, Any]:
+        """수동 증분 스냅샷 생성"""
+        return await self.backup_manager.create_snapshot(reason="manual")
+    
+    async def list_backups(self) -> Dict[str, Any]:
+        """스냅샷 목록 조회"""
+        try:
+            snapshots = await self.backup_manager.list_snapshots()
+            return {"success": True, "total": len(snapshots), "snapshots": snapshots}
+        except Exception as e:
+            logger.error(f"스냅샷 목록 조회 실패: {str(e)}")
+            return {"success": False, "error": str(e)}
+    
+    async def read_backup_note(self, snapshot_id: int, note_path: str) -> Dict[str, Any]:
+        """스냅샷 시점의 노트 조회"""
+        try:
+            content = await self.backup_manager.read_snapshot_note(snapshot_id, note_path)
+            if content is None:
+                return {"success": False, "error": "스냅샷에 해당 노트가 없습니다."}
+            return {"success": True, "snapshot_id": snapshot_id, "note_path": note_path, "content": content}
+        except Exception as e:
+            logger.error(f"스냅샷 노트 조회 실패: {str(e)}")
+            return {"success": False, "error": str(e)}
+    
+    async def restore_backup_note(self, snapshot_id: int, note_path: str) -> Dict[str, Any]:
+        """스냅샷 시점의 내용으로 노트 복원"""
+        return await self.backup_manager.restore_note(snapshot_id, note_path)
+    
+    async def get_changes(self, since: int = 0, limit: int = 1000) -> Dict[str, Any]:
+        """순번 since 이후의 볼트 변경 조회"""
+        try:
+            if self.vault_manager.vault_path is None:
+                return {"success": False, "error": "볼트 경로가 설정되지 않았습니다."}
+            result = await self.vault_manager.get_changes(since, limit)
+            return {"success": True, **result}
+        except Exception as e:
+            logger.error(f"변경 조회 실패: {str(e)}")
+            return {"success": False, "error": str(e)}
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """노트 캐시 적중/미스 통계"""
+        return {"success": True, "note_cache": self.vault_manager.note_cache.stats()}
+    
     async def get_vault_structure(self) -> Dict[str, Any]:
         """볼트 구조 조회"""
         try:
@@ -210,3 +468,22 @@ class ObsidianEngine(MCPEngine):
         except Exception as e:
             logger.error(f"볼트 구조 조회 실패: {str(e)}")
             return {"success": False, "error": str(e)}
+    
+    async def get_vault_structure_etag(self) -> Optional[str]:
+        """볼트 구조 ETag (카탈로그 식별자와 세대, 볼트가 없으면 None)"""
+        generation = await self.vault_manager.get_vault_generation()
+        if generation is None:
+            return None
+        epoch, number = generation
+        return f'"{epoch}-{number}"'
+    
+    async def get_vault_structure_delta(self, since: int, epoch: Optional[str] = None) -> Dict[str, Any]:
+        """세대 since 이후 볼트 구조 변경분 조회"""
+        try:
+            delta = await self.vault_manager.get_vault_structure_delta(since, epoch)
+            if "error" in delta:
+                return {"success": False, "error": delta["error"]}
+            return {"success": True, **delta}
+        except Exception as e:
+            logger.error(f"볼트 구조 변경분 조회 실패: {str(e)}")
+            return {"success": False, "error": str(e)}
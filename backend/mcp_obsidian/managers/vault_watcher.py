@@ -0,0 +1,162 @@
+"""
+볼트 감시자
+옵시디언 등 외부 프로그램의 파일 변경을 감지하여 카탈로그와 검색 색인을 갱신합니다.
+"""
+import asyncio
+import os
+from pathlib import Path
+from typing import Optional, Set
+from loguru import logger
+
+from ..indexes.note_catalog import get_note_catalog
+from ..indexes.search_index import INDEX_DIR_NAME
+
+try:
+    # inotify(리눅스) 등 OS 네이티브 감시 (uvicorn[standard] 의존성에 포함)
+    from watchfiles import awatch, DefaultFilter
+except ImportError:
+    awatch = None
+    DefaultFilter = None
+
+
+class VaultWatcher:
+    """볼트 파일 시스템 감시자"""
+
+    def __init__(
+        self,
+        vault_manager,
+        debounce_ms: int = 500,
+        poll_interval: float = 5.0,
+        force_polling: bool = False
+    ):
+        self.vault_manager = vault_manager
+        self.debounce_ms = debounce_ms
+        self.poll_interval = poll_interval
+        self.force_polling = force_polling or awatch is None
+        self._task: Optional[asyncio.Task] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self._restart_event: Optional[asyncio.Event] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def mode(self) -> str:
+        return "polling" if self.force_polling else "native"
+
+    async def start(self) -> None:
+        """감시 시작"""
+        if self.running:
+            return
+
+        self._stop_event = asyncio.Event()
+        self._restart_event = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"볼트 감시자 시작 ({self.mode})")
+
+    async def stop(self) -> None:
+        """감시 종료"""
+        if not self.running:
+            return
+
+        self._stop_event.set()
+        self._restart_event.set()
+        try:
+            await asyncio.wait_for(self._task, timeout=5.0)
+        except asyncio.TimeoutError:
+            self._task.cancel()
+        except Exception as e:
+            logger.error(f"볼트 감시자 종료 실패: {str(e)}")
+        self._task = None
+        logger.info("볼트 감시자 종료")
+
+    def restart(self) -> None:
+        """볼트 경로 변경 시 감시 대상 재설정"""
+        if self.running:
+            self._restart_event.set()
+
+    async def _run(self) -> None:
+        """감시 루프 - 볼트 경로가 바뀌면 감시 대상을 교체"""
+        while not self._stop_event.is_set():
+            self._restart_event.clear()
+            vault_path = self.vault_manager.vault_path
+
+            try:
+                if not vault_path or not vault_path.exists():
+                    # 볼트 경로가 설정될 때까지 대기
+                    await self._wait_restart(None)
+                else:
+                    catalog = get_note_catalog(vault_path, self.vault_manager.supported_extensions)
+                    catalog.attach_watcher()
+                    try:
+                        if self.force_polling:
+                            await self._watch_polling(vault_path)
+                        else:
+                            await self._watch_native(vault_path)
+                    finally:
+                        catalog.detach_watcher()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"볼트 감시 중 오류: {str(e)}")
+                await self._wait_restart(self.poll_interval)
+
+    async def _watch_native(self, vault_path: Path) -> None:
+        """OS 네이티브 이벤트 감시 (디바운스된 이벤트 묶음 단위로 처리)"""
+        watch_filter = _VaultFilter(self.vault_manager.supported_extensions)
+
+        async for changes in awatch(
+            vault_path,
+            watch_filter=watch_filter,
+            debounce=self.debounce_ms,
+            stop_event=self._restart_event
+        ):
+            # 같은 경로의 연속 이벤트는 하나로 합침 (이름 변경은 삭제+추가로 전달됨)
+            paths: Set[str] = {path for _, path in changes}
+            await self._dispatch(paths)
+            if self._stop_event.is_set():
+                break
+
+    async def _watch_polling(self, vault_path: Path) -> None:
+        """주기적 폴링 감시"""
+        while not self._restart_event.is_set():
+            await self._wait_restart(self.poll_interval)
+            if self._restart_event.is_set():
+                break
+            try:
+                await self.vault_manager.poll_file_changes()
+            except Exception as e:
+                logger.error(f"볼트 폴링 실패: {str(e)}")
+
+    async def _dispatch(self, paths: Set[str]) -> None:
+        """변경 경로를 볼트 관리자에 전달"""
+        try:
+            await self.vault_manager.apply_file_changes(paths)
+        except Exception as e:
+            logger.error(f"볼트 변경 반영 실패: {str(e)}")
+
+    async def _wait_restart(self, timeout: Optional[float]) -> None:
+        try:
+            await asyncio.wait_for(self._restart_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+if DefaultFilter is not None:
+    class _VaultFilter(DefaultFilter):
+        """색인 디렉토리와 지원하지 않는 확장자를 제외하는 필터"""
+
+        def __init__(self, supported_extensions):
+            super().__init__()
+            self.supported_extensions = set(supported_extensions)
+
+        def __call__(self, change, path: str) -> bool:
+            if not super().__call__(change, path):
+                return False
+            parts = Path(path).parts
+            if INDEX_DIR_NAME in parts:
+                return False
+            extension = os.path.splitext(path)[1]
+            # 확장자가 없는 경로는 디렉토리일 수 있으므로 통과
+            return not extension or extension in self.supported_extensions
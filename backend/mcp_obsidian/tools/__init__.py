@@ -3,7 +3,12 @@ MCP Obsidian Tools
 옵시디언 볼트 조작 도구들
 """
 
-from .vault_manager import VaultManager
+from .vault_manager import VaultManager, write_text_atomic
 from .note_processor import NoteProcessor
+from .search_backends import SearchBackend, SEARCH_BACKENDS, create_search_backend
+from .backup_manager import BackupManager, SnapshotStore
 
-__all__ = ["VaultManager", "NoteProcessor"]
+__all__ = [
+    "VaultManager", "write_text_atomic", "NoteProcessor", "SearchBackend", "SEARCH_BACKENDS", "create_search_backend",
+    "BackupManager", "SnapshotStore"
+]
@@ -0,0 +1,416 @@
+"""
+볼트 백업 관리자
+내용 주소 기반 스냅샷 저장소로 볼트를 증분 백업합니다.
+같은 내용의 파일은 blob 하나를 공유하고, 스냅샷에는 바뀐 파일만 기록합니다.
+"""
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterable
+from loguru import logger
+
+from ..indexes.search_index import INDEX_DIR_NAME
+from ..config.obsidian_settings import ObsidianSettings
+
+
+BACKUP_DIR_NAME = "backups"
+COMPRESS_LEVEL = 6
+
+
+class SnapshotStore:
+    """
+    내용 주소 기반 스냅샷 저장소
+
+    blob은 원본 바이트의 SHA-256으로 objects/에 gzip 압축하여 한 번만 저장하고,
+    스냅샷 매니페스트(snapshots/<번호>.json)에는 직전 스냅샷 대비 바뀐 파일과 삭제된 파일만 기록합니다.
+    정리(prune) 시 가장 오래 남는 스냅샷을 전체 목록(full)으로 다시 써서 이전 기록 없이 복원할 수 있게 합니다.
+    """
+
+    def __init__(self, vault_path: Path):
+        self.vault_path = Path(vault_path)
+        self.root = self.vault_path / INDEX_DIR_NAME / BACKUP_DIR_NAME
+        self.objects_dir = self.root / "objects"
+        self.snapshots_dir = self.root / "snapshots"
+        self.manifests: List[Dict[str, Any]] = []
+        # 마지막 스냅샷 기준 파일 상태: 경로 -> [해시, 크기, mtime]
+        self.state: Dict[str, List[Any]] = {}
+        self.loaded = False
+        self._lock = threading.Lock()
+
+    def snapshot(
+        self,
+        notes: Iterable[Dict[str, Any]],
+        paths: Optional[Iterable[str]] = None,
+        reason: str = "manual"
+    ) -> Optional[Dict[str, Any]]:
+        """
+        증분 스냅샷 생성
+
+        Args:
+            notes: 현재 볼트 노트 목록 (카탈로그 형식) - 크기/mtime이 같은 파일은 읽지 않음
+            paths: 지정하면 해당 파일만 확인 (편집 전 백업 등) - notes 대신 실제 파일을 읽어 해시로 비교
+            reason: 스냅샷 사유
+
+        Returns:
+            스냅샷 요약 (바뀐 파일이 없으면 None)
+        """
+        with self._lock:
+            self._load()
+            if paths is None:
+                current = {note["path"]: note for note in notes}
+                targets = list(current)
+            else:
+                # 현재 바이트를 보호하는 백업이므로 카탈로그 메타데이터를 믿지 않고 파일을 직접 확인
+                targets = list(dict.fromkeys(paths))
+                current = {path: None for path in targets if (self.vault_path / path).is_file()}
+
+            changed: Dict[str, List[Any]] = {}
+            stored_bytes = 0
+            for path in targets:
+                if path not in current:
+                    continue
+                note = current[path]
+                previous = self.state.get(path)
+                if (
+                    note is not None
+                    and previous is not None
+                    and previous[1] == note["size"]
+                    and previous[2] == note["modified"]
+                ):
+                    continue
+                record, written = self._store_file(path)
+                if record is None:
+                    continue
+                if previous is not None and previous[0] == record[0]:
+                    # 내용이 같으면 mtime만 갱신
+                    self.state[path] = record
+                    continue
+                changed[path] = record
+                stored_bytes += written
+
+            candidates = self.state.keys() if paths is None else [path for path in paths if path in self.state]
+            removed = [path for path in candidates if path not in current and path not in changed]
+
+            if not changed and not removed:
+                return None
+
+            sequence = self.manifests[-1]["id"] + 1 if self.manifests else 1
+            manifest = {
+                "id": sequence,
+                "created": time.time(),
+                "reason": reason,
+                "full": not self.manifests,
+                "files": changed,
+                "removed": removed
+            }
+            self._write_json(self._manifest_path(sequence), manifest)
+            self.manifests.append(manifest)
+            self.state.update(changed)
+            for path in removed:
+                self.state.pop(path, None)
+
+            logger.info(f"스냅샷 {sequence} 생성 ({reason}): 변경 {len(changed)}개, 삭제 {len(removed)}개")
+            return {**self._summary(manifest), "stored_bytes": stored_bytes}
+
+    def list_snapshots(self) -> List[Dict[str, Any]]:
+        """스냅샷 목록 (최신순)"""
+        with self._lock:
+            self._load()
+            return [self._summary(manifest) for manifest in reversed(self.manifests)]
+
+    def files_at(self, snapshot_id: int) -> Optional[Dict[str, List[Any]]]:
+        """스냅샷 시점의 전체 파일 목록 (경로 -> [해시, 크기, mtime])"""
+        with self._lock:
+            self._load()
+            return self._state_at(snapshot_id)
+
+    def read_file(self, snapshot_id: int, path: str) -> Optional[bytes]:
+        """스냅샷 시점의 파일 내용 (없으면 None)"""
+        with self._lock:
+            self._load()
+            for manifest in reversed(self.manifests):
+                if manifest["id"] > snapshot_id:
+                    continue
+                if path in manifest["files"]:
+                    return self._read_blob(manifest["files"][path][0])
+                if path in manifest["removed"] or manifest["full"]:
+                    return None
+            return None
+
+    def prune(self, keep: int) -> int:
+        """
+        최근 keep개 스냅샷만 남기고 정리
+
+        남는 가장 오래된 스냅샷을 전체 목록으로 다시 쓰고, 어떤 스냅샷도 참조하지 않는 blob을 삭제합니다.
+
+        Returns:
+            삭제한 스냅샷 수
+        """
+        with self._lock:
+            self._load()
+            if keep <= 0 or len(self.manifests) <= keep:
+                return 0
+
+            base = self.manifests[-keep]
+            base_files = self._state_at(base["id"])
+            rebased = {**base, "full": True, "files": base_files, "removed": []}
+            self._write_json(self._manifest_path(base["id"]), rebased)
+
+            dropped = self.manifests[:-keep]
+            self.manifests = [rebased] + self.manifests[-keep + 1:] if keep > 1 else [rebased]
+            for manifest in dropped:
+                self._manifest_path(manifest["id"]).unlink(missing_ok=True)
+
+            referenced = {record[0] for manifest in self.manifests for record in manifest["files"].values()}
+            removed_blobs = 0
+            if self.objects_dir.exists():
+                for prefix_dir in self.objects_dir.iterdir():
+                    for blob in prefix_dir.iterdir():
+                        if blob.name.split(".", 1)[0] not in referenced:
+                            blob.unlink(missing_ok=True)
+                            removed_blobs += 1
+
+            logger.info(f"스냅샷 정리: {len(dropped)}개 스냅샷, {removed_blobs}개 blob 삭제")
+            return len(dropped)
+
+    def _load(self) -> None:
+        """매니페스트를 읽어 마지막 상태 재구성 (최초 1회)"""
+        if self.loaded:
+            return
+
+        manifests = []
+        if self.snapshots_dir.exists():
+            for manifest_path in sorted(self.snapshots_dir.glob("*.json")):
+                try:
+                    with open(manifest_path, 'r', encoding='utf-8') as f:
+                        manifests.append(json.load(f))
+                except Exception as e:
+                    logger.warning(f"스냅샷 매니페스트 로드 실패 ({manifest_path}): {str(e)}")
+        manifests.sort(key=lambda manifest: manifest["id"])
+        self.manifests = manifests
+        self.state = self._state_at(manifests[-1]["id"]) if manifests else {}
+        self.loaded = True
+
+    def _state_at(self, snapshot_id: int) -> Optional[Dict[str, List[Any]]]:
+        """마지막 전체 스냅샷부터 snapshot_id까지 변경분을 적용한 파일 목록"""
+        chain = [manifest for manifest in self.manifests if manifest["id"] <= snapshot_id]
+        if not chain or chain[-1]["id"] != snapshot_id:
+            return None
+
+        start = 0
+        for index in range(len(chain) - 1, -1, -1):
+            if chain[index]["full"]:
+                start = index
+                break
+
+        files: Dict[str, List[Any]] = {}
+        for manifest in chain[start:]:
+            files.update(manifest["files"])
+            for path in manifest["removed"]:
+                files.pop(path, None)
+        return files
+
+    def _store_file(self, path: str) -> tuple:
+        """파일 내용을 blob으로 저장 (이미 있으면 재사용)"""
+        full_path = self.vault_path / path
+        try:
+            stat = os.stat(full_path)
+            with open(full_path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None, 0
+
+        digest = hashlib.sha256(data).hexdigest()
+        blob_path = self._blob_path(digest)
+        written = 0
+        if not blob_path.exists():
+            compressed = gzip.compress(data, COMPRESS_LEVEL)
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = blob_path.with_name(f"{blob_path.name}.{uuid.uuid4().hex}.tmp")
+            with open(temp_path, 'wb') as f:
+                f.write(compressed)
+            os.replace(temp_path, blob_path)
+            written = len(compressed)
+        return [digest, stat.st_size, stat.st_mtime], written
+
+    def _read_blob(self, digest: str) -> Optional[bytes]:
+        try:
+            with open(self._blob_path(digest), 'rb') as f:
+                return gzip.decompress(f.read())
+        except FileNotFoundError:
+            logger.error(f"백업 blob이 없습니다: {digest}")
+            return None
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest}.gz"
+
+    def _manifest_path(self, sequence: int) -> Path:
+        return self.snapshots_dir / f"{sequence:08d}.json"
+
+    @staticmethod
+    def _write_json(path: Path, data: Dict[str, Any]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def _summary(manifest: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": manifest["id"],
+            "created": manifest["created"],
+            "reason": manifest["reason"],
+            "full": manifest["full"],
+            "changed": len(manifest["files"]),
+            "removed": len(manifest["removed"])
+        }
+
+
+class BackupManager:
+    """볼트 백업 관리자 (주기 스냅샷, 편집 전 백업, 복원)"""
+
+    def __init__(self, vault_manager, settings: Optional[ObsidianSettings] = None):
+        settings = settings or ObsidianSettings()
+        self.vault_manager = vault_manager
+        self.enabled = settings.get_setting("auto_backup", True)
+        self.interval = max(1, settings.get_setting("backup_interval", 3600))
+        self.retention = settings.get_setting("backup_retention", 100)
+        self.backup_before_edit_enabled = settings.get_vault_operations_settings().get(
+            "create_backup_before_edit", True
+        )
+        self._stores: Dict[str, SnapshotStore] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._stop_event: Optional[asyncio.Event] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """주기 스냅샷 시작 (auto_backup이 꺼져 있으면 무시)"""
+        if not self.enabled or self.running:
+            return
+
+        self._stop_event = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"자동 백업 시작 (주기 {self.interval}초)")
+
+    async def stop(self) -> None:
+        """주기 스냅샷 종료"""
+        if not self.running:
+            return
+
+        self._stop_event.set()
+        try:
+            await asyncio.wait_for(self._task, timeout=30.0)
+        except asyncio.TimeoutError:
+            self._task.cancel()
+        except Exception as e:
+            logger.error(f"자동 백업 종료 실패: {str(e)}")
+        self._task = None
+        logger.info("자동 백업 종료")
+
+    async def create_snapshot(
+        self,
+        paths: Optional[List[str]] = None,
+        reason: str = "manual"
+    ) -> Dict[str, Any]:
+        """
+        증분 스냅샷 생성
+
+        Args:
+            paths: 지정하면 해당 노트만 백업
+            reason: 스냅샷 사유
+
+        Returns:
+            생성 결과 (바뀐 파일이 없으면 snapshot이 None)
+        """
+        try:
+            store = self._get_store()
+            if store is None:
+                return {"success": False, "error": "볼트 경로가 설정되지 않았습니다."}
+
+            if paths is None:
+                catalog = await self.vault_manager._refresh_catalog()
+                notes = catalog.list_notes("", recursive=True)
+            else:
+                notes = []
+                paths = [self._normalize_path(path) for path in paths]
+            snapshot = await asyncio.to_thread(store.snapshot, notes, paths, reason)
+
+            if snapshot is not None and self.retention and len(store.manifests) > self.retention + max(10, self.retention // 10):
+                # 보존 개수를 일정 이상 넘었을 때만 한 번에 정리
+                await asyncio.to_thread(store.prune, self.retention)
+            return {"success": True, "snapshot": snapshot}
+
+        except Exception as e:
+            logger.error(f"스냅샷 생성 실패: {str(e)}")
+            return {"success": False, "error": str(e)}
+
+    async def backup_before_edit(self, note_path: str) -> None:
+        """편집 전 노트 백업 (create_backup_before_edit 설정)"""
+        if self.backup_before_edit_enabled:
+            await self.create_snapshot([note_path], reason="before_edit")
+
+    async def list_snapshots(self) -> List[Dict[str, Any]]:
+        """스냅샷 목록 (최신순)"""
+        store = self._get_store()
+        if store is None:
+            return []
+        return await asyncio.to_thread(store.list_snapshots)
+
+    async def read_snapshot_note(self, snapshot_id: int, note_path: str) -> Optional[str]:
+        """스냅샷 시점의 노트 내용"""
+        store = self._get_store()
+        if store is None:
+            return None
+        data = await asyncio.to_thread(store.read_file, snapshot_id, self._normalize_path(note_path))
+        return data.decode('utf-8') if data is not None else None
+
+    async def restore_note(self, snapshot_id: int, note_path: str) -> Dict[str, Any]:
+        """스냅샷 시점의 내용으로 노트 복원 (현재 내용은 먼저 백업)"""
+        try:
+            content = await self.read_snapshot_note(snapshot_id, note_path)
+            if content is None:
+                return {"success": False, "error": "스냅샷에 해당 노트가 없습니다."}
+
+            await self.backup_before_edit(note_path)
+            result = await self.vault_manager.save_note(note_path, content, operation="restore")
+            return {"snapshot_id": snapshot_id, "note_path": note_path, **result}
+
+        except Exception as e:
+            logger.error(f"노트 복원 실패: {str(e)}")
+            return {"success": False, "error": str(e)}
+
+    async def _run(self) -> None:
+        """주기 스냅샷 루프 (시작 직후 기준 스냅샷 생성)"""
+        while not self._stop_event.is_set():
+            if self.vault_manager.vault_path is not None:
+                await self.create_snapshot(reason="auto")
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def _get_store(self) -> Optional[SnapshotStore]:
+        vault_path = self.vault_manager.vault_path
+        if vault_path is None:
+            return None
+        key = str(Path(vault_path).absolute())
+        store = self._stores.get(key)
+        if store is None:
+            store = SnapshotStore(Path(vault_path))
+            self._stores[key] = store
+        return store
+
+    @staticmethod
+    def _normalize_path(note_path: str) -> str:
+        """카탈로그 경로 형식 (OS 구분자)"""
+        return os.path.normpath(note_path.lstrip("/\\"))
@@ -3,27 +3,31 @@
 노트 내용을 AI 결과와 결합하여 처리합니다.
 """
 import re
-from typing import Dict, Any, Optional
+from pathlib import Path
+from typing import Dict, Any, Optional, Union
 from loguru import logger
 
+from ..indexes.markdown_tokenizer import MarkdownStructure, tokenize_markdown
+from ..indexes.note_cache import NoteCache, ParsedNote, get_note_cache
+from ..indexes.section_index import Section, SectionIndex, SectionPatch, apply_patch
+
 
 class NoteProcessor:
     """노트 처리기"""
     
-    def __init__(self):
-        self.obsidian_patterns = {
-            "wikilink": r'\[\[([^\]]+)\]\]',
-            "tag": r'#\w+',
-            "heading": r'^#{1,6}\s+.+$',
-            "code_block": r'```[\s\S]*?```',
-            "inline_code": r'`[^`]+`'
-        }
+    def __init__(self, note_cache: Optional[NoteCache] = None):
+        self.note_cache = note_cache or get_note_cache()
+    
+    def load_note(self, full_path: Union[str, Path]) -> Optional[ParsedNote]:
+        """파싱된 노트 조회 (노트 캐시 공유)"""
+        return self.note_cache.load(full_path)
     
     def apply_ai_result(
         self, 
         original_content: str, 
         ai_result: str, 
-        operation: str
+        operation: str,
+        structure: Optional[MarkdownStructure] = None
     ) -> str:
         """
         AI 결과를 원본 노트에 적용
@@ -32,156 +36,148 @@ class NoteProcessor:
             original_content: 원본 노트 내용
             ai_result: AI 처리 결과
             operation: 수행된 작업
+            structure: 캐시된 파싱 결과 (없으면 새로 파싱)
         
         Returns:
             처리된 노트 내용
         """
         try:
-            if operation == "summarize":
-                return self._apply_summary(original_content, ai_result)
-            elif operation == "enhance":
-                return self._apply_enhancement(original_content, ai_result)
-            elif operation == "generate_outline":
-                return self._apply_outline(original_content, ai_result)
-            elif operation == "translate":
-                return self._apply_translation(original_content, ai_result)
-            elif operation == "format":
-                return self._apply_formatting(original_content, ai_result)
-            else:
-                return self._apply_general(original_content, ai_result, operation)
+            patch = self.plan_ai_result(original_content, ai_result, operation, structure)
+            return apply_patch(original_content, patch)
                 
         except Exception as e:
             logger.error(f"AI 결과 적용 실패: {str(e)}")
             return original_content
     
-    def _apply_summary(self, content: str, summary: str) -> str:
-        """요약 결과 적용"""
-        # 기존 요약 섹션이 있는지 확인
-        summary_pattern = r'## 요약\s*\n.*?(?=\n##|\Z)'
-        if re.search(summary_pattern, content, re.DOTALL):
-            # 기존 요약 교체
-            return re.sub(
-                summary_pattern,
-                f"## 요약\n\n{summary}\n",
-                content,
-                flags=re.DOTALL
-            )
+    def plan_ai_result(
+        self,
+        original_content: str,
+        ai_result: str,
+        operation: str,
+        structure: Optional[MarkdownStructure] = None
+    ) -> SectionPatch:
+        """
+        AI 결과 적용 패치 계산
+        
+        섹션 색인으로 바뀌는 범위만 계산하므로 호출자는 해당 범위만 다시 쓸 수 있습니다.
+        """
+        if operation == "enhance":
+            return self._apply_enhancement(original_content, ai_result)
+        elif operation == "translate":
+            return self._apply_translation(original_content, ai_result)
+        elif operation == "format":
+            return self._apply_formatting(original_content, ai_result)
+        
+        sections = SectionIndex(original_content, structure)
+        if operation == "summarize":
+            return self._apply_summary(sections, ai_result)
+        elif operation == "generate_outline":
+            return self._apply_outline(sections, ai_result)
         else:
-            # 새 요약 섹션 추가
-            return f"{content}\n\n## 요약\n\n{summary}\n"
+            return self._apply_general(sections, ai_result, operation)
+    
+    def _apply_summary(self, sections: SectionIndex, summary: str) -> SectionPatch:
+        """요약 결과 적용"""
+        return self._replace_or_append(sections, "요약", summary)
     
-    def _apply_enhancement(self, content: str, enhancement: str) -> str:
+    def _apply_enhancement(self, content: str, enhancement: str) -> SectionPatch:
         """개선 결과 적용"""
         # 기존 내용을 개선된 내용으로 교체
-        return enhancement
+        return SectionPatch(0, len(content), enhancement)
     
-    def _apply_outline(self, content: str, outline: str) -> str:
+    def _apply_outline(self, sections: SectionIndex, outline: str) -> SectionPatch:
         """목차 결과 적용"""
-        # 기존 목차 섹션이 있는지 확인
-        outline_pattern = r'## 목차\s*\n.*?(?=\n##|\Z)'
-        if re.search(outline_pattern, content, re.DOTALL):
-            # 기존 목차 교체
-            return re.sub(
-                outline_pattern,
-                f"## 목차\n\n{outline}\n",
-                content,
-                flags=re.DOTALL
-            )
-        else:
-            # 새 목차 섹션 추가 (제목 다음에)
-            lines = content.split('\n')
-            insert_index = 0
-            
-            # 첫 번째 제목 찾기
-            for i, line in enumerate(lines):
-                if re.match(r'^#{1,6}\s+', line):
-                    insert_index = i + 1
-                    break
-            
-            lines.insert(insert_index, f"\n## 목차\n\n{outline}\n")
-            return '\n'.join(lines)
-    
-    def _apply_translation(self, content: str, translation: str) -> str:
+        # 기존 목차 섹션이 있으면 교체
+        section = sections.find("목차", level=2)
+        if section is not None:
+            return sections.replace_own(section, self._section_text(sections, section, "목차", outline))
+        
+        # 새 목차 섹션 추가 (첫 번째 제목 다음에)
+        first = sections.first_heading()
+        if first is None:
+            return sections.insert_at(0, f"\n## 목차\n\n{outline}\n\n")
+        if first.body_start == sections.length and not sections.ends_with_newline:
+            # 줄바꿈 없이 끝나는 마지막 줄이 제목인 경우
+            return sections.append(f"\n\n## 목차\n\n{outline}\n")
+        return sections.insert_at(first.body_start, f"\n## 목차\n\n{outline}\n\n")
+    
+    def _apply_translation(self, content: str, translation: str) -> SectionPatch:
         """번역 결과 적용"""
         # 번역된 내용으로 완전 교체
-        return translation
+        return SectionPatch(0, len(content), translation)
     
-    def _apply_formatting(self, content: str, formatted: str) -> str:
+    def _apply_formatting(self, content: str, formatted: str) -> SectionPatch:
         """포맷팅 결과 적용"""
         # 포맷팅된 내용으로 교체
-        return formatted
+        return SectionPatch(0, len(content), formatted)
     
-    def _apply_general(self, content: str, result: str, operation: str) -> str:
+    def _apply_general(self, sections: SectionIndex, result: str, operation: str) -> SectionPatch:
         """일반적인 결과 적용"""
         # 작업별 섹션 추가
-        section_title = f"## AI {operation.title()}\n\n"
-        return f"{content}\n\n{section_title}{result}\n"
-    
-    def extract_metadata(self, content: str) -> Dict[str, Any]:
-        """노트에서 메타데이터 추출"""
+        return sections.append(f"\n\n## AI {operation.title()}\n\n{result}\n")
+    
+    def _replace_or_append(self, sections: SectionIndex, title: str, body: str) -> SectionPatch:
+        """같은 제목의 2단계 섹션이 있으면 그 본문만 교체(하위 섹션은 유지), 없으면 문서 끝에 추가"""
+        section = sections.find(title, level=2)
+        if section is None:
+            return sections.append(f"\n\n## {title}\n\n{body}\n")
+        return sections.replace_own(section, self._section_text(sections, section, title, body))
+    
+    @staticmethod
+    def _section_text(sections: SectionIndex, section: Section, title: str, body: str) -> str:
+        # 뒤에 하위 섹션이나 다른 섹션이 이어지면 빈 줄 하나로 구분
+        separator = "\n" if sections.own_end(section) < sections.length else ""
+        return f"## {title}\n\n{body}\n{separator}"
+    
+    def extract_metadata(
+        self,
+        content: str,
+        structure: Optional[MarkdownStructure] = None
+    ) -> Dict[str, Any]:
+        """노트에서 메타데이터 추출 (토크나이저 한 번 순회)"""
+        structure = structure or tokenize_markdown(content)
         metadata = {
-            "title": self._extract_title(content),
-            "tags": self._extract_tags(content),
-            "links": self._extract_links(content),
-            "headings": self._extract_headings(content),
-            "word_count": len(content.split()),
+            "title": structure.title,
+            "tags": [f"#{tag}" for tag in structure.tag_names],
+            "links": structure.link_texts,
+            "headings": [f"{'#' * heading.level} {heading.text}" for heading in structure.headings],
+            "word_count": structure.word_count,
             "char_count": len(content)
         }
         return metadata
     
-    def _extract_title(self, content: str) -> Optional[str]:
-        """제목 추출"""
-        lines = content.split('\n')
-        for line in lines:
-            if re.match(r'^#\s+', line):
-                return line[2:].strip()
-        return None
-    
-    def _extract_tags(self, content: str) -> list:
-        """태그 추출"""
-        tags = re.findall(self.obsidian_patterns["tag"], content)
-        return list(set(tags))  # 중복 제거
-    
-    def _extract_links(self, content: str) -> list:
-        """링크 추출"""
-        links = re.findall(self.obsidian_patterns["wikilink"], content)
-        return list(set(links))  # 중복 제거
-    
-    def _extract_headings(self, content: str) -> list:
-        """헤딩 추출"""
-        headings = re.findall(self.obsidian_patterns["heading"], content, re.MULTILINE)
-        return [h.strip() for h in headings]
-    
-    def validate_note_structure(self, content: str) -> Dict[str, Any]:
-        """노트 구조 검증"""
+    def validate_note_structure(
+        self,
+        content: str,
+        structure: Optional[MarkdownStructure] = None
+    ) -> Dict[str, Any]:
+        """노트 구조 검증 (캐시된 파싱 결과가 있으면 재사용)"""
         issues = []
         suggestions = []
+        structure = structure or tokenize_markdown(content)
         
         # 제목 확인
-        if not self._extract_title(content):
+        if not structure.title:
             issues.append("제목이 없습니다.")
             suggestions.append("첫 번째 줄에 # 제목 형식으로 제목을 추가하세요.")
         
         # 헤딩 구조 확인
-        headings = self._extract_headings(content)
-        if len(headings) < 2:
+        if len(structure.headings) < 2:
             suggestions.append("더 많은 섹션을 추가하여 구조를 개선하세요.")
         
         # 태그 확인
-        tags = self._extract_tags(content)
-        if not tags:
+        if not structure.tags:
             suggestions.append("관련 태그를 추가하여 노트를 분류하세요.")
         
         # 링크 확인
-        links = self._extract_links(content)
-        if not links:
+        if not structure.wikilinks:
             suggestions.append("다른 노트와의 연결을 위해 링크를 추가하세요.")
         
         return {
             "valid": len(issues) == 0,
             "issues": issues,
             "suggestions": suggestions,
-            "metadata": self.extract_metadata(content)
+            "metadata": self.extract_metadata(content, structure)
         }
     
     def format_note(self, content: str, style: str = "standard") -> str:
@@ -0,0 +1,279 @@
+"""
+볼트 검색 백엔드
+VaultManager가 사용하는 검색 엔진 구현들입니다.
+설정(search_settings.backend)으로 본문 스캔, 역색인, SQLite FTS5 중 하나를 선택합니다.
+"""
+import asyncio
+from abc import ABC, abstractmethod
+from contextlib import aclosing
+from typing import Dict, Any, List, Optional, AsyncIterator, Type
+from loguru import logger
+
+from ..indexes.sqlite_index import SQLiteIndex, get_sqlite_index, is_fts5_available
+from ..indexes.trigram_index import normalize_text
+
+
+class SearchBackend(ABC):
+    """검색 백엔드 인터페이스"""
+
+    name = ""
+
+    def __init__(self, vault_manager):
+        self.vault_manager = vault_manager
+
+    @abstractmethod
+    def iter_search(
+        self,
+        notes: List[Dict[str, Any]],
+        query: str,
+        search_type: str,
+        limit: int,
+        ranked: bool
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        검색 결과를 찾는 즉시 하나씩 내보냄
+
+        Args:
+            notes: 검색 대상 노트 목록 (카탈로그 순서)
+            query: 검색 쿼리
+            search_type: 검색 타입 (content, title, tag, link)
+            limit: 최대 결과 수
+            ranked: 관련도 순 정렬 여부
+        """
+
+    async def prepare(self, notes: List[Dict[str, Any]]) -> None:
+        """색인을 최신 상태로 생성/갱신하고 완료를 기다림 (예열, 벤치마크용)"""
+
+    async def apply_changes(
+        self,
+        changed: List[Dict[str, Any]],
+        removed: List[str],
+        contents: Optional[Dict[str, str]] = None
+    ) -> None:
+        """파일 변경 반영 (색인을 따로 유지하는 백엔드만 구현)"""
+
+    def reset(self) -> None:
+        """볼트 경로 변경 시 상태 초기화"""
+
+    async def _yield_matches(
+        self,
+        candidates: List[Dict[str, Any]],
+        query: str,
+        search_type: str,
+        limit: int,
+        matches
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """후보 노트 본문을 배치로 읽어 조건에 맞는 노트를 limit개까지 내보냄"""
+        vault_manager = self.vault_manager
+        found = 0
+        # limit을 채우면 남은 배치는 읽지 않음
+        async with aclosing(vault_manager._read_notes_batched(candidates)) as batches:
+            async for note, note_content in batches:
+                if not note_content or not matches(note, note_content):
+                    continue
+
+                yield {
+                    **note,
+                    "context": vault_manager._extract_context(note_content, query),
+                    "match_type": search_type
+                }
+                found += 1
+                if found >= limit:
+                    break
+
+
+class ScanSearchBackend(SearchBackend):
+    """색인 없이 모든 노트 본문을 병렬로 읽어 매칭하는 백엔드"""
+
+    name = "scan"
+
+    async def iter_search(self, notes, query, search_type, limit, ranked):
+        def matches(note: Dict[str, Any], content: str) -> bool:
+            return self.vault_manager._match_note(note, content, query, search_type)
+
+        async with aclosing(self._yield_matches(notes, query, search_type, limit, matches)) as results:
+            async for result in results:
+                yield result
+
+
+class IndexSearchBackend(SearchBackend):
+    """디스크 저장 역색인 백엔드 (색인 생성 중에는 스캔으로 대체)"""
+
+    name = "index"
+
+    async def prepare(self, notes):
+        await self.vault_manager._refresh_search_index(notes)
+
+    async def iter_search(self, notes, query, search_type, limit, ranked):
+        vault_manager = self.vault_manager
+        index = await vault_manager._get_search_index(notes)
+
+        if ranked and search_type == "content":
+            if index is None:
+                # 순위 검색은 색인 통계가 필요하므로 생성 완료를 기다림
+                index = await vault_manager._refresh_search_index(notes)
+            async with aclosing(vault_manager._iter_ranked(index, notes, query, limit)) as ranked_results:
+                async for result in ranked_results:
+                    yield result
+            return
+
+        if index is None:
+            async with aclosing(
+                ScanSearchBackend(vault_manager).iter_search(notes, query, search_type, limit, ranked)
+            ) as results:
+                async for result in results:
+                    yield result
+            return
+
+        # 파일 시스템 순서를 유지하며 매칭된 노트만 본문을 읽음
+        matched_paths = index.search(query, search_type)
+        verify = index.needs_verification(query, search_type)
+        query_normalized = normalize_text(query)
+        candidates = [note for note in notes if note["path"] in matched_paths]
+
+        def matches(note: Dict[str, Any], content: str) -> bool:
+            return not verify or query_normalized in normalize_text(content)
+
+        async with aclosing(self._yield_matches(candidates, query, search_type, limit, matches)) as results:
+            async for result in results:
+                yield result
+
+
+class SQLiteSearchBackend(SearchBackend):
+    """
+    SQLite FTS5 백엔드
+
+    단어 접두사/구절 매칭과 bm25 순위, 스니펫 하이라이트를 데이터베이스에서 바로 얻으므로
+    결과 노트의 본문을 다시 읽지 않습니다. 태그/링크 검색은 링크 그래프를 가진 역색인에 위임합니다.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, vault_manager):
+        super().__init__(vault_manager)
+        self.index: Optional[SQLiteIndex] = None
+        self._build_task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    async def iter_search(self, notes, query, search_type, limit, ranked):
+        vault_manager = self.vault_manager
+        if search_type not in SQLiteIndex.COLUMNS:
+            async with aclosing(
+                IndexSearchBackend(vault_manager).iter_search(notes, query, search_type, limit, ranked)
+            ) as results:
+                async for result in results:
+                    yield result
+            return
+
+        index = await self._get_index(notes)
+        if index is None:
+            # 최초 생성 중에는 스캔으로 검색
+            async with aclosing(
+                ScanSearchBackend(vault_manager).iter_search(notes, query, search_type, limit, ranked)
+            ) as results:
+                async for result in results:
+                    yield result
+            return
+
+        notes_by_path = {note["path"]: note for note in notes}
+        rows = await asyncio.to_thread(index.search, query, search_type, limit, ranked)
+        for row in rows:
+            note = notes_by_path.get(row["path"])
+            if note is None:
+                continue
+            result = {
+                **note,
+                "context": row["snippet"],
+                "highlight": row["highlight"],
+                "match_type": search_type
+            }
+            if ranked:
+                result["score"] = round(row["score"], 4)
+            yield result
+
+    async def prepare(self, notes):
+        if self._build_task is not None and not self._build_task.done():
+            await self._build_task
+        await self._refresh(notes)
+
+    async def apply_changes(self, changed, removed, contents=None):
+        if self.index is None:
+            # 아직 사용 전이면 다음 검색에서 mtime 비교로 동기화됨
+            return
+
+        async with self._lock:
+            if removed:
+                await asyncio.to_thread(self.index.remove_documents, removed)
+
+            documents = []
+            for note in changed:
+                content = contents.get(note["path"]) if contents else None
+                if content is None:
+                    content = await self.vault_manager.read_note(note["path"])
+                if content is None:
+                    await asyncio.to_thread(self.index.remove_documents, [note["path"]])
+                    continue
+                documents.append((note, content))
+            if documents:
+                await asyncio.to_thread(self.index.add_documents, documents)
+
+    def reset(self) -> None:
+        if self._build_task is not None and not self._build_task.done():
+            self._build_task.cancel()
+        self.index = None
+
+    async def _get_index(self, notes: List[Dict[str, Any]]) -> Optional[SQLiteIndex]:
+        """사용 가능한 FTS5 색인 조회 (데이터베이스가 없으면 백그라운드 생성 후 None)"""
+        if self._build_task is not None and not self._build_task.done():
+            return None
+
+        vault_path = self.vault_manager.vault_path
+        if self.index is None and not SQLiteIndex.exists_for(vault_path):
+            logger.info("SQLite 색인이 없어 백그라운드에서 생성합니다.")
+            self._build_task = asyncio.create_task(self._refresh(notes))
+            return None
+
+        return await self._refresh(notes)
+
+    async def _refresh(self, notes: List[Dict[str, Any]]) -> SQLiteIndex:
+        """변경된 노트만 다시 읽어 FTS5 색인 갱신 (배치 단위 트랜잭션)"""
+        vault_manager = self.vault_manager
+        async with self._lock:
+            if self.index is None:
+                self.index = get_sqlite_index(vault_manager.vault_path)
+            index = self.index
+
+            stale_notes = await asyncio.to_thread(index.sync, notes)
+            documents = []
+            async for note, content in vault_manager._read_notes_batched(stale_notes):
+                if content is None:
+                    continue
+                documents.append((note, content))
+                if len(documents) >= vault_manager.read_batch_size:
+                    await asyncio.to_thread(index.add_documents, documents)
+                    documents = []
+            if documents:
+                await asyncio.to_thread(index.add_documents, documents)
+
+            if stale_notes:
+                logger.info(f"SQLite 색인 갱신: {len(stale_notes)}개 노트")
+        return index
+
+
+SEARCH_BACKENDS: Dict[str, Type[SearchBackend]] = {
+    ScanSearchBackend.name: ScanSearchBackend,
+    IndexSearchBackend.name: IndexSearchBackend,
+    SQLiteSearchBackend.name: SQLiteSearchBackend,
+}
+
+
+def create_search_backend(name: str, vault_manager) -> SearchBackend:
+    """이름으로 검색 백엔드 생성 (알 수 없거나 사용할 수 없으면 역색인)"""
+    backend_class = SEARCH_BACKENDS.get(name)
+    if backend_class is None:
+        logger.warning(f"알 수 없는 검색 백엔드: {name}, 역색인을 사용합니다.")
+        backend_class = IndexSearchBackend
+    elif backend_class is SQLiteSearchBackend and not is_fts5_available():
+        logger.warning("SQLite에 FTS5가 없어 역색인을 사용합니다.")
+        backend_class = IndexSearchBackend
+    return backend_class(vault_manager)
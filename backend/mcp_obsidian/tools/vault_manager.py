@@ -3,57 +3,233 @@
 볼트 파일 시스템 조작을 담당합니다.
 """
 import os
+import mmap
+import stat
+import uuid
 import asyncio
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing, AsyncExitStack
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Iterable, AsyncIterator, Tuple
 from loguru import logger
-import aiofiles
-import re
+
+from ..indexes.search_index import SearchIndex, get_search_index
+from ..indexes.link_graph import LinkGraph
+from ..indexes.markdown_tokenizer import tokenize_markdown
+from ..indexes.vault_query import QueryPlanner, parse_vault_query
+from ..indexes.trigram_index import normalize_text
+from ..indexes.note_catalog import NoteCatalog, get_note_catalog, select_fields
+from ..indexes.note_cache import ParsedNote, content_hash, get_note_cache
+from ..indexes.section_index import SectionPatch, apply_patch
+from ..indexes.change_journal import get_change_journal
+from ..config.obsidian_settings import ObsidianSettings
+from .note_processor import NoteProcessor
+from .search_backends import create_search_backend
+
+
+# 이 크기 이상의 파일은 범위 읽기 시 mmap으로 필요한 부분만 페이지 인
+MMAP_MIN_SIZE = 256 * 1024
+# 스트리밍 읽기 기본 청크 크기
+DEFAULT_CHUNK_SIZE = 64 * 1024
 
 
 class VaultManager:
     """옵시디언 볼트 관리자"""
     
-    def __init__(self, vault_path: Optional[str] = None):
+    def __init__(self, vault_path: Optional[str] = None, settings: Optional[ObsidianSettings] = None):
         self.vault_path = Path(vault_path) if vault_path else None
         self.supported_extensions = {'.md', '.txt', '.json', '.yaml', '.yml'}
+        settings = settings or ObsidianSettings()
+        # AI 처리 대상 노트 최대 크기 (바이트)
+        self.max_note_size = settings.get_setting("max_note_size", 1024 * 1024)
+        
+        # 파싱된 노트 캐시 (프로세스 공유)
+        self.note_cache = get_note_cache(settings.get_note_processing_settings().get("cache_max_bytes"))
+        self.note_processor = NoteProcessor(self.note_cache)
+        
+        vault_operations = settings.get_vault_operations_settings()
+        # 쓰기 충돌 처리 (prompt: 실패 반환, skip: 쓰지 않음, auto: 덮어씀)
+        self.conflict_resolution = vault_operations.get("conflict_resolution", "prompt")
+        self.atomic_writes = vault_operations.get("atomic_writes", True)
+        # 변경 저널 기록 여부
+        self.track_changes = vault_operations.get("track_changes", True)
+        self._write_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+        # 감시자 없이 외부 제자리 수정을 감지할 때의 파일 재확인 간격 (None이면 디렉토리 mtime만)
+        self.catalog_stat_interval = settings.get_watcher_settings().get("stat_interval")
+        
+        search_settings = settings.get_search_settings()
+        # 검색 백엔드 (scan, index, sqlite) - 이전 설정의 use_index=False는 scan
+        default_backend = "index" if search_settings.get("use_index", True) else "scan"
+        self.search_backend_name = search_settings.get("backend", default_backend)
+        self.read_batch_size = max(1, search_settings.get("read_batch_size", 64))
+        self.read_concurrency = max(1, search_settings.get("read_concurrency", 8))
+        self._read_executor: Optional[ThreadPoolExecutor] = None
+        
+        self.search_index: Optional[SearchIndex] = None
+        self._index_build_task: Optional[asyncio.Task] = None
+        self.index_save_delay = 2.0  # 초
+        # 색인 변경(메모리)만 보호하는 잠금 - 본문 읽기 동안에는 잡지 않음
+        self._index_lock = asyncio.Lock()
+        # 색인 갱신(전체 생성 포함)끼리만 직렬화 - 쓰기 경로는 기다리지 않음
+        self._index_refresh_lock = asyncio.Lock()
+        # 경로 -> 직접 반영 순번 (갱신 중 읽은 이전 본문이 더 새로운 직접 반영을 덮어쓰지 않도록)
+        self._index_touched: Dict[str, int] = {}
+        self._index_touch_seq = 0
+        self._save_task: Optional[asyncio.Task] = None
+        self.search_backend = create_search_backend(self.search_backend_name, self)
     
     def set_vault_path(self, vault_path: str):
         """볼트 경로 설정"""
         self.vault_path = Path(vault_path)
         if not self.vault_path.exists():
             raise ValueError(f"볼트 경로가 존재하지 않습니다: {vault_path}")
+        if self._index_build_task is not None and not self._index_build_task.done():
+            self._index_build_task.cancel()
+        self.search_index = None
+        self._index_touched.clear()
+        self.search_backend.reset()
     
-    async def read_note(self, note_path: str) -> Optional[str]:
-        """노트 읽기"""
+    async def read_note(
+        self,
+        note_path: str,
+        offset: Optional[int] = None,
+        length: Optional[int] = None
+    ) -> Optional[str]:
+        """노트 읽기 (offset/length를 주면 해당 바이트 범위만)"""
+        if offset is not None or length is not None:
+            result = await self.read_note_range(note_path, offset or 0, length)
+            return result["content"] if result is not None else None
+        note = await self.read_parsed_note(note_path)
+        return note.content if note is not None else None
+    
+    async def read_note_range(
+        self,
+        note_path: str,
+        offset: int = 0,
+        length: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        노트의 바이트 범위 읽기
+        
+        큰 파일은 mmap으로 해당 범위만 읽으므로 전체를 메모리에 올리지 않습니다.
+        범위 양 끝은 UTF-8 문자 경계로 맞추며, next_offset으로 이어 읽으면 빠짐없이 이어집니다.
+        
+        Returns:
+            content, offset, length, size, next_offset (끝이면 None) - 노트가 없으면 None
+        """
         try:
             full_path = self._get_full_path(note_path)
-            if not full_path.exists():
-                return None
-            
-            async with aiofiles.open(full_path, 'r', encoding='utf-8') as f:
-                content = await f.read()
-                return content
+            return await asyncio.to_thread(self._read_range_sync, full_path, offset, length)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"노트 범위 읽기 실패: {str(e)}")
+            return None
+    
+    async def iter_note_bytes(
+        self,
+        note_path: str,
+        offset: int = 0,
+        length: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """노트 원본 바이트를 청크 단위로 읽기 (청크마다 스레드에서 읽어 이벤트 루프를 막지 않음)"""
+        full_path = self._get_full_path(note_path)
+        f = await asyncio.to_thread(open, full_path, 'rb')
+        try:
+            if offset:
+                await asyncio.to_thread(f.seek, offset)
+            remaining = length
+            while remaining is None or remaining > 0:
+                size = chunk_size if remaining is None else min(chunk_size, remaining)
+                chunk = await asyncio.to_thread(f.read, size)
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+        finally:
+            f.close()
+    
+    async def get_note_size(self, note_path: str) -> Optional[int]:
+        """노트 파일 크기 (없으면 None)"""
+        try:
+            full_path = self._get_full_path(note_path)
+            return (await asyncio.to_thread(os.stat, full_path)).st_size
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+    
+    async def read_parsed_note(self, note_path: str) -> Optional[ParsedNote]:
+        """
+        노트 읽기 (캐시된 본문과 파싱 결과)
+        
+        mtime과 크기가 바뀌지 않았으면 디스크를 읽지 않고 캐시에서 반환합니다.
+        """
+        try:
+            full_path = self._get_full_path(note_path)
+            return await asyncio.to_thread(self.note_processor.load_note, full_path)
                 
         except Exception as e:
             logger.error(f"노트 읽기 실패: {str(e)}")
             return None
     
-    async def write_note(self, note_path: str, content: str) -> bool:
-        """노트 쓰기"""
+    async def write_note(self, note_path: str, content: str, expected_hash: Optional[str] = None) -> bool:
+        """노트 쓰기 (내용이 같으면 쓰지 않음)"""
+        result = await self.save_note(note_path, content, expected_hash)
+        return result["success"]
+    
+    async def save_note(
+        self,
+        note_path: str,
+        content: str,
+        expected_hash: Optional[str] = None,
+        conflict_resolution: Optional[str] = None,
+        operation: str = "write"
+    ) -> Dict[str, Any]:
+        """
+        노트 저장 (해시 비교로 변경 없는 쓰기 생략, 충돌 감지)
+        
+        Args:
+            note_path: 노트 경로
+            content: 저장할 내용
+            expected_hash: 호출자가 읽었던 본문 해시 (If-Match) - 현재 해시와 다르면 충돌
+            conflict_resolution: 충돌 처리 방식 (prompt: 실패 반환, skip: 쓰지 않음, auto: 덮어씀)
+            operation: 변경 저널에 기록할 작업 이름
+        
+        Returns:
+            저장 결과 (success, written, hash, conflict)
+        """
         try:
             full_path = self._get_full_path(note_path)
-            
-            # 디렉토리 생성
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            async with aiofiles.open(full_path, 'w', encoding='utf-8') as f:
-                await f.write(content)
-                return True
+            return await self._save_full_path(
+                full_path, content, expected_hash, conflict_resolution or self.conflict_resolution,
+                operation=operation
+            )
                 
         except Exception as e:
             logger.error(f"노트 쓰기 실패: {str(e)}")
-            return False
+            return {"success": False, "written": False, "error": str(e)}
+    
+    async def patch_note(self, note_path: str, note: ParsedNote, patch: SectionPatch) -> Dict[str, Any]:
+        """
+        노트의 일부 범위만 다시 쓰기
+        
+        읽은 시점의 해시를 기대값으로 사용하므로, 그 뒤 노트가 바뀌었으면 덮어쓰지 않고
+        충돌을 반환합니다 (재적용 여부는 호출자가 결정).
+        문서 끝 추가는 추가 모드로 쓰고, 중간 교체는 atomic_writes 설정에 따라
+        임시 파일 교체 또는 바뀐 위치부터의 덮어쓰기로 씁니다.
+        """
+        try:
+            full_path = self._get_full_path(note_path)
+            new_content = apply_patch(note.content, patch)
+            return await self._save_full_path(
+                full_path, new_content, note.content_hash, "prompt", patch, operation="ai_edit"
+            )
+            
+        except Exception as e:
+            logger.error(f"노트 패치 실패: {str(e)}")
+            return {"success": False, "written": False, "error": str(e)}
     
     async def create_note(self, note_path: str, content: str = "") -> bool:
         """새 노트 생성"""
@@ -63,12 +239,8 @@ class VaultManager:
             if full_path.exists():
                 return False  # 이미 존재하는 파일
             
-            # 디렉토리 생성
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            async with aiofiles.open(full_path, 'w', encoding='utf-8') as f:
-                await f.write(content)
-                return True
+            result = await self._save_full_path(full_path, content, None, "prompt")
+            return result["success"]
                 
         except Exception as e:
             logger.error(f"노트 생성 실패: {str(e)}")
@@ -83,105 +255,847 @@ class VaultManager:
                 return False
             
             full_path.unlink()
+            self.note_cache.invalidate(full_path)
+            self._record_change("delete", full_path)
+            await self._on_file_written(full_path, None)
             return True
             
         except Exception as e:
             logger.error(f"노트 삭제 실패: {str(e)}")
             return False
     
+    async def read_notes(self, note_paths: List[str]) -> List[Dict[str, Any]]:
+        """
+        여러 노트 병렬 읽기
+        
+        읽기 스레드 풀(read_concurrency개)로 동시 I/O를 제한하며, 항목별 결과를 요청 순서대로 반환합니다.
+        
+        Returns:
+            항목별 결과 (path, success, content, hash 또는 error)
+        """
+        loop = asyncio.get_running_loop()
+        executor = self._get_read_executor()
+        
+        async def read(note_path: str) -> Dict[str, Any]:
+            try:
+                full_path = self._get_full_path(note_path)
+                note = await loop.run_in_executor(executor, self.note_processor.load_note, full_path)
+                if note is None:
+                    return {"path": note_path, "success": False, "error": "노트를 찾을 수 없습니다."}
+                return {"path": note_path, "success": True, "content": note.content, "hash": note.content_hash}
+            except Exception as e:
+                logger.warning(f"노트 읽기 실패 ({note_path}): {str(e)}")
+                return {"path": note_path, "success": False, "error": str(e)}
+        
+        return await asyncio.gather(*(read(note_path) for note_path in note_paths))
+    
+    async def write_notes(
+        self,
+        items: List[Dict[str, Any]],
+        atomic: bool = False,
+        conflict_resolution: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        여러 노트 쓰기
+        
+        Args:
+            items: path, content, expected_hash(선택) 항목 목록
+            atomic: True면 모든 항목의 충돌을 먼저 확인하고 임시 파일에 쓴 뒤 한꺼번에 교체하며,
+                하나라도 실패하면 아무것도 바꾸지 않음
+            conflict_resolution: 개별 쓰기의 충돌 처리 방식 (atomic이면 항상 실패 처리)
+        
+        Returns:
+            전체 성공 여부와 항목별 결과
+        """
+        if not atomic:
+            semaphore = asyncio.Semaphore(self.read_concurrency)
+            
+            async def save(item: Dict[str, Any]) -> Dict[str, Any]:
+                async with semaphore:
+                    result = await self.save_note(
+                        item["path"], item["content"], item.get("expected_hash"), conflict_resolution
+                    )
+                return {"path": item["path"], **result}
+            
+            results = await asyncio.gather(*(save(item) for item in items))
+            return {"success": all(result["success"] for result in results), "atomic": False, "results": results}
+        
+        try:
+            full_paths = [self._get_full_path(item["path"]) for item in items]
+            if len(set(full_paths)) != len(full_paths):
+                raise ValueError("한 배치에 같은 노트를 여러 번 쓸 수 없습니다.")
+            
+            # 경로 순서대로 잠가 다른 배치와의 교착 방지
+            async with AsyncExitStack() as stack:
+                for full_path in sorted(full_paths):
+                    await stack.enter_async_context(self._get_write_lock(full_path))
+                result = await asyncio.to_thread(self._save_batch_sync, full_paths, items)
+            
+            for full_path, item, item_result in zip(full_paths, items, result["results"]):
+                if item_result.get("written"):
+                    await self._on_file_written(full_path, item["content"])
+            return {"atomic": True, **result}
+            
+        except Exception as e:
+            logger.error(f"일괄 노트 쓰기 실패: {str(e)}")
+            return {"success": False, "atomic": True, "error": str(e), "results": []}
+    
     async def list_notes(self, directory: str = "", recursive: bool = True) -> List[Dict[str, Any]]:
-        """노트 목록 조회"""
+        """노트 목록 조회 (카탈로그 사용)"""
         try:
             search_path = self._get_full_path(directory) if directory else self.vault_path
             
             if not search_path.exists():
                 return []
             
-            notes = []
-            
-            if recursive:
-                for file_path in search_path.rglob("*"):
-                    if file_path.is_file() and file_path.suffix in self.supported_extensions:
-                        relative_path = file_path.relative_to(self.vault_path)
-                        notes.append({
-                            "path": str(relative_path),
-                            "name": file_path.stem,
-                            "extension": file_path.suffix,
-                            "size": file_path.stat().st_size,
-                            "modified": file_path.stat().st_mtime
-                        })
-            else:
-                for file_path in search_path.iterdir():
-                    if file_path.is_file() and file_path.suffix in self.supported_extensions:
-                        relative_path = file_path.relative_to(self.vault_path)
-                        notes.append({
-                            "path": str(relative_path),
-                            "name": file_path.stem,
-                            "extension": file_path.suffix,
-                            "size": file_path.stat().st_size,
-                            "modified": file_path.stat().st_mtime
-                        })
+            relative_dir = self._relative_path(search_path)
+            if relative_dir is None:
+                return []
             
-            return notes
+            catalog = await self._refresh_catalog()
+            return catalog.list_notes(relative_dir, recursive)
             
         except Exception as e:
             logger.error(f"노트 목록 조회 실패: {str(e)}")
             return []
     
+    async def list_notes_page(
+        self,
+        directory: str = "",
+        recursive: bool = True,
+        sort_by: str = "mtime",
+        descending: bool = True,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        정렬/커서 기반 노트 목록 페이지 조회
+        
+        Args:
+            sort_by: mtime, size, name
+            limit: 페이지 크기 (None이면 전체)
+            cursor: 이전 응답의 next_cursor
+            fields: 응답에 포함할 필드 (없으면 전체)
+        
+        Returns:
+            notes와 next_cursor (마지막 페이지면 None)
+        
+        Raises:
+            ValueError: 잘못된 정렬 기준이나 커서
+        """
+        search_path = self._get_full_path(directory) if directory else self.vault_path
+        relative_dir = self._relative_path(search_path) if search_path.exists() else None
+        if relative_dir is None:
+            return {"notes": [], "next_cursor": None}
+        
+        catalog = await self._refresh_catalog()
+        notes, next_cursor = await asyncio.to_thread(
+            catalog.list_page, relative_dir, recursive, sort_by, descending, limit, cursor
+        )
+        return {
+            "notes": [select_fields(note, fields) for note in notes],
+            "next_cursor": next_cursor
+        }
+    
+    async def _refresh_catalog(self) -> NoteCatalog:
+        """mtime이 바뀐 디렉토리만 다시 읽어 카탈로그 갱신 (감시자가 붙어 있으면 생략)"""
+        catalog = get_note_catalog(self.vault_path, self.supported_extensions)
+        catalog.stat_interval = self.catalog_stat_interval
+        await asyncio.to_thread(catalog.refresh)
+        return catalog
+    
     async def search_notes(
         self, 
         query: str, 
         search_type: str = "content", 
-        limit: int = 10
+        limit: int = 10,
+        ranked: bool = False
     ) -> List[Dict[str, Any]]:
-        """노트 검색"""
+        """노트 검색 (설정된 검색 백엔드 사용)"""
         try:
-            notes = await self.list_notes(recursive=True)
             results = []
+            async with aclosing(self.iter_search_notes(query, search_type, limit, ranked)) as matches:
+                async for result in matches:
+                    results.append(result)
+            return results
             
-            for note in notes:
-                if len(results) >= limit:
-                    break
-                
-                note_content = await self.read_note(note["path"])
+        except Exception as e:
+            logger.error(f"노트 검색 실패: {str(e)}")
+            return []
+    
+    async def iter_search_notes(
+        self,
+        query: str,
+        search_type: str = "content",
+        limit: int = 10,
+        ranked: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        노트 검색 결과를 찾는 즉시 하나씩 내보내는 스트리밍 검색 (설정된 검색 백엔드 사용)
+        
+        ranked가 True이고 내용 검색이면 BM25 점수 상위 limit개를 점수 순으로 내보냅니다.
+        소비자가 중단하면(aclose/취소) 남은 배치는 읽지 않습니다.
+        """
+        if limit <= 0:
+            return
+        
+        notes = await self.list_notes(recursive=True)
+        if search_type == "query":
+            results = self._iter_query(notes, query, limit, ranked)
+        else:
+            results = self.search_backend.iter_search(notes, query, search_type, limit, ranked)
+        async with aclosing(results) as matches:
+            async for result in matches:
+                yield result
+    
+    async def _iter_query(
+        self,
+        notes: List[Dict[str, Any]],
+        query: str,
+        limit: int,
+        ranked: bool
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        구조화 쿼리 검색 (tag:, link:, path:, title:, ext:, modified, size, "구절", -제외)
+        
+        색인 조회와 집합 연산으로 후보를 확정하고, 본문 확인이 필요한 조건이나
+        컨텍스트가 필요한 본문 단어가 있을 때만 후보 노트를 읽습니다.
+        """
+        parsed = parse_vault_query(query)
+        index = await self._refresh_search_index(notes)
+        plan = QueryPlanner(index, notes).execute(parsed)
+        logger.debug(f"쿼리 실행 계획 ({parsed}): {plan.steps}")
+        
+        text_terms = parsed.text_terms
+        scores: Dict[str, float] = {}
+        if ranked and text_terms:
+            ranking = index.rank(" ".join(text_terms), len(plan.paths), within=plan.paths)
+            scores = dict(ranking)
+            notes_by_path = {note["path"]: note for note in notes}
+            candidates = [notes_by_path[path] for path, _ in ranking]
+        else:
+            candidates = [note for note in notes if note["path"] in plan.paths]
+        
+        def build_result(note: Dict[str, Any], context: str) -> Dict[str, Any]:
+            result = {**note, "context": context, "match_type": "query"}
+            if note["path"] in scores:
+                result["score"] = round(scores[note["path"]], 4)
+            return result
+        
+        if not text_terms and not plan.content_checks:
+            # 색인과 메타데이터만으로 확정되므로 본문을 읽지 않음
+            for note in candidates[:limit]:
+                yield build_result(note, "")
+            return
+        
+        found = 0
+        async with aclosing(self._read_notes_batched(candidates)) as batches:
+            async for note, note_content in batches:
                 if not note_content:
                     continue
+                if plan.content_checks:
+                    normalized = normalize_text(note_content)
+                    if any((text in normalized) == negated for text, negated in plan.content_checks):
+                        continue
                 
-                match = False
-                
-                if search_type == "content":
-                    # 내용 검색
-                    if query.lower() in note_content.lower():
-                        match = True
-                elif search_type == "title":
-                    # 제목 검색
-                    if query.lower() in note["name"].lower():
-                        match = True
-                elif search_type == "tag":
-                    # 태그 검색
-                    tags = re.findall(r'#\w+', note_content)
-                    if any(query.lower() in tag.lower() for tag in tags):
-                        match = True
-                elif search_type == "link":
-                    # 링크 검색
-                    links = re.findall(r'\[\[([^\]]+)\]\]', note_content)
-                    if any(query.lower() in link.lower() for link in links):
-                        match = True
-                
-                if match:
-                    # 검색 결과에 컨텍스트 추가
-                    context = self._extract_context(note_content, query)
-                    results.append({
-                        **note,
-                        "context": context,
-                        "match_type": search_type
-                    })
+                context = self._extract_context(note_content, text_terms[0]) if text_terms else ""
+                yield build_result(note, context)
+                found += 1
+                if found >= limit:
+                    break
+    
+    async def _iter_ranked(
+        self,
+        index: SearchIndex,
+        notes: List[Dict[str, Any]],
+        query: str,
+        limit: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """BM25 상위 limit개 노트만 읽어 점수 순으로 내보냄"""
+        notes_by_path = {note["path"]: note for note in notes}
+        ranked = [
+            (notes_by_path[path], score) for path, score in index.rank(query, limit)
+            if path in notes_by_path
+        ]
+        scores = {note["path"]: score for note, score in ranked}
+        
+        async with aclosing(self._read_notes_batched([note for note, _ in ranked])) as batches:
+            async for note, note_content in batches:
+                if not note_content:
+                    continue
+                yield {
+                    **note,
+                    "context": self._extract_context(note_content, query),
+                    "match_type": "content",
+                    "score": round(scores[note["path"]], 4)
+                }
+    
+    def _match_note(self, note: Dict[str, Any], content: str, query: str, search_type: str) -> bool:
+        """본문 스캔 방식의 노트 매칭"""
+        query_lower = query.lower()
+        
+        if search_type == "content":
+            # 내용 검색 (NFC 정규화로 한글 자모 분리 표기도 매칭)
+            return normalize_text(query) in normalize_text(content)
+        elif search_type == "title":
+            # 제목 검색
+            return query_lower in note["name"].lower()
+        elif search_type == "tag":
+            # 태그 검색 (코드 블록 제외)
+            tags = tokenize_markdown(content).tag_names
+            return any(query_lower in f"#{tag}".lower() for tag in tags)
+        elif search_type == "link":
+            # 링크 검색
+            links = tokenize_markdown(content).link_texts
+            return any(query_lower in link.lower() for link in links)
+        
+        return False
+    
+    async def _read_notes_batched(
+        self,
+        notes: List[Dict[str, Any]]
+    ) -> AsyncIterator[Tuple[Dict[str, Any], Optional[str]]]:
+        """
+        노트 본문을 배치 단위로 병렬 읽기
+        
+        read_batch_size개씩 끊어서 최대 read_concurrency개 워커가 나눠 읽고,
+        배치가 끝날 때마다 순서대로 결과를 내보냅니다.
+        """
+        loop = asyncio.get_running_loop()
+        executor = self._get_read_executor()
+        
+        for start in range(0, len(notes), self.read_batch_size):
+            batch = notes[start:start + self.read_batch_size]
+            chunk_size = -(-len(batch) // self.read_concurrency)
+            chunks = [batch[i:i + chunk_size] for i in range(0, len(batch), chunk_size)]
             
-            return results
+            contents = await asyncio.gather(*(
+                loop.run_in_executor(
+                    executor,
+                    self._read_files_sync,
+                    [self._get_full_path(note["path"]) for note in chunk]
+                )
+                for chunk in chunks
+            ))
+            
+            for chunk, chunk_contents in zip(chunks, contents):
+                for note, content in zip(chunk, chunk_contents):
+                    yield note, content
+    
+    def _read_files_sync(self, paths: List[Path]) -> List[Optional[str]]:
+        """워커 스레드에서 여러 파일을 한 번에 읽기 (노트 캐시 경유)"""
+        contents = []
+        for path in paths:
+            try:
+                contents.append(self.note_cache.read(path))
+            except Exception as e:
+                logger.warning(f"노트 읽기 실패 ({path}): {str(e)}")
+                contents.append(None)
+        return contents
+    
+    def _get_read_executor(self) -> ThreadPoolExecutor:
+        if self._read_executor is None:
+            self._read_executor = ThreadPoolExecutor(
+                max_workers=self.read_concurrency,
+                thread_name_prefix="vault-read"
+            )
+        return self._read_executor
+    
+    async def _get_search_index(self, notes: List[Dict[str, Any]]) -> Optional[SearchIndex]:
+        """
+        사용 가능한 검색 색인 조회
+        
+        디스크에 색인이 없으면 백그라운드로 생성을 시작하고 None을 반환하여
+        생성이 끝날 때까지는 병렬 스캔으로 검색합니다.
+        """
+        if self._index_build_task is not None and not self._index_build_task.done():
+            return None
+        
+        if self.search_index is None and not SearchIndex.exists_for(self.vault_path):
+            logger.info("검색 색인이 없어 백그라운드에서 생성합니다.")
+            self._index_build_task = asyncio.create_task(self._refresh_search_index(notes))
+            return None
+        
+        return await self._refresh_search_index(notes)
+    
+    async def _refresh_search_index(self, notes: List[Dict[str, Any]]) -> SearchIndex:
+        """
+        변경된 노트만 다시 읽어 역색인 갱신
+        
+        본문은 잠금 밖에서 배치로 읽고 색인 변경 시에만 _index_lock을 잡으므로, 처음 전체 색인을
+        만드는 동안에도 쓰기 경로의 직접 반영(_apply_note_changes)은 기다리지 않습니다.
+        갱신 도중 직접 반영된 노트는 이전에 읽은 본문으로 덮어쓰지 않습니다.
+        """
+        async with self._index_refresh_lock:
+            if self.search_index is None:
+                loaded = await asyncio.to_thread(get_search_index, self.vault_path)
+                async with self._index_lock:
+                    if self.search_index is None:
+                        self.search_index = loaded
+            index = self.search_index
+            
+            async with self._index_lock:
+                started = self._index_touch_seq
+                stale_notes = index.sync(notes)
             
+            async with aclosing(self._read_notes_batched(stale_notes)) as batches:
+                async for note, content in batches:
+                    async with self._index_lock:
+                        if self._index_touched.get(note["path"], 0) > started:
+                            continue
+                        if content is None:
+                            index.remove_document(note["path"])
+                            continue
+                        index.add_document(note, content)
+            
+            if stale_notes:
+                logger.info(f"검색 색인 갱신: {len(stale_notes)}개 노트")
+        
+        if index.dirty:
+            self._schedule_index_save()
+        return index
+    
+    async def get_changes(self, since: int = 0, limit: int = 1000) -> Dict[str, Any]:
+        """순번 since 이후의 볼트 변경 조회 (변경 저널)"""
+        journal = get_change_journal(self.vault_path)
+        return await asyncio.to_thread(journal.changes, since, limit)
+    
+    async def get_backlinks(self, note_path: str) -> Optional[Dict[str, Any]]:
+        """
+        노트의 백링크와 나가는 링크, 태그 조회 (링크 그래프 조회)
+        
+        Returns:
+            {"note_path", "backlinks", "links", "tags"} (볼트 밖 경로면 None)
+        """
+        relative_path = self._relative_path(self._get_full_path(note_path))
+        if relative_path is None:
+            return None
+        
+        graph, notes_by_path = await self._get_link_graph()
+        return {
+            "note_path": relative_path,
+            "backlinks": self._notes_for(graph.backlinks(relative_path), notes_by_path),
+            "links": graph.outgoing_links(relative_path),
+            "tags": graph.tags_of(relative_path)
+        }
+    
+    async def list_tags(self) -> List[Dict[str, Any]]:
+        """볼트 전체 태그와 태그별 노트 수 (노트 수 내림차순)"""
+        graph, _ = await self._get_link_graph()
+        counts = graph.tag_counts()
+        return [
+            {"tag": tag, "count": count}
+            for tag, count in sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        ]
+    
+    async def get_notes_by_tag(self, tag: str) -> List[Dict[str, Any]]:
+        """태그가 달린 노트 목록"""
+        graph, notes_by_path = await self._get_link_graph()
+        return self._notes_for(graph.notes_with_tag(tag), notes_by_path)
+    
+    async def _get_link_graph(self) -> Tuple[LinkGraph, Dict[str, Dict[str, Any]]]:
+        """
+        최신 링크 그래프 조회
+        
+        그래프는 검색 색인과 같은 한 번의 파싱으로 유지되므로, 검색에 색인을 쓰지 않는
+        설정이어도 색인을 갱신해 사용합니다.
+        """
+        notes = await self.list_notes(recursive=True)
+        index = await self._refresh_search_index(notes)
+        return index.graph, {note["path"]: note for note in notes}
+    
+    @staticmethod
+    def _notes_for(paths: Iterable[str], notes_by_path: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """경로 집합을 경로 순 노트 정보 목록으로 변환"""
+        return [notes_by_path[path] for path in sorted(paths) if path in notes_by_path]
+    
+    async def apply_file_changes(self, paths: Iterable[str]) -> None:
+        """
+        감시자가 전달한 파일 변경을 카탈로그와 검색 색인에 반영
+        
+        Args:
+            paths: 변경된 파일/디렉토리 경로 (절대 경로 또는 볼트 기준 상대 경로)
+        """
+        if not self.vault_path:
+            return
+        
+        relative_paths = [
+            path for path in (self._relative_path(Path(p)) for p in paths)
+            if path is not None
+        ]
+        if not relative_paths:
+            return
+        
+        catalog = get_note_catalog(self.vault_path, self.supported_extensions)
+        changed, removed = await asyncio.to_thread(catalog.apply_changes, relative_paths)
+        await asyncio.to_thread(self._record_external_changes, changed, removed)
+        await self._apply_note_changes(changed, removed)
+    
+    async def poll_file_changes(self) -> None:
+        """폴링으로 파일 변경을 감지하여 반영 (네이티브 감시 불가 시)"""
+        if not self.vault_path:
+            return
+        
+        catalog = get_note_catalog(self.vault_path, self.supported_extensions)
+        changed, removed = await asyncio.to_thread(catalog.poll_changes)
+        await asyncio.to_thread(self._record_external_changes, changed, removed)
+        await self._apply_note_changes(changed, removed)
+    
+    async def flush_indexes(self) -> None:
+        """보류 중인 색인 저장을 즉시 수행"""
+        async with self._index_lock:
+            index = self.search_index
+            if index is not None and index.dirty:
+                await asyncio.to_thread(index.save)
+    
+    async def _save_full_path(
+        self,
+        full_path: Path,
+        content: str,
+        expected_hash: Optional[str],
+        conflict_resolution: str,
+        patch: Optional[SectionPatch] = None,
+        operation: str = "write"
+    ) -> Dict[str, Any]:
+        """경로별 잠금 안에서 해시 확인 후 쓰기, 쓴 경우에만 색인 반영"""
+        async with self._get_write_lock(full_path):
+            result = await asyncio.to_thread(
+                self._save_sync, full_path, content, expected_hash, conflict_resolution, patch, operation
+            )
+        if result.get("conflict"):
+            logger.warning(f"노트 쓰기 충돌 ({conflict_resolution}): {full_path}")
+        if result.get("written"):
+            await self._on_file_written(full_path, content)
+        return result
+    
+    def _get_write_lock(self, full_path: Path) -> asyncio.Lock:
+        """경로별 쓰기 잠금 (사용 중인 동안만 유지)"""
+        lock = self._write_locks.get(str(full_path))
+        if lock is None:
+            lock = asyncio.Lock()
+            self._write_locks[str(full_path)] = lock
+        return lock
+    
+    def _save_sync(
+        self,
+        full_path: Path,
+        content: str,
+        expected_hash: Optional[str],
+        conflict_resolution: str,
+        patch: Optional[SectionPatch],
+        operation: str
+    ) -> Dict[str, Any]:
+        current = self.note_cache.load(full_path)
+        current_hash = current.content_hash if current is not None else None
+        conflict = expected_hash is not None and expected_hash != current_hash
+        
+        if conflict and conflict_resolution == "skip":
+            return {"success": True, "written": False, "conflict": True, "hash": current_hash}
+        if conflict and conflict_resolution != "auto":
+            return {
+                "success": False,
+                "written": False,
+                "conflict": True,
+                "hash": current_hash,
+                "error": "노트가 다른 곳에서 변경되었습니다."
+            }
+        
+        new_hash = content_hash(content)
+        if new_hash == current_hash:
+            # 변경 없는 쓰기는 mtime을 바꾸지 않도록 생략
+            return {"success": True, "written": False, "conflict": conflict, "hash": new_hash}
+        
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        if patch is not None and current is not None and not conflict \
+                and patch.start == patch.end == len(current.content):
+            with open(full_path, 'a', encoding='utf-8') as f:
+                f.write(patch.replacement)
+        elif self.atomic_writes or patch is None or current is None or conflict:
+            self._write_atomic_sync(full_path, content)
+        else:
+            self._write_tail_sync(full_path, current, patch)
+        
+        entry = self.note_cache.put(full_path, content, new_hash)
+        self._record_change(
+            "create" if current is None and operation == "write" else operation,
+            full_path,
+            new_hash,
+            entry.size if entry is not None else None
+        )
+        return {"success": True, "written": True, "conflict": conflict, "hash": new_hash}
+    
+    def _save_batch_sync(self, full_paths: List[Path], items: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        전부 아니면 전무 방식의 일괄 쓰기
+        
+        1) 모든 항목의 해시를 확인하고 2) 바뀌는 항목을 임시 파일에 fsync한 뒤
+        3) 차례로 교체합니다. 교체 중 실패하면 이미 교체한 파일을 원래 내용으로 되돌립니다.
+        """
+        results: List[Dict[str, Any]] = []
+        pending: List[Tuple[Path, str, Optional[ParsedNote], str, Dict[str, Any]]] = []
+        
+        for full_path, item in zip(full_paths, items):
+            current = self.note_cache.load(full_path)
+            current_hash = current.content_hash if current is not None else None
+            expected_hash = item.get("expected_hash")
+            if expected_hash is not None and expected_hash != current_hash:
+                results.append({
+                    "path": item["path"],
+                    "success": False,
+                    "written": False,
+                    "conflict": True,
+                    "hash": current_hash,
+                    "error": "노트가 다른 곳에서 변경되었습니다."
+                })
+                continue
+            
+            new_hash = content_hash(item["content"])
+            written = new_hash != current_hash
+            # 해시는 교체가 끝난 뒤에 새 해시로 갱신
+            result = {"path": item["path"], "success": True, "written": written, "conflict": False, "hash": current_hash}
+            results.append(result)
+            if written:
+                pending.append((full_path, item["content"], current, new_hash, result))
+        
+        if not all(result["success"] for result in results):
+            return self._abort_batch(results, "배치의 다른 항목이 실패하여 쓰지 않았습니다.")
+        
+        temp_paths: List[Path] = []
+        try:
+            for full_path, content, _, _, _ in pending:
+                full_path.parent.mkdir(parents=True, exist_ok=True)
+                temp_paths.append(self._write_temp_sync(full_path, content))
         except Exception as e:
-            logger.error(f"노트 검색 실패: {str(e)}")
-            return []
+            for temp_path in temp_paths:
+                temp_path.unlink(missing_ok=True)
+            return self._abort_batch(results, f"임시 파일 쓰기 실패: {str(e)}")
+        
+        replaced: List[Tuple[Path, Optional[ParsedNote]]] = []
+        try:
+            for (full_path, _, current, _, _), temp_path in zip(pending, temp_paths):
+                replaced.append((full_path, current))
+                self._replace_sync(temp_path, full_path)
+        except Exception as e:
+            for full_path, current in reversed(replaced):
+                try:
+                    if current is None:
+                        full_path.unlink(missing_ok=True)
+                    else:
+                        self._write_atomic_sync(full_path, current.content)
+                except Exception as restore_error:
+                    logger.error(f"일괄 쓰기 원복 실패 ({full_path}): {str(restore_error)}")
+                self.note_cache.invalidate(full_path)
+            for temp_path in temp_paths:
+                temp_path.unlink(missing_ok=True)
+            return self._abort_batch(results, f"파일 교체 실패: {str(e)}")
+        
+        for full_path, content, current, new_hash, result in pending:
+            result["hash"] = new_hash
+            entry = self.note_cache.put(full_path, content, new_hash)
+            self._record_change(
+                "create" if current is None else "write",
+                full_path,
+                new_hash,
+                entry.size if entry is not None else None
+            )
+        return {"success": True, "results": results}
+    
+    @staticmethod
+    def _abort_batch(results: List[Dict[str, Any]], error: str) -> Dict[str, Any]:
+        """일괄 쓰기 취소 - 실패하지 않은 항목도 쓰지 않은 것으로 표시"""
+        for result in results:
+            if result["success"]:
+                result.update(success=False, written=False, error=error)
+        return {"success": False, "error": error, "results": results}
+    
+    def _record_change(
+        self,
+        operation: str,
+        full_path: Path,
+        content_digest: Optional[str] = None,
+        size: Optional[int] = None
+    ) -> None:
+        """변경 저널 기록 (track_changes 설정)"""
+        if not self.track_changes or self.vault_path is None:
+            return
+        relative_path = self._relative_path(full_path)
+        if relative_path is None:
+            return
+        try:
+            get_change_journal(self.vault_path).append(operation, relative_path, content_digest, size)
+        except Exception as e:
+            logger.warning(f"변경 저널 기록 실패: {str(e)}")
+    
+    def _record_external_changes(self, changed: List[Dict[str, Any]], removed: List[str]) -> None:
+        """감시자가 감지한 외부 변경 기록"""
+        if not self.track_changes or (not changed and not removed):
+            return
+        try:
+            journal = get_change_journal(self.vault_path)
+            for note in changed:
+                journal.append("external_write", note["path"], size=note["size"])
+            for path in removed:
+                journal.append("external_delete", path)
+        except Exception as e:
+            logger.warning(f"변경 저널 기록 실패: {str(e)}")
+    
+    @classmethod
+    def _write_atomic_sync(cls, full_path: Path, content: str) -> None:
+        """임시 파일에 쓰고 fsync 후 교체 (중간에 실패해도 원본 유지)"""
+        temp_path = cls._write_temp_sync(full_path, content)
+        try:
+            cls._replace_sync(temp_path, full_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+    
+    @staticmethod
+    def _write_temp_sync(full_path: Path, content: str) -> Path:
+        """대상 옆 임시 파일에 쓰고 fsync (원본 권한 유지)"""
+        temp_path = full_path.with_name(f".{full_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            mode = stat.S_IMODE(os.stat(full_path).st_mode)
+        except FileNotFoundError:
+            mode = None
+        
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            if mode is not None:
+                os.chmod(temp_path, mode)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        return temp_path
+    
+    @staticmethod
+    def _replace_sync(temp_path: Path, full_path: Path) -> None:
+        """임시 파일로 대상 교체 후 디렉토리 fsync"""
+        os.replace(temp_path, full_path)
+        
+        if hasattr(os, "O_DIRECTORY"):
+            # 이름 교체까지 디스크에 반영
+            dir_fd = os.open(full_path.parent, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+    
+    @staticmethod
+    def _read_range_sync(full_path: Path, offset: int, length: Optional[int]) -> Dict[str, Any]:
+        with open(full_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            start = min(max(offset, 0), size)
+            end = size if length is None else min(size, start + max(length, 0))
+            
+            if size >= MMAP_MIN_SIZE:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    start, end = _align_utf8_range(view, start, end, length)
+                    data = view[start:end]
+            else:
+                buffer = f.read()
+                start, end = _align_utf8_range(buffer, start, end, length)
+                data = buffer[start:end]
+        
+        return {
+            "content": data.decode('utf-8', errors='replace'),
+            "offset": start,
+            "length": end - start,
+            "size": size,
+            "next_offset": end if end < size else None
+        }
+    
+    @staticmethod
+    def _write_tail_sync(full_path: Path, note: ParsedNote, patch: SectionPatch) -> None:
+        """패치 위치부터 끝까지만 덮어쓰기 (atomic_writes 비활성화 시)"""
+        content = note.content
+        # 본문 오프셋(문자)을 파일 바이트 오프셋으로 변환 - 줄바꿈 변환(CRLF)이 있었으면 전체 쓰기
+        offset = len(content[:patch.start].encode('utf-8'))
+        old_tail = content[patch.start:].encode('utf-8')
+        new_tail = (patch.replacement + content[patch.end:]).encode('utf-8')
+        with open(full_path, 'r+b') as f:
+            if offset + len(old_tail) != note.size:
+                offset, new_tail = 0, apply_patch(content, patch).encode('utf-8')
+            f.seek(offset)
+            f.write(new_tail)
+            f.truncate()
+    
+    async def _on_file_written(self, full_path: Path, content: Optional[str]) -> None:
+        """쓰기/삭제한 파일을 감시자 이벤트를 기다리지 않고 즉시 반영"""
+        relative_path = self._relative_path(full_path)
+        if relative_path is None:
+            return
+        
+        catalog = get_note_catalog(self.vault_path, self.supported_extensions)
+        changed, removed = await asyncio.to_thread(catalog.apply_changes, [relative_path])
+        contents = {relative_path: content} if content is not None else None
+        await self._apply_note_changes(changed, removed, contents)
+    
+    async def _apply_note_changes(
+        self,
+        changed: List[Dict[str, Any]],
+        removed: List[str],
+        contents: Optional[Dict[str, str]] = None
+    ) -> None:
+        """카탈로그 변경분을 검색 백엔드와 검색 색인(링크 그래프 포함)에 반영"""
+        if not changed and not removed:
+            return
+        
+        await self.search_backend.apply_changes(changed, removed, contents)
+        
+        index = self.search_index
+        if index is None:
+            # 색인이 아직 로드되지 않았으면 다음 검색에서 mtime 비교로 동기화됨
+            return
+        
+        # 본문은 잠금 밖에서 준비
+        async with self._index_lock:
+            pending = [note for note in changed if index.is_stale(note)]
+        documents = []
+        for note in pending:
+            content = contents.get(note["path"]) if contents else None
+            if content is None:
+                content = await self.read_note(note["path"])
+            documents.append((note, content))
+        
+        async with self._index_lock:
+            for path in removed:
+                self._touch_index_path(path)
+                index.remove_document(path)
+            
+            for note, content in documents:
+                self._touch_index_path(note["path"])
+                if content is None:
+                    index.remove_document(note["path"])
+                    continue
+                index.add_document(note, content)
+        
+        if index.dirty:
+            self._schedule_index_save()
+    
+    def _touch_index_path(self, path: str) -> None:
+        """직접 반영 순번 기록 (_index_lock 안에서 호출)"""
+        self._index_touch_seq += 1
+        self._index_touched[path] = self._index_touch_seq
+    
+    def _schedule_index_save(self) -> None:
+        """연속 변경을 묶어 일정 시간 뒤 한 번만 색인 저장"""
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.create_task(self._save_index_later())
+    
+    async def _save_index_later(self) -> None:
+        await asyncio.sleep(self.index_save_delay)
+        await self.flush_indexes()
+    
+    async def get_vault_generation(self) -> Optional[Tuple[str, int]]:
+        """볼트 구조 세대 (epoch, generation) - 볼트가 없으면 None"""
+        if not self.vault_path or not self.vault_path.exists():
+            return None
+        catalog = await self._refresh_catalog()
+        return catalog.epoch, catalog.generation
     
     async def get_vault_structure(self) -> Dict[str, Any]:
         """볼트 구조 조회"""
@@ -189,36 +1103,33 @@ class VaultManager:
             if not self.vault_path or not self.vault_path.exists():
                 return {"error": "볼트 경로가 설정되지 않았거나 존재하지 않습니다."}
             
+            catalog = await self._refresh_catalog()
+            
+            # 목록보다 먼저 세대를 읽으므로 그 사이의 변경은 다음 변경분 조회에 다시 포함됨
             structure = {
                 "vault_path": str(self.vault_path),
+                "epoch": catalog.epoch,
+                "generation": catalog.generation,
                 "total_notes": 0,
                 "directories": {},
                 "files": []
             }
             
             # 디렉토리 구조 생성
-            for item in self.vault_path.rglob("*"):
-                if item.is_file() and item.suffix in self.supported_extensions:
-                    structure["total_notes"] += 1
-                    
-                    relative_path = item.relative_to(self.vault_path)
-                    path_parts = relative_path.parts
-                    
-                    # 디렉토리 구조에 추가
-                    current = structure["directories"]
-                    for part in path_parts[:-1]:  # 파일명 제외
-                        if part not in current:
-                            current[part] = {"type": "directory", "children": {}}
-                        current = current[part]["children"]
-                    
-                    # 파일 정보 추가
-                    file_info = {
-                        "name": item.name,
-                        "path": str(relative_path),
-                        "size": item.stat().st_size,
-                        "modified": item.stat().st_mtime
-                    }
-                    structure["files"].append(file_info)
+            for note in catalog.list_notes("", recursive=True):
+                structure["total_notes"] += 1
+                
+                path_parts = Path(note["path"]).parts
+                
+                # 디렉토리 구조에 추가
+                current = structure["directories"]
+                for part in path_parts[:-1]:  # 파일명 제외
+                    if part not in current:
+                        current[part] = {"type": "directory", "children": {}}
+                    current = current[part]["children"]
+                
+                # 파일 정보 추가
+                structure["files"].append(self._file_info(note))
             
             return structure
             
@@ -226,6 +1137,48 @@ class VaultManager:
             logger.error(f"볼트 구조 조회 실패: {str(e)}")
             return {"error": str(e)}
     
+    async def get_vault_structure_delta(self, since: int, epoch: Optional[str] = None) -> Dict[str, Any]:
+        """
+        세대 since 이후 볼트 구조 변경분 조회
+        
+        Args:
+            since: 클라이언트가 마지막으로 받은 세대
+            epoch: 그 세대를 받은 카탈로그 식별자 (다르면 reset)
+        
+        Returns:
+            added/modified 파일 정보와 removed 경로 (reset이면 전체 구조를 다시 조회)
+        """
+        try:
+            if not self.vault_path or not self.vault_path.exists():
+                return {"error": "볼트 경로가 설정되지 않았거나 존재하지 않습니다."}
+            
+            catalog = await self._refresh_catalog()
+            delta = catalog.changes_since(since, epoch)
+            delta["added"] = [self._file_info(note) for note in delta["added"]]
+            delta["modified"] = [self._file_info(note) for note in delta["modified"]]
+            return {"vault_path": str(self.vault_path), **delta}
+            
+        except Exception as e:
+            logger.error(f"볼트 구조 변경분 조회 실패: {str(e)}")
+            return {"error": str(e)}
+    
+    @staticmethod
+    def _file_info(note: Dict[str, Any]) -> Dict[str, Any]:
+        """볼트 구조의 파일 정보 형식"""
+        return {
+            "name": os.path.basename(note["path"]),
+            "path": note["path"],
+            "size": note["size"],
+            "modified": note["modified"]
+        }
+    
+    def _relative_path(self, full_path: Path) -> Optional[str]:
+        """볼트 기준 상대 경로 (볼트 밖이면 None)"""
+        relative_path = os.path.relpath(full_path, self.vault_path)
+        if relative_path.startswith(os.pardir):
+            return None
+        return relative_path
+    
     def _get_full_path(self, note_path: str) -> Path:
         """전체 경로 생성"""
         if not self.vault_path:
@@ -261,3 +1214,23 @@ class VaultManager:
             context = context + "..."
         
         return context
+
+
+def write_text_atomic(full_path: Path, content: str) -> None:
+    """VaultManager 밖의 도구용 원자적 쓰기 (임시 파일에 쓰고 fsync 후 교체)"""
+    full_path.parent.mkdir(parents=True, exist_ok=True)
+    VaultManager._write_atomic_sync(full_path, content)
+
+
+def _align_utf8_range(buffer, start: int, end: int, length: Optional[int]) -> Tuple[int, int]:
+    """범위 양 끝을 UTF-8 문자 시작 위치로 당김 (길이를 지정했는데 비면 문자 하나는 포함)"""
+    size = len(buffer)
+    while 0 < start < size and buffer[start] & 0xC0 == 0x80:
+        start -= 1
+    while start < end < size and buffer[end] & 0xC0 == 0x80:
+        end -= 1
+    if end == start and start < size and length:
+        end += 1
+        while end < size and buffer[end] & 0xC0 == 0x80:
+            end += 1
+    return start, end
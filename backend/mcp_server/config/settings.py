@@ -33,6 +33,12 @@ def get_log_file_path() -> str:
         print(f"로그 파일 경로 설정 실패: {e}")
         return "logs/ai_engine.log"
 
+def get_cache_dir_path() -> str:
+    """AI 응답 캐시 디렉토리 경로 (로그 폴더와 같은 위치 기준)"""
+    if getattr(sys, 'frozen', False):
+        return str(Path(os.path.dirname(sys.executable)) / "cache" / "ai_responses")
+    return str(Path(__file__).parent.parent.parent.parent / "cache" / "ai_responses")
+
 class AICoreSettings(BaseSettings):
     """AI Core 설정"""
     
@@ -44,6 +50,31 @@ class AICoreSettings(BaseSettings):
     # AI Request Mode
     ai_request_mode: str = "mcp"  # "direct" or "mcp"
     
+    # AI 제공자 HTTP 연결 풀
+    http2: bool = True
+    http_max_connections: int = 20
+    http_max_keepalive_connections: int = 10
+    http_keepalive_expiry: float = 60.0  # 초
+    http_timeout: float = 30.0  # 초
+    http_connect_timeout: float = 10.0  # 초
+    prewarm_connections: bool = True  # 시작 시 제공자 연결 미리 열기
+    coalesce_requests: bool = True  # 진행 중인 동일 요청은 제공자 호출 하나로 병합
+    
+    # AI 제공자 재시도 / 서킷 브레이커
+    retry_max_attempts: int = 3  # 첫 시도 포함
+    retry_base_delay: float = 0.5  # 초, 시도마다 두 배
+    retry_max_delay: float = 20.0  # 초, Retry-After가 이보다 길면 재시도하지 않음
+    circuit_failure_threshold: int = 5  # 연속 실패 횟수
+    circuit_recovery_timeout: float = 30.0  # 초, 이후 half-open 확인 요청 허용
+    circuit_half_open_max_calls: int = 1
+    
+    # AI 응답 캐시 (메모리 LRU + 디스크)
+    response_cache_enabled: bool = True
+    response_cache_memory_entries: int = 256
+    response_cache_ttl: float = 24 * 3600  # 초
+    response_cache_disk_max_bytes: int = 100 * 1024 * 1024
+    response_cache_dir: Optional[str] = get_cache_dir_path()  # 비우면 메모리만 사용
+    
     # Logging
     log_level: str = "INFO"
     log_file: str = get_log_file_path()
@@ -6,9 +6,18 @@ MCP 엔진과 관련 매니저들을 관리합니다.
 from .mcp_engine import MCPEngine
 from .provider_manager import AIProviderManager
 from .prompt_manager import PromptManager
+from .response_cache import ResponseCache, get_response_cache
+from .single_flight import SingleFlight
+from .resilience import CircuitBreaker, CircuitOpenError, RetryPolicy
 
 __all__ = [
     "MCPEngine",
     "AIProviderManager",
-    "PromptManager"
+    "PromptManager",
+    "ResponseCache",
+    "get_response_cache",
+    "SingleFlight",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "RetryPolicy"
 ]
@@ -3,11 +3,13 @@ MCP 엔진 핵심 모듈
 다양한 AI API를 통합하여 MCP 도구에서 사용합니다.
 """
 import asyncio
-from typing import Dict, Any, Optional
+from contextlib import aclosing
+from typing import Dict, Any, Optional, AsyncIterator
 from loguru import logger
 
 from .provider_manager import AIProviderManager
 from .prompt_manager import PromptManager
+from .response_cache import ResponseCache, get_response_cache
 from ..processors.response_processor import ResponseProcessor
 from ..models.enums import OutputFormat, AIProvider
 from ..utils import (
@@ -25,6 +27,8 @@ class MCPEngine:
         self.provider_manager = AIProviderManager()
         self.prompt_manager = PromptManager()
         self.response_processor = ResponseProcessor()
+        # 같은 요청의 응답 재사용 (response_cache_enabled가 꺼져 있으면 None)
+        self.response_cache: Optional[ResponseCache] = get_response_cache()
     
     @measure_time
     async def generate_response(
@@ -34,7 +38,9 @@ class MCPEngine:
         provider: AIProvider = AIProvider.PERPLEXITY,
         model: str = "gpt-4",
         api_key: Optional[str] = None,
-        language: Optional[str] = None
+        language: Optional[str] = None,
+        bypass_cache: bool = False,
+        refresh_cache: bool = False
     ) -> Dict[str, Any]:
         """
         AI 응답 생성
@@ -44,9 +50,11 @@ class MCPEngine:
             output_format: 출력 형식 (text, document)
             provider: AI 제공자
             language: 프로그래밍 언어
+            bypass_cache: 응답 캐시를 읽지도 저장하지도 않음
+            refresh_cache: 캐시를 읽지 않고 새로 생성한 응답으로 갱신
         
         Returns:
-            AI 응답 딕셔너리
+            AI 응답 딕셔너리 (cached: 캐시에서 반환했는지 여부)
         """
         start_time = asyncio.get_event_loop().time()
         
@@ -60,6 +68,12 @@ class MCPEngine:
                 prompt, output_format, language
             )
             
+            # 캐시 조회
+            cache_key = self._cache_key(provider, model, output_format, formatted_prompt)
+            cached = await self._get_cached(cache_key, bypass_cache or refresh_cache)
+            if cached is not None:
+                return {**format_success_response(cached, output_format.value, provider.value), "cached": True}
+            
             # AI API 호출
             response = await self.provider_manager.call_provider(
                 provider, formatted_prompt, api_key, model
@@ -74,12 +88,138 @@ class MCPEngine:
             duration = asyncio.get_event_loop().time() - start_time
             log_api_call(provider.value, True, duration, len(prompt))
             
-            return format_success_response(
-                processed_response, output_format.value, provider.value
-            )
+            if not bypass_cache:
+                await self._store_cached(cache_key, processed_response, provider, model, output_format)
+            
+            return {
+                **format_success_response(processed_response, output_format.value, provider.value),
+                "cached": False
+            }
             
         except Exception as e:
             duration = asyncio.get_event_loop().time() - start_time
             log_api_call(provider.value, False, duration, len(prompt))
             logger.error(f"AI 응답 생성 실패: {str(e)}")
             return format_error_response(str(e), provider.value)
+    
+    async def stream_response(
+        self,
+        prompt: str,
+        output_format: OutputFormat,
+        provider: AIProvider = AIProvider.PERPLEXITY,
+        model: str = "gpt-4",
+        api_key: Optional[str] = None,
+        language: Optional[str] = None,
+        bypass_cache: bool = False,
+        refresh_cache: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        AI 응답 스트리밍 생성
+        
+        생성되는 텍스트 조각을 {"type": "delta"} 이벤트로 즉시 내보내고,
+        마지막에 후처리된 전체 응답을 담은 {"type": "done"} 또는 {"type": "error"} 이벤트를 보냅니다.
+        캐시에 있으면 전체 응답을 한 조각으로 바로 보냅니다.
+        """
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        first_token_time = None
+        chunks = []
+        
+        try:
+            # API 키 유효성 검사
+            if not validate_api_key(api_key):
+                yield {"type": "error", **format_error_response("API 키가 유효하지 않습니다.", provider.value)}
+                return
+            
+            # 프롬프트 템플릿 적용
+            formatted_prompt = self.prompt_manager.format_prompt(
+                prompt, output_format, language
+            )
+            
+            # 캐시 조회
+            cache_key = self._cache_key(provider, model, output_format, formatted_prompt)
+            cached = await self._get_cached(cache_key, bypass_cache or refresh_cache)
+            if cached is not None:
+                yield {"type": "delta", "content": cached}
+                yield {
+                    "type": "done",
+                    **format_success_response(cached, output_format.value, provider.value),
+                    "cached": True
+                }
+                return
+            
+            # AI API 스트리밍 호출
+            async with aclosing(self.provider_manager.stream_provider(
+                provider, formatted_prompt, api_key, model
+            )) as deltas:
+                async for delta in deltas:
+                    if first_token_time is None:
+                        first_token_time = loop.time() - start_time
+                    chunks.append(delta)
+                    yield {"type": "delta", "content": delta}
+            
+            # 응답 후처리 (전체 응답 기준)
+            processed_response = self.response_processor.process_response(
+                "".join(chunks), output_format
+            )
+            
+            duration = loop.time() - start_time
+            log_api_call(provider.value, True, duration, len(prompt))
+            if first_token_time is not None:
+                logger.debug(f"첫 토큰까지 {first_token_time:.2f}s ({provider.value})")
+            
+            if not bypass_cache:
+                await self._store_cached(cache_key, processed_response, provider, model, output_format)
+            
+            yield {
+                "type": "done",
+                **format_success_response(processed_response, output_format.value, provider.value),
+                "cached": False
+            }
+            
+        except Exception as e:
+            duration = loop.time() - start_time
+            log_api_call(provider.value, False, duration, len(prompt))
+            logger.error(f"AI 응답 스트리밍 실패: {str(e)}")
+            yield {"type": "error", **format_error_response(str(e), provider.value)}
+    
+    def get_response_cache_stats(self) -> Dict[str, Any]:
+        """응답 캐시 적중률 통계"""
+        if self.response_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.response_cache.stats()}
+    
+    async def clear_response_cache(self) -> int:
+        """응답 캐시 비우기"""
+        if self.response_cache is None:
+            return 0
+        return await self.response_cache.clear()
+    
+    @staticmethod
+    def _cache_key(provider: AIProvider, model: str, output_format: OutputFormat, formatted_prompt: str) -> str:
+        return ResponseCache.make_key(provider.value, model, output_format.value, formatted_prompt)
+    
+    async def _get_cached(self, cache_key: str, skip: bool) -> Optional[str]:
+        """캐시된 응답 (skip이면 조회하지 않고 우회 횟수만 집계)"""
+        if self.response_cache is None:
+            return None
+        if skip:
+            self.response_cache.record_bypass()
+            return None
+        return await self.response_cache.get(cache_key)
+    
+    async def _store_cached(
+        self,
+        cache_key: str,
+        content: str,
+        provider: AIProvider,
+        model: str,
+        output_format: OutputFormat
+    ) -> None:
+        if self.response_cache is None or not content:
+            return
+        await self.response_cache.put(
+            cache_key,
+            content,
+            {"provider": provider.value, "model": model, "format": output_format.value}
+        )
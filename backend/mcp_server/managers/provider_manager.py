@@ -1,20 +1,68 @@
 """
 AI 제공자 관리 클래스
 """
-from typing import Optional
+import asyncio
+import hashlib
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 from ..models.enums import AIProvider
-from ..providers import OpenAIProvider, AnthropicProvider, PerplexityProvider
+from ..config.settings import settings
+from ..providers import OpenAIProvider, AnthropicProvider, PerplexityProvider, HTTPClientPool
+from .single_flight import SingleFlight
+from .resilience import CircuitBreaker, RetryPolicy, is_retryable
 from loguru import logger
 
 class AIProviderManager:
     """AI 제공자 관리 클래스"""
     
-    def __init__(self):
+    def __init__(self, client_pool: Optional[HTTPClientPool] = None):
+        # 제공자/기본 URL별 keep-alive 연결을 공유하는 클라이언트 풀
+        self.client_pool = client_pool or HTTPClientPool()
         self.providers = {
-            AIProvider.PERPLEXITY: PerplexityProvider(),
-            AIProvider.OPENAI: OpenAIProvider(),
-            AIProvider.ANTHROPIC: AnthropicProvider()
+            AIProvider.PERPLEXITY: PerplexityProvider(self.client_pool),
+            AIProvider.OPENAI: OpenAIProvider(self.client_pool),
+            AIProvider.ANTHROPIC: AnthropicProvider(self.client_pool)
         }
+        self._prewarm_task: Optional[asyncio.Task] = None
+        # 동시에 들어온 동일 요청을 하나의 제공자 호출로 병합
+        self.single_flight = SingleFlight()
+        # 일시적 오류 재시도와 제공자별 서킷 브레이커
+        self.retry_policy = RetryPolicy()
+        self.breakers = {provider: CircuitBreaker(provider.value) for provider in self.providers}
+    
+    async def open(self, prewarm: Optional[bool] = None) -> None:
+        """
+        제공자별 클라이언트 생성 (앱 시작 시)
+        
+        prewarm(기본값: prewarm_connections 설정)이면 시작을 막지 않도록 백그라운드에서 연결을 미리 엽니다.
+        """
+        for provider_instance in self.providers.values():
+            provider_instance.get_client()
+        
+        if prewarm if prewarm is not None else settings.prewarm_connections:
+            self._prewarm_task = asyncio.create_task(self.prewarm())
+    
+    async def prewarm(self) -> Dict[str, bool]:
+        """모든 제공자 연결 미리 열기"""
+        return await self.client_pool.prewarm(
+            (provider_instance.name, provider_instance.api_url)
+            for provider_instance in self.providers.values()
+        )
+    
+    async def aclose(self) -> None:
+        """클라이언트와 연결 닫기 (앱 종료 시)"""
+        if self._prewarm_task is not None and not self._prewarm_task.done():
+            self._prewarm_task.cancel()
+        self._prewarm_task = None
+        await self.client_pool.aclose()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """연결 풀 상태와 요청 병합 통계"""
+        return {**self.client_pool.stats(), "single_flight": self.single_flight.stats()}
+    
+    def get_health(self) -> Dict[str, Dict[str, Any]]:
+        """제공자별 서킷 브레이커 상태"""
+        return {provider.value: breaker.snapshot() for provider, breaker in self.breakers.items()}
     
     async def call_provider(
         self,
@@ -33,11 +81,139 @@ class AIProviderManager:
             model: 모델명
         
         Returns:
-            AI 응답
+            AI 응답 (같은 요청이 진행 중이면 그 결과를 공유)
+        
+        Raises:
+            CircuitOpenError: 제공자 서킷이 열려 있는 경우
         """
         try:
-            provider_instance = self.providers[provider]
-            return await provider_instance.call_api(prompt, api_key, model)
+            if not settings.coalesce_requests:
+                return await self._call_with_retry(provider, prompt, api_key, model)
+            return await self.single_flight.do(
+                self._request_key(provider, prompt, api_key, model),
+                lambda: self._call_with_retry(provider, prompt, api_key, model)
+            )
         except Exception as e:
             logger.error(f"AI 제공자 호출 실패 ({provider.value}): {str(e)}")
             raise
+    
+    async def stream_provider(
+        self,
+        provider: AIProvider,
+        prompt: str,
+        api_key: Optional[str] = None,
+        model: str = "gpt-4"
+    ) -> AsyncIterator[str]:
+        """
+        AI 제공자 스트리밍 호출
+        
+        Returns:
+            생성된 텍스트 조각(delta) 스트림 (같은 요청이 진행 중이면 그 스트림을 처음부터 공유)
+        """
+        try:
+            if settings.coalesce_requests:
+                source = self.single_flight.stream(
+                    self._request_key(provider, prompt, api_key, model),
+                    lambda: self._stream_with_retry(provider, prompt, api_key, model)
+                )
+            else:
+                source = self._stream_with_retry(provider, prompt, api_key, model)
+            async with aclosing(source) as deltas:
+                async for delta in deltas:
+                    yield delta
+        except Exception as e:
+            logger.error(f"AI 제공자 스트리밍 실패 ({provider.value}): {str(e)}")
+            raise
+    
+    async def _call_with_retry(
+        self,
+        provider: AIProvider,
+        prompt: str,
+        api_key: Optional[str],
+        model: str
+    ) -> str:
+        """서킷 확인 후 호출하고, 일시적 오류면 백오프 후 재시도"""
+        provider_instance = self.providers[provider]
+        breaker = self.breakers[provider]
+        attempt = 0
+        while True:
+            attempt += 1
+            probe = breaker.acquire()
+            try:
+                result = await provider_instance.call_api(prompt, api_key, model)
+            except Exception as e:
+                delay = self._after_failure(provider, breaker, probe, attempt, e)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                breaker.release(probe)
+                raise
+            breaker.record_success(probe)
+            return result
+    
+    async def _stream_with_retry(
+        self,
+        provider: AIProvider,
+        prompt: str,
+        api_key: Optional[str],
+        model: str
+    ) -> AsyncIterator[str]:
+        """스트리밍 호출 (첫 조각을 받기 전에 실패한 경우에만 재시도하여 중복 전송 방지)"""
+        provider_instance = self.providers[provider]
+        breaker = self.breakers[provider]
+        attempt = 0
+        while True:
+            attempt += 1
+            probe = breaker.acquire()
+            started = False
+            try:
+                async with aclosing(provider_instance.stream_api(prompt, api_key, model)) as deltas:
+                    async for delta in deltas:
+                        started = True
+                        yield delta
+            except Exception as e:
+                delay = self._after_failure(provider, breaker, probe, attempt, e, can_retry=not started)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                breaker.release(probe)
+                raise
+            breaker.record_success(probe)
+            return
+    
+    def _after_failure(
+        self,
+        provider: AIProvider,
+        breaker: CircuitBreaker,
+        probe: bool,
+        attempt: int,
+        error: Exception,
+        can_retry: bool = True
+    ) -> Optional[float]:
+        """실패를 서킷에 기록하고 재시도 전 대기 시간 반환 (재시도하지 않으면 None)"""
+        if not is_retryable(error):
+            # 잘못된 요청/키 오류는 제공자 장애가 아니므로 서킷에 집계하지 않음
+            breaker.release(probe)
+            return None
+        
+        breaker.record_failure(error, probe)
+        if not can_retry or breaker.state == CircuitBreaker.OPEN:
+            return None
+        
+        delay = self.retry_policy.get_delay(attempt, error)
+        if delay is not None:
+            logger.warning(
+                f"AI 제공자 재시도 ({provider.value}, {attempt}/{self.retry_policy.max_attempts}) "
+                f"{delay:.2f}초 후: {str(error)}"
+            )
+        return delay
+    
+    @staticmethod
+    def _request_key(provider: AIProvider, prompt: str, api_key: Optional[str], model: str) -> Tuple[str, str, str, str]:
+        """요청 병합 키 (API 키가 다르면 별도 호출)"""
+        key_hash = hashlib.sha256((api_key or "").encode('utf-8')).hexdigest()
+        return (provider.value, model, key_hash, prompt)
@@ -0,0 +1,245 @@
+"""
+AI 제공자 재시도와 서킷 브레이커
+429/5xx/연결 오류는 지수 백오프(지터 포함)로 재시도하되 Retry-After와 rate limit 헤더를 따르고,
+연속 실패한 제공자는 서킷을 열어 타임아웃까지 기다리지 않고 바로 실패시킨 뒤 half-open 요청으로 복구를 확인합니다.
+"""
+import random
+import re
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+import httpx
+import openai
+from loguru import logger
+
+from ..config.settings import settings
+
+# 재시도할 HTTP 상태 (529: Anthropic overloaded)
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504, 529}
+
+# (남은 요청 수 헤더, 초기화 시각 헤더)
+RATE_LIMIT_HEADERS = (
+    ("x-ratelimit-remaining-requests", "x-ratelimit-reset-requests"),
+    ("x-ratelimit-remaining-tokens", "x-ratelimit-reset-tokens"),
+    ("anthropic-ratelimit-requests-remaining", "anthropic-ratelimit-requests-reset"),
+    ("anthropic-ratelimit-tokens-remaining", "anthropic-ratelimit-tokens-reset"),
+    ("anthropic-ratelimit-input-tokens-remaining", "anthropic-ratelimit-input-tokens-reset"),
+    ("anthropic-ratelimit-output-tokens-remaining", "anthropic-ratelimit-output-tokens-reset"),
+)
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 제공자를 호출하지 않음"""
+
+    def __init__(self, provider: str, retry_after: float):
+        self.provider = provider
+        self.retry_after = retry_after
+        super().__init__(
+            f"{provider} 제공자 오류가 계속되어 요청을 잠시 차단했습니다 (약 {max(1, round(retry_after))}초 후 다시 시도)"
+        )
+
+
+def error_response(error: BaseException) -> Optional[httpx.Response]:
+    """예외에 담긴 HTTP 응답 (httpx, openai SDK 공통)"""
+    response = getattr(error, "response", None)
+    return response if isinstance(response, httpx.Response) else None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """일시적인 제공자 오류인지 여부 (429, 5xx, 연결/타임아웃)"""
+    if isinstance(error, (httpx.TransportError, openai.APIConnectionError)):
+        return True
+    response = error_response(error)
+    return response is not None and response.status_code in RETRYABLE_STATUS
+
+
+def parse_retry_after(headers: httpx.Headers, now: Optional[float] = None) -> Optional[float]:
+    """
+    응답 헤더가 요구하는 대기 시간 (초)
+
+    retry-after-ms, Retry-After(초 또는 HTTP 날짜) 순으로 보고, 없으면 남은 한도가 0인
+    rate limit 헤더의 초기화 시각 중 가장 늦은 것을 사용합니다.
+    """
+    now = time.time() if now is None else now
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return max(0.0, float(value) / 1000)
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if value:
+        wait = _parse_reset(value, now)
+        if wait is not None:
+            return wait
+
+    waits = []
+    for remaining_header, reset_header in RATE_LIMIT_HEADERS:
+        remaining = headers.get(remaining_header)
+        reset = headers.get(reset_header)
+        if reset and remaining is not None and remaining.strip() == "0":
+            wait = _parse_reset(reset, now)
+            if wait is not None:
+                waits.append(wait)
+    return max(waits) if waits else None
+
+
+def _parse_reset(value: str, now: float) -> Optional[float]:
+    """초, 기간("6m0s", "20ms"), RFC 3339 또는 HTTP 날짜를 남은 초로 변환"""
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    parts = _DURATION_PART.findall(value)
+    if parts and "".join(number + unit for number, unit in parts) == value:
+        return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+
+    try:
+        moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            moment = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return max(0.0, moment.timestamp() - now)
+
+
+class RetryPolicy:
+    """지수 백오프 + full jitter 재시도 정책"""
+
+    def __init__(
+        self,
+        max_attempts: Optional[int] = None,
+        base_delay: Optional[float] = None,
+        max_delay: Optional[float] = None
+    ):
+        self.max_attempts = max(1, max_attempts or settings.retry_max_attempts)
+        self.base_delay = base_delay if base_delay is not None else settings.retry_base_delay
+        self.max_delay = max_delay if max_delay is not None else settings.retry_max_delay
+
+    def get_delay(self, attempt: int, error: BaseException) -> Optional[float]:
+        """
+        attempt번째 시도 실패 후 기다릴 시간 (재시도하지 않으면 None)
+
+        서버가 요구한 대기 시간이 있으면 그보다 짧게 기다리지 않고, max_delay보다 길면 포기합니다.
+        """
+        if attempt >= self.max_attempts or not is_retryable(error):
+            return None
+
+        backoff = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+        response = error_response(error)
+        hint = parse_retry_after(response.headers) if response is not None else None
+        if hint is None:
+            return backoff
+        if hint > self.max_delay:
+            return None
+        # 같은 시각에 몰리지 않도록 요구 시간 뒤에 약간의 지터 추가
+        return hint + random.uniform(0, min(self.base_delay, self.max_delay - hint))
+
+
+class CircuitBreaker:
+    """제공자별 서킷 브레이커 (closed → open → half_open → closed)"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: Optional[int] = None,
+        recovery_timeout: Optional[float] = None,
+        half_open_max_calls: Optional[int] = None
+    ):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold or settings.circuit_failure_threshold)
+        self.recovery_timeout = recovery_timeout if recovery_timeout is not None else settings.circuit_recovery_timeout
+        self.half_open_max_calls = max(1, half_open_max_calls or settings.circuit_half_open_max_calls)
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.last_error: Optional[str] = None
+        self._probes = 0
+        self.opened_count = 0
+        self.rejected = 0
+
+    def acquire(self) -> bool:
+        """
+        호출 허용 여부 확인
+
+        Returns:
+            half-open 확인 요청인지 여부 (결과 기록 시 그대로 전달)
+
+        Raises:
+            CircuitOpenError: 서킷이 열려 있거나 확인 요청이 이미 진행 중인 경우
+        """
+        if self.state == self.OPEN:
+            remaining = self.opened_at + self.recovery_timeout - time.monotonic()
+            if remaining > 0:
+                self.rejected += 1
+                raise CircuitOpenError(self.name, remaining)
+            self.state = self.HALF_OPEN
+            self._probes = 0
+            logger.info(f"서킷 half-open ({self.name}): 확인 요청 허용")
+
+        if self.state == self.HALF_OPEN:
+            if self._probes >= self.half_open_max_calls:
+                self.rejected += 1
+                raise CircuitOpenError(self.name, 1.0)
+            self._probes += 1
+            return True
+        return False
+
+    def record_success(self, probe: bool = False) -> None:
+        """호출 성공 (half-open이면 서킷 닫기)"""
+        self.release(probe)
+        if self.state != self.CLOSED:
+            logger.info(f"서킷 닫힘 ({self.name}): 제공자 복구")
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+
+    def record_failure(self, error: BaseException, probe: bool = False) -> None:
+        """제공자 장애로 인한 실패 (임계값을 넘거나 확인 요청이 실패하면 서킷 열기)"""
+        self.release(probe)
+        self.consecutive_failures += 1
+        self.last_error = str(error)
+        if self.state == self.OPEN:
+            return
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            self.opened_count += 1
+            logger.warning(
+                f"서킷 열림 ({self.name}): 연속 실패 {self.consecutive_failures}회, "
+                f"{self.recovery_timeout}초 동안 요청 차단"
+            )
+
+    def release(self, probe: bool = False) -> None:
+        """성공/실패로 집계하지 않고 확인 요청 자리만 반환 (취소, 잘못된 요청 등)"""
+        if probe and self._probes > 0:
+            self._probes -= 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태 (헬스 체크용)"""
+        retry_after = 0.0
+        if self.state == self.OPEN:
+            retry_after = max(0.0, self.opened_at + self.recovery_timeout - time.monotonic())
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "failure_threshold": self.failure_threshold,
+            "retry_after": round(retry_after, 1),
+            "opened_count": self.opened_count,
+            "rejected": self.rejected,
+            "last_error": self.last_error
+        }
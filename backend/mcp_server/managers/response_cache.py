@@ -0,0 +1,225 @@
+"""
+AI 응답 캐시
+(제공자, 모델, 출력 형식, 템플릿 적용된 프롬프트 해시)가 같은 요청은 제공자를 다시 호출하지 않고
+메모리 LRU(1단계)와 디스크 저장소(2단계, TTL과 용량 제한)에서 응답을 돌려줍니다.
+"""
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from loguru import logger
+
+from ..config.settings import settings
+
+_response_cache: Optional["ResponseCache"] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional["ResponseCache"]:
+    """프로세스 공유 응답 캐시 조회 (response_cache_enabled가 꺼져 있으면 None)"""
+    global _response_cache
+    if not settings.response_cache_enabled:
+        return None
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = ResponseCache(
+                Path(settings.response_cache_dir) if settings.response_cache_dir else None,
+                memory_entries=settings.response_cache_memory_entries,
+                ttl=settings.response_cache_ttl,
+                disk_max_bytes=settings.response_cache_disk_max_bytes
+            )
+        return _response_cache
+
+
+class ResponseCache:
+    """2단계 AI 응답 캐시"""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path],
+        memory_entries: int = 256,
+        ttl: float = 24 * 3600,
+        disk_max_bytes: int = 100 * 1024 * 1024
+    ):
+        self.cache_dir = cache_dir
+        self.memory_entries = memory_entries
+        self.ttl = ttl
+        self.disk_max_bytes = disk_max_bytes
+        # 키 -> (만료 시각, 응답)
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        # 키 -> (파일 크기, 저장 시각), 최초 디스크 접근 시 로드
+        self._disk_index: Optional[Dict[str, Tuple[int, float]]] = None
+        self._disk_bytes = 0
+        self._disk_lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self.stores = 0
+
+    @staticmethod
+    def make_key(provider: str, model: str, output_format: str, prompt: str) -> str:
+        """캐시 키 (프롬프트는 해시만 사용)"""
+        prompt_hash = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+        return hashlib.sha256(f"{provider}\0{model}\0{output_format}\0{prompt_hash}".encode('utf-8')).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        """캐시된 응답 조회 (메모리 → 디스크 순, 디스크 적중은 메모리로 승격)"""
+        now = time.time()
+        entry = self._memory.get(key)
+        if entry is not None:
+            expires_at, content = entry
+            if expires_at > now:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return content
+            del self._memory[key]
+
+        if self.cache_dir is not None:
+            stored = await asyncio.to_thread(self._disk_get, key, now)
+            if stored is not None:
+                content, created = stored
+                self._remember(key, content, created + self.ttl)
+                self.disk_hits += 1
+                return content
+
+        self.misses += 1
+        return None
+
+    async def put(self, key: str, content: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """응답 저장 (두 단계 모두)"""
+        now = time.time()
+        self._remember(key, content, now + self.ttl)
+        self.stores += 1
+        if self.cache_dir is not None:
+            try:
+                await asyncio.to_thread(self._disk_put, key, content, metadata or {}, now)
+            except Exception as e:
+                logger.warning(f"응답 캐시 디스크 저장 실패: {str(e)}")
+
+    def record_bypass(self) -> None:
+        """캐시를 건너뛴 요청 수 집계 (bypass/refresh)"""
+        self.bypasses += 1
+
+    async def clear(self) -> int:
+        """모든 캐시 항목 삭제"""
+        self._memory.clear()
+        if self.cache_dir is None:
+            return 0
+        return await asyncio.to_thread(self._disk_clear)
+
+    def stats(self) -> Dict[str, Any]:
+        """단계별 적중 통계"""
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        hits = self.memory_hits + self.disk_hits
+        return {
+            "memory_entries": len(self._memory),
+            "memory_max_entries": self.memory_entries,
+            "disk_entries": len(self._disk_index) if self._disk_index is not None else None,
+            "disk_bytes": self._disk_bytes if self._disk_index is not None else None,
+            "disk_max_bytes": self.disk_max_bytes,
+            "ttl": self.ttl,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "bypasses": self.bypasses,
+            "stores": self.stores,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0
+        }
+
+    def _remember(self, key: str, content: str, expires_at: float) -> None:
+        self._memory[key] = (expires_at, content)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _disk_get(self, key: str, now: float) -> Optional[Tuple[str, float]]:
+        with self._disk_lock:
+            self._load_disk_index()
+            if key not in self._disk_index:
+                return None
+            try:
+                with open(self._path(key), 'r', encoding='utf-8') as f:
+                    record = json.load(f)
+            except (OSError, ValueError):
+                self._disk_remove(key)
+                return None
+            if record.get("created", 0) + self.ttl <= now:
+                self._disk_remove(key)
+                return None
+            return record["content"], record["created"]
+
+    def _disk_put(self, key: str, content: str, metadata: Dict[str, Any], now: float) -> None:
+        with self._disk_lock:
+            self._load_disk_index()
+            path = self._path(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            data = json.dumps({**metadata, "created": now, "content": content}, ensure_ascii=False)
+            temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+
+            previous = self._disk_index.pop(key, None)
+            if previous is not None:
+                self._disk_bytes -= previous[0]
+            size = path.stat().st_size
+            self._disk_index[key] = (size, now)
+            self._disk_bytes += size
+            self._evict_disk(now)
+
+    def _load_disk_index(self) -> None:
+        """디스크 항목 목록 로드 (최초 1회, 만료 항목은 삭제)"""
+        if self._disk_index is not None:
+            return
+        self._disk_index = {}
+        self._disk_bytes = 0
+        if not self.cache_dir.exists():
+            return
+
+        now = time.time()
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if stat.st_mtime + self.ttl <= now:
+                path.unlink(missing_ok=True)
+                continue
+            self._disk_index[path.stem] = (stat.st_size, stat.st_mtime)
+            self._disk_bytes += stat.st_size
+
+    def _evict_disk(self, now: float) -> None:
+        """용량을 넘으면 만료 항목부터, 그래도 넘으면 오래된 항목부터 제거"""
+        if self._disk_bytes <= self.disk_max_bytes:
+            return
+        for key, (_, created) in list(self._disk_index.items()):
+            if created + self.ttl <= now:
+                self._disk_remove(key)
+        for key, _ in sorted(self._disk_index.items(), key=lambda item: item[1][1]):
+            if self._disk_bytes <= self.disk_max_bytes:
+                break
+            self._disk_remove(key)
+
+    def _disk_remove(self, key: str) -> None:
+        entry = self._disk_index.pop(key, None)
+        if entry is not None:
+            self._disk_bytes -= entry[0]
+        self._path(key).unlink(missing_ok=True)
+
+    def _disk_clear(self) -> int:
+        with self._disk_lock:
+            self._load_disk_index()
+            removed = len(self._disk_index)
+            for key in list(self._disk_index):
+                self._disk_remove(key)
+            return removed
@@ -0,0 +1,140 @@
+"""
+진행 중인 동일 요청 병합 (single-flight)
+같은 키의 요청이 이미 진행 중이면 새로 호출하지 않고 그 결과(스트리밍이면 텍스트 조각)를 함께 받습니다.
+대기자 하나가 취소되어도 다른 대기자가 남아 있으면 원래 호출은 계속되고, 모두 떠나면 취소됩니다.
+"""
+import asyncio
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, List, Optional
+
+
+class _Call:
+    """진행 중인 단일 호출"""
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class _StreamCall:
+    """진행 중인 스트리밍 호출 (받은 조각을 모아 두고 늦게 합류한 대기자에게도 처음부터 전달)"""
+
+    def __init__(self):
+        self.task: Optional[asyncio.Task] = None
+        self.chunks: List[str] = []
+        self.finished = False
+        self.error: Optional[BaseException] = None
+        self.subscribers = 0
+        self._changed = asyncio.Event()
+
+    def notify(self) -> None:
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    async def wait(self) -> None:
+        await self._changed.wait()
+
+
+class SingleFlight:
+    """키별 진행 중 요청 병합기"""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._streams: Dict[Hashable, _StreamCall] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        key에 해당하는 호출 결과 (진행 중인 호출이 있으면 합류)
+
+        Args:
+            key: 요청 식별 키
+            factory: 새로 호출할 때 사용할 코루틴 생성 함수
+
+        Returns:
+            호출 결과 (예외도 모든 대기자에게 그대로 전달)
+        """
+        call = self._calls.get(key)
+        if call is None or call.task.done():
+            call = _Call(asyncio.create_task(factory()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _: self._forget(self._calls, key, call))
+            self.started += 1
+        else:
+            self.coalesced += 1
+
+        call.waiters += 1
+        try:
+            # 대기자가 취소되어도 공유 작업은 취소되지 않도록 shield
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                self._forget(self._calls, key, call)
+                call.task.cancel()
+
+    async def stream(self, key: Hashable, factory: Callable[[], AsyncIterator[str]]) -> AsyncIterator[str]:
+        """
+        key에 해당하는 스트림 (진행 중인 스트림이 있으면 합류하여 처음 조각부터 받음)
+
+        Args:
+            key: 요청 식별 키
+            factory: 새로 호출할 때 사용할 비동기 제너레이터 생성 함수
+        """
+        call = self._streams.get(key)
+        if call is None:
+            call = _StreamCall()
+            self._streams[key] = call
+            call.task = asyncio.create_task(self._pump(key, call, factory))
+            self.started += 1
+        else:
+            self.coalesced += 1
+
+        call.subscribers += 1
+        index = 0
+        try:
+            while True:
+                while index < len(call.chunks):
+                    yield call.chunks[index]
+                    index += 1
+                if call.finished:
+                    if call.error is not None:
+                        raise call.error
+                    return
+                await call.wait()
+        finally:
+            call.subscribers -= 1
+            if call.subscribers == 0 and not call.finished:
+                self._forget(self._streams, key, call)
+                call.task.cancel()
+
+    def stats(self) -> Dict[str, int]:
+        """병합 통계"""
+        return {
+            "in_flight": len(self._calls) + len(self._streams),
+            "started": self.started,
+            "coalesced": self.coalesced
+        }
+
+    async def _pump(self, key: Hashable, call: _StreamCall, factory: Callable[[], AsyncIterator[str]]) -> None:
+        """원래 스트림을 읽어 모든 대기자에게 전달"""
+        try:
+            async with aclosing(factory()) as chunks:
+                async for chunk in chunks:
+                    call.chunks.append(chunk)
+                    call.notify()
+        except asyncio.CancelledError:
+            call.error = asyncio.CancelledError()
+            raise
+        except Exception as e:
+            call.error = e
+        finally:
+            call.finished = True
+            self._forget(self._streams, key, call)
+            call.notify()
+
+    @staticmethod
+    def _forget(calls: Dict[Hashable, Any], key: Hashable, call: Any) -> None:
+        if calls.get(key) is call:
+            del calls[key]
@@ -5,9 +5,11 @@ MCP 도구 모듈들
 from .ai_generation import AIGenerationTools
 from .vault_operations import VaultOperationTools
 from .content_management import ContentManagementTools
+from .note_writer import NoteWriter
 
 __all__ = [
     "AIGenerationTools",
     "VaultOperationTools", 
-    "ContentManagementTools"
+    "ContentManagementTools",
+    "NoteWriter"
 ]
@@ -8,11 +8,17 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 from loguru import logger
 
+from mcp_obsidian.indexes.markdown_tokenizer import MarkdownStructure
+from mcp_obsidian.indexes.note_cache import get_note_cache
+from .note_writer import NoteWriter
+
 class ContentManagementTools:
     """콘텐츠 관리 도구 클래스"""
     
-    def __init__(self, vault_path: str):
+    def __init__(self, vault_path: str, track_changes: bool = True):
         self.vault_path = Path(vault_path)
+        self.note_cache = get_note_cache()
+        self.writer = NoteWriter(self.vault_path, track_changes)
     
     def extract_metadata(self, file_path: str) -> Dict[str, Any]:
         """
@@ -26,26 +32,27 @@ class ContentManagementTools:
         """
         try:
             full_path = self.vault_path / file_path
-            if not full_path.exists():
+            note = self.note_cache.load(full_path)
+            if note is None:
                 return {"error": f"파일을 찾을 수 없습니다: {file_path}"}
             
-            content = full_path.read_text(encoding='utf-8')
+            structure = note.structure
             
             metadata = {
                 "file_path": file_path,
                 "file_name": full_path.name,
-                "file_size": full_path.stat().st_size,
-                "tags": self._extract_tags(content),
-                "headings": self._extract_headings(content),
-                "links": self._extract_links(content),
-                "word_count": len(content.split()),
-                "line_count": len(content.split('\n')),
-                "has_frontmatter": self._has_frontmatter(content)
+                "file_size": note.size,
+                "tags": structure.tag_names,
+                "headings": self._extract_headings(structure),
+                "links": self._extract_links(structure),
+                "word_count": structure.word_count,
+                "line_count": structure.line_count,
+                "has_frontmatter": structure.frontmatter is not None
             }
             
             # 프론트매터가 있는 경우 추출
             if metadata["has_frontmatter"]:
-                metadata["frontmatter"] = self._extract_frontmatter(content)
+                metadata["frontmatter"] = self._extract_frontmatter(structure)
             
             return metadata
             
@@ -53,75 +60,50 @@ class ContentManagementTools:
             logger.error(f"메타데이터 추출 실패: {str(e)}")
             return {"error": f"메타데이터 추출 중 오류 발생: {str(e)}"}
     
-    def _extract_tags(self, content: str) -> List[str]:
-        """태그 추출"""
-        # Obsidian 태그 패턴: #tag 또는 #tag/subtag
-        tag_pattern = r'#([a-zA-Z0-9가-힣_-]+(?:\/[a-zA-Z0-9가-힣_-]+)*)'
-        tags = re.findall(tag_pattern, content)
-        return list(set(tags))  # 중복 제거
+    def _write(self, full_path: Path, content: str) -> bool:
+        """공용 저장 경로로 파일 쓰기 (내용이 같으면 생략, 실제로 썼는지 반환)"""
+        return self.writer.write(full_path, content)
     
-    def _extract_headings(self, content: str) -> List[Dict[str, Any]]:
+    def _extract_headings(self, structure: MarkdownStructure) -> List[Dict[str, Any]]:
         """헤딩 추출"""
-        headings = []
-        lines = content.split('\n')
-        
-        for i, line in enumerate(lines):
-            # Markdown 헤딩 패턴: # ## ### 등
-            match = re.match(r'^(#{1,6})\s+(.+)', line.strip())
-            if match:
-                level = len(match.group(1))
-                text = match.group(2).strip()
-                headings.append({
-                    "level": level,
-                    "text": text,
-                    "line_number": i + 1
-                })
-        
-        return headings
+        return [
+            {
+                "level": heading.level,
+                "text": heading.text,
+                "line_number": heading.line
+            }
+            for heading in structure.headings
+        ]
     
-    def _extract_links(self, content: str) -> List[Dict[str, str]]:
+    def _extract_links(self, structure: MarkdownStructure) -> List[Dict[str, str]]:
         """링크 추출"""
         links = []
         
-        # Markdown 링크 패턴: [text](url)
-        markdown_links = re.findall(r'\[([^\]]+)\]\(([^)]+)\)', content)
-        for text, url in markdown_links:
+        # Markdown 링크: [text](url)
+        for link in structure.markdown_links:
             links.append({
                 "type": "markdown",
-                "text": text,
-                "url": url
+                "text": link.text,
+                "url": link.url
             })
         
-        # Obsidian 내부 링크 패턴: [[link]] 또는 [[link|display]]
-        obsidian_links = re.findall(r'\[\[([^|\]]+)(?:\|([^\]]+))?\]\]', content)
-        for link, display in obsidian_links:
+        # Obsidian 내부 링크: [[link]] 또는 [[link|display]]
+        for link in structure.wikilinks:
             links.append({
                 "type": "obsidian",
-                "link": link,
-                "display": display or link
+                "link": link.target,
+                "display": link.display or link.target
             })
         
         return links
     
-    def _has_frontmatter(self, content: str) -> bool:
-        """프론트매터 존재 여부 확인"""
-        return content.startswith('---\n')
-    
-    def _extract_frontmatter(self, content: str) -> Dict[str, Any]:
+    def _extract_frontmatter(self, structure: MarkdownStructure) -> Dict[str, Any]:
         """프론트매터 추출"""
         try:
-            if not self._has_frontmatter(content):
+            if structure.frontmatter is None:
                 return {}
             
-            lines = content.split('\n')
-            frontmatter_lines = []
-            
-            for i, line in enumerate(lines[1:], 1):  # 첫 번째 --- 건너뛰기
-                if line.strip() == '---':
-                    break
-                frontmatter_lines.append(line)
-            
-            frontmatter_text = '\n'.join(frontmatter_lines)
+            frontmatter_text = structure.frontmatter
             
             # YAML 파싱 시도
             try:
@@ -177,11 +159,12 @@ class ContentManagementTools:
         """
         try:
             full_path = self.vault_path / file_path
-            if not full_path.exists():
+            note = self.note_cache.load(full_path)
+            if note is None:
                 return f"파일을 찾을 수 없습니다: {file_path}"
             
-            content = full_path.read_text(encoding='utf-8')
-            current_tags = self._extract_tags(content)
+            content = note.content
+            current_tags = note.structure.tag_names
             
             if action == "list":
                 return f"현재 태그: {', '.join(current_tags)}"
@@ -196,7 +179,7 @@ class ContentManagementTools:
                     else:
                         content = tag_line
                     
-                    full_path.write_text(content, encoding='utf-8')
+                    self._write(full_path, content)
                     return f"태그가 추가되었습니다: {', '.join(new_tags)}"
                 else:
                     return "추가할 새 태그가 없습니다."
@@ -213,7 +196,7 @@ class ContentManagementTools:
                 if removed_tags:
                     # 빈 줄 정리
                     content = re.sub(r'\n\s*\n\s*\n', '\n\n', content)
-                    full_path.write_text(content, encoding='utf-8')
+                    self._write(full_path, content)
                     return f"태그가 제거되었습니다: {', '.join(removed_tags)}"
                 else:
                     return "제거할 태그가 없습니다."
@@ -242,11 +225,10 @@ class ContentManagementTools:
         """
         try:
             full_path = self.vault_path / file_path
-            if not full_path.exists():
+            content = self.note_cache.read(full_path)
+            if content is None:
                 return f"파일을 찾을 수 없습니다: {file_path}"
             
-            content = full_path.read_text(encoding='utf-8')
-            
             if strategy == "auto_categorize":
                 return self._auto_categorize(content, full_path)
             elif strategy == "add_structure":
@@ -290,7 +272,7 @@ class ContentManagementTools:
                     lines[0] = f"{lines[0]} {category_tags}"
                     content = '\n'.join(lines)
             
-            file_path.write_text(content, encoding='utf-8')
+            self._write(file_path, content)
             return f"자동 분류 완료: {', '.join(matched_categories)}"
         else:
             return "분류할 수 있는 카테고리를 찾지 못했습니다."
@@ -323,7 +305,7 @@ class ContentManagementTools:
                 cleaned_lines.append(line)
                 prev_empty = False
         
-        file_path.write_text('\n'.join(cleaned_lines), encoding='utf-8')
+        self._write(file_path, '\n'.join(cleaned_lines))
         return "구조가 추가되었습니다."
     
     def _extract_keywords(self, content: str, file_path: Path) -> str:
@@ -351,5 +333,5 @@ class ContentManagementTools:
                 lines[0] = f"{lines[0]} {keyword_tags}"
                 content = '\n'.join(lines)
         
-        file_path.write_text(content, encoding='utf-8')
+        self._write(file_path, content)
         return f"키워드가 추출되었습니다: {', '.join([word for word, count in top_keywords])}"
\ No newline at end of file
@@ -0,0 +1,75 @@
+"""
+MCP 도구 공용 노트 저장 경로
+VaultManager 저장 경로와 같은 방식(내용이 같으면 생략, 원자적 교체)으로 쓰고
+노트 캐시, 카탈로그(구조 delta와 검색 색인의 변경 판정에 사용), 변경 저널을 함께 갱신합니다.
+"""
+from pathlib import Path
+from typing import Optional
+from loguru import logger
+
+from mcp_obsidian.indexes.note_catalog import get_note_catalog
+from mcp_obsidian.indexes.note_cache import content_hash, get_note_cache
+from mcp_obsidian.indexes.change_journal import get_change_journal
+from mcp_obsidian.tools.vault_manager import write_text_atomic
+
+class NoteWriter:
+    """도구 클래스들이 공유하는 노트 쓰기/삭제"""
+
+    def __init__(self, vault_path: Path, track_changes: bool = True):
+        self.vault_path = Path(vault_path)
+        self.catalog = get_note_catalog(self.vault_path)
+        self.note_cache = get_note_cache()
+        self.journal = get_change_journal(self.vault_path) if track_changes else None
+
+    def write(self, full_path: Path, content: str, operation: str = "write") -> bool:
+        """
+        노트 쓰기
+
+        Args:
+            full_path: 파일 절대 경로
+            content: 새 내용
+            operation: 저널 작업 이름 (새 파일의 write는 create로 기록)
+
+        Returns:
+            실제로 썼는지 여부 (내용이 같으면 mtime을 바꾸지 않도록 생략)
+        """
+        current = self.note_cache.load(full_path)
+        new_hash = content_hash(content)
+        if current is not None and current.content_hash == new_hash:
+            return False
+
+        write_text_atomic(full_path, content)
+        entry = self.note_cache.put(full_path, content, new_hash)
+        relative_path = str(full_path.relative_to(self.vault_path))
+        # 감시자 이벤트를 기다리지 않고 즉시 반영 (검색 색인은 바뀐 크기/mtime으로 다시 색인)
+        self.catalog.apply_changes([relative_path])
+        self.record_change(
+            "create" if current is None and operation == "write" else operation,
+            relative_path,
+            new_hash,
+            entry.size if entry is not None else len(content.encode('utf-8'))
+        )
+        return True
+
+    def delete(self, full_path: Path) -> None:
+        """노트 삭제 후 캐시, 카탈로그, 저널 반영"""
+        full_path.unlink()
+        self.note_cache.invalidate(full_path)
+        relative_path = str(full_path.relative_to(self.vault_path))
+        self.catalog.apply_changes([relative_path])
+        self.record_change("delete", relative_path)
+
+    def record_change(
+        self,
+        operation: str,
+        relative_path: str,
+        digest: Optional[str] = None,
+        size: Optional[int] = None
+    ) -> None:
+        """변경 저널 기록"""
+        if self.journal is None:
+            return
+        try:
+            self.journal.append(operation, relative_path, digest, size)
+        except Exception as e:
+            logger.warning(f"변경 저널 기록 실패: {str(e)}")
@@ -5,23 +5,40 @@
 import os
 import re
 import json
+import fnmatch
+import heapq
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from loguru import logger
 
+from mcp_obsidian.indexes.note_catalog import (
+    SORT_KEYS, get_note_catalog, select_page, select_fields, encode_cursor, decode_cursor
+)
+from mcp_obsidian.indexes.search_index import SearchIndex, get_search_index
+from mcp_obsidian.indexes.note_cache import get_note_cache
+from .note_writer import NoteWriter
+
 class VaultOperationTools:
     """볼트 조작 도구 클래스"""
     
-    def __init__(self, vault_path: str):
+    def __init__(self, vault_path: str, track_changes: bool = True):
         self.vault_path = Path(vault_path)
         if not self.vault_path.exists():
             raise ValueError(f"볼트 경로가 존재하지 않습니다: {vault_path}")
+        self.catalog = get_note_catalog(self.vault_path)
+        self.note_cache = get_note_cache()
+        self.writer = NoteWriter(self.vault_path, track_changes)
     
     def list_vault_files(
         self, 
         pattern: str = "*.md", 
-        recursive: bool = True
+        recursive: bool = True,
+        sort_by: str = "mtime",
+        descending: bool = True,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         볼트 내 파일 목록 조회
@@ -29,31 +46,96 @@ class VaultOperationTools:
         Args:
             pattern: 파일 패턴 (예: *.md, *.txt)
             recursive: 재귀적 검색 여부
+            sort_by: 정렬 기준 (mtime, size, name)
+            descending: 내림차순 여부
+            limit: 최대 개수 (None이면 전체)
+            cursor: 이전 페이지의 next_cursor
+            fields: 포함할 필드 (없으면 전체)
+        
+        Returns:
+            파일 정보 목록 (다음 페이지 커서가 필요하면 list_vault_files_page 사용)
+        """
+        return self.list_vault_files_page(
+            pattern, recursive, sort_by, descending, limit, cursor, fields
+        )["files"]
+    
+    def list_vault_files_page(
+        self,
+        pattern: str = "*.md",
+        recursive: bool = True,
+        sort_by: str = "mtime",
+        descending: bool = True,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        커서 기반 파일 목록 페이지 조회
+        
+        정렬은 숫자 mtime/크기 또는 파일명 기준이며, limit개 크기의 힙으로 해당 페이지만 선택합니다.
         
         Returns:
-            파일 정보 목록
+            files와 next_cursor (마지막 페이지면 None)
         """
         try:
-            files = []
-            search_pattern = "**/" + pattern if recursive else pattern
-            
-            for file_path in self.vault_path.glob(search_pattern):
-                if file_path.is_file():
-                    stat = file_path.stat()
-                    files.append({
-                        "name": file_path.name,
-                        "path": str(file_path.relative_to(self.vault_path)),
-                        "size": stat.st_size,
-                        "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                        "extension": file_path.suffix,
-                        "is_markdown": file_path.suffix.lower() == '.md'
-                    })
+            # 카탈로그가 다루는 파일명 패턴이면 파일 시스템 순회 없이 카탈로그에서 조회
+            if self._is_catalog_pattern(pattern):
+                self.catalog.refresh()
+                entries, next_cursor = self.catalog.list_page(
+                    "", recursive, sort_by, descending, limit, cursor,
+                    predicate=lambda note: fnmatch.fnmatchcase(os.path.basename(note["path"]), pattern)
+                )
+            else:
+                sort_key = SORT_KEYS.get(sort_by)
+                if sort_key is None:
+                    raise ValueError(f"지원하지 않는 정렬 기준입니다: {sort_by}")
+                after = decode_cursor(cursor, sort_by, descending) if cursor else None
+                entries, next_key = select_page(
+                    self._glob_entries(pattern, recursive), sort_key, descending, limit, after
+                )
+                next_cursor = encode_cursor(sort_by, descending, next_key) if next_key is not None else None
             
-            return sorted(files, key=lambda x: x["modified"], reverse=True)
+            files = [select_fields(self._file_info(entry), fields) for entry in entries]
+            return {"files": files, "next_cursor": next_cursor}
             
         except Exception as e:
             logger.error(f"파일 목록 조회 실패: {str(e)}")
-            return []
+            return {"files": [], "next_cursor": None, "error": str(e)}
+    
+    def _is_catalog_pattern(self, pattern: str) -> bool:
+        """
+        카탈로그 항목의 파일명만으로 판정할 수 있는 패턴인지 여부
+        
+        디렉토리 부분이 있는 패턴(notes/*.md, **/*.md)은 glob 의미를 그대로 따르도록 파일 시스템 순회를 사용합니다.
+        """
+        if "/" in pattern or "\\" in pattern:
+            return False
+        return Path(pattern).suffix in self.catalog.supported_extensions
+    
+    def _glob_entries(self, pattern: str, recursive: bool):
+        """카탈로그 밖 패턴의 파일 항목 순회 (카탈로그 항목 형식)"""
+        search_pattern = "**/" + pattern if recursive else pattern
+        for file_path in self.vault_path.glob(search_pattern):
+            if file_path.is_file():
+                stat = file_path.stat()
+                yield {
+                    "path": str(file_path.relative_to(self.vault_path)),
+                    "extension": file_path.suffix,
+                    "size": stat.st_size,
+                    "modified": stat.st_mtime
+                }
+    
+    @staticmethod
+    def _file_info(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """카탈로그 항목을 파일 정보 형식으로 변환"""
+        return {
+            "name": os.path.basename(entry["path"]),
+            "path": entry["path"],
+            "size": entry["size"],
+            "modified": datetime.fromtimestamp(entry["modified"]).isoformat(),
+            "extension": entry["extension"],
+            "is_markdown": entry["extension"].lower() == '.md'
+        }
     
     def read_file_content(self, file_path: str) -> str:
         """
@@ -66,11 +148,10 @@ class VaultOperationTools:
             파일 내용
         """
         try:
-            full_path = self.vault_path / file_path
-            if not full_path.exists():
+            content = self.note_cache.read(self.vault_path / file_path)
+            if content is None:
                 return f"파일을 찾을 수 없습니다: {file_path}"
             
-            content = full_path.read_text(encoding='utf-8')
             return content
             
         except Exception as e:
@@ -125,7 +206,7 @@ class VaultOperationTools:
                 content = f"{tag_line}\n\n{content}"
             
             # 파일 생성
-            file_path.write_text(content, encoding='utf-8')
+            self.writer.write(file_path, content, operation="create")
             
             return str(file_path.relative_to(self.vault_path))
             
@@ -156,12 +237,12 @@ class VaultOperationTools:
                 return f"파일을 찾을 수 없습니다: {file_path}"
             
             if append:
-                existing_content = full_path.read_text(encoding='utf-8')
+                existing_content = self.note_cache.read(full_path) or ""
                 new_content = existing_content + "\n\n" + content
             else:
                 new_content = content
             
-            full_path.write_text(new_content, encoding='utf-8')
+            self.writer.write(full_path, new_content)
             
             return f"파일이 업데이트되었습니다: {file_path}"
             
@@ -173,7 +254,8 @@ class VaultOperationTools:
         self, 
         query: str, 
         file_pattern: str = "*.md", 
-        case_sensitive: bool = False
+        case_sensitive: bool = False,
+        limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         볼트 내 검색
@@ -182,18 +264,23 @@ class VaultOperationTools:
             query: 검색 쿼리
             file_pattern: 검색할 파일 패턴
             case_sensitive: 대소문자 구분 여부
+            limit: 최대 결과 수 (지정 시 전체 정렬 대신 상위 limit개만 힙으로 선택)
         
         Returns:
-            검색 결과 목록
+            검색 결과 목록 (매칭 라인 수 내림차순)
         """
         try:
             results = []
-            search_pattern = "**/" + file_pattern
+            candidates = self._candidate_files(query, file_pattern)
+            if candidates is None:
+                candidates = self.vault_path.glob("**/" + file_pattern)
             
-            for file_path in self.vault_path.glob(search_pattern):
+            for file_path in candidates:
                 if file_path.is_file():
                     try:
-                        content = file_path.read_text(encoding='utf-8')
+                        content = self.note_cache.read(file_path)
+                        if content is None:
+                            continue
                         
                         # 검색 쿼리 처리
                         search_text = content if case_sensitive else content.lower()
@@ -223,12 +310,60 @@ class VaultOperationTools:
                         logger.warning(f"파일 검색 중 오류 ({file_path}): {str(e)}")
                         continue
             
+            if limit is not None:
+                return heapq.nlargest(limit, results, key=lambda x: x["matches"])
             return sorted(results, key=lambda x: x["matches"], reverse=True)
             
         except Exception as e:
             logger.error(f"볼트 검색 실패: {str(e)}")
             return []
     
+    def _candidate_files(self, query: str, file_pattern: str) -> Optional[List[Path]]:
+        """
+        검색 색인으로 본문을 확인할 후보 파일 선정
+        
+        조회 전에 카탈로그와 색인을 동기화(바뀐 노트만 다시 색인)한 뒤, 색인의 n-gram/용어
+        포스팅 교집합에 해당하는 파일과 색인하지 못한 파일을 후보로 반환합니다. 최종 판정은 호출자가 본문으로 검증합니다.
+        
+        Returns:
+            후보 파일 경로 목록 (카탈로그가 다루지 않거나 디렉토리 부분이 있는 패턴이면 None)
+        """
+        if not self._is_catalog_pattern(file_pattern):
+            return None
+        
+        try:
+            self.catalog.refresh()
+            notes = self.catalog.list_notes("", recursive=True)
+            index = get_search_index(self.vault_path)
+            self._sync_search_index(index, notes)
+            matched = index.search(query, "content")
+            
+            candidates = []
+            for note in notes:
+                if not fnmatch.fnmatchcase(os.path.basename(note["path"]), file_pattern):
+                    continue
+                if note["path"] in matched or index.is_stale(note):
+                    candidates.append(self.vault_path / note["path"])
+            return candidates
+        except Exception as e:
+            logger.warning(f"색인 후보 조회 실패, 전체 스캔으로 대체: {str(e)}")
+            return None
+    
+    def _sync_search_index(self, index: SearchIndex, notes: List[Dict[str, Any]]) -> None:
+        """카탈로그 기준으로 바뀐 노트만 다시 색인 (VaultManager._refresh_search_index와 같은 방식)"""
+        stale_notes = index.sync(notes)
+        for note in stale_notes:
+            parsed = self.note_cache.load(self.vault_path / note["path"])
+            if parsed is None:
+                index.remove_document(note["path"])
+                continue
+            index.add_document(note, parsed.content, parsed.structure)
+        
+        if stale_notes:
+            logger.info(f"검색 색인 갱신: {len(stale_notes)}개 노트")
+        if index.dirty:
+            index.save()
+    
     def delete_file(self, file_path: str) -> str:
         """
         파일 삭제
@@ -244,7 +379,7 @@ class VaultOperationTools:
             if not full_path.exists():
                 return f"파일을 찾을 수 없습니다: {file_path}"
             
-            full_path.unlink()
+            self.writer.delete(full_path)
             return f"파일이 삭제되었습니다: {file_path}"
             
         except Exception as e:
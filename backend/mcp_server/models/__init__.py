@@ -4,12 +4,17 @@ Models Module
 """
 
 from .enums import AIProvider, OutputFormat
-from .schemas import AIRequest, AIResponse, HealthResponse
+from .schemas import (
+    AIRequest, AIResponse, HealthResponse, BatchReadRequest, BatchWriteItem, BatchWriteRequest
+)
 
 __all__ = [
     "AIProvider",
     "OutputFormat", 
     "AIRequest",
     "AIResponse",
-    "HealthResponse"
+    "HealthResponse",
+    "BatchReadRequest",
+    "BatchWriteItem",
+    "BatchWriteRequest"
 ]
@@ -2,7 +2,7 @@
 Pydantic 모델 정의
 """
 from pydantic import BaseModel
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 class AIRequest(BaseModel):
     """AI 요청 모델"""
@@ -12,6 +12,9 @@ class AIRequest(BaseModel):
     model: str = "gpt-4"  # 모델명
     api_key: Optional[str] = None  # 클라이언트에서 전달받은 API Key
     language: Optional[str] = None  # 프로그래밍 언어
+    stream: bool = False  # True면 SSE로 생성 중인 텍스트 조각을 바로 전송
+    bypass_cache: bool = False  # 응답 캐시를 읽지도 저장하지도 않음
+    refresh_cache: bool = False  # 캐시를 무시하고 새로 생성한 응답으로 갱신
 
 class AIResponse(BaseModel):
     """AI 응답 모델"""
@@ -20,9 +23,26 @@ class AIResponse(BaseModel):
     error: Optional[str] = None
     format: Optional[str] = None
     provider: Optional[str] = None
+    cached: Optional[bool] = None  # 응답 캐시에서 반환했는지 여부
+
+class BatchReadRequest(BaseModel):
+    """여러 노트 읽기 요청 모델"""
+    paths: List[str]
+
+class BatchWriteItem(BaseModel):
+    """일괄 쓰기 항목"""
+    path: str
+    content: str
+    expected_hash: Optional[str] = None  # 읽었던 본문 해시 (다르면 충돌)
+
+class BatchWriteRequest(BaseModel):
+    """여러 노트 쓰기 요청 모델"""
+    items: List[BatchWriteItem]
+    atomic: bool = False  # 하나라도 실패하면 아무것도 쓰지 않음
 
 class HealthResponse(BaseModel):
     """헬스 체크 응답 모델"""
     status: str
     api_keys_valid: bool
     missing_keys: list
+    providers: Optional[Dict[str, Dict[str, Any]]] = None  # 제공자별 서킷 브레이커 상태
@@ -3,12 +3,14 @@ AI Providers Module
 다양한 AI API 제공자들을 관리합니다.
 """
 
+from .client_pool import HTTPClientPool
 from .base_provider import BaseAIProvider
 from .openai_provider import OpenAIProvider
 from .anthropic_provider import AnthropicProvider
 from .perplexity_provider import PerplexityProvider
 
 __all__ = [
+    "HTTPClientPool",
     "BaseAIProvider",
     "OpenAIProvider", 
     "AnthropicProvider",
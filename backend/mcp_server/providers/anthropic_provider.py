@@ -1,15 +1,17 @@
 """
 Anthropic 제공자
 """
-import httpx
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 from .base_provider import BaseAIProvider
-from ..config.settings import settings, provider_configs
+from ..config.settings import settings
 from loguru import logger
 
 class AnthropicProvider(BaseAIProvider):
     """Anthropic API 제공자"""
     
+    name = "anthropic"
+    default_api_url = "https://api.anthropic.com/v1/messages"
+    
     async def call_api(
         self,
         prompt: str,
@@ -17,15 +19,55 @@ class AnthropicProvider(BaseAIProvider):
         model: str = "gpt-4"
     ) -> str:
         """Anthropic API 호출"""
+        headers, data = self._build_request(prompt, api_key, model)
+        
+        # 공유 클라이언트로 keep-alive 연결 재사용
+        response = await self.get_client().post(
+            self.api_url,
+            headers=headers,
+            json=data
+        )
+        response.raise_for_status()
+        result = response.json()
+        return result["content"][0]["text"] or ""
+    
+    async def stream_api(
+        self,
+        prompt: str,
+        api_key: Optional[str] = None,
+        model: str = "gpt-4"
+    ) -> AsyncIterator[str]:
+        """Anthropic API 스트리밍 호출 (content_block_delta의 text)"""
+        headers, data = self._build_request(prompt, api_key, model)
+        data["stream"] = True
+        
+        async with self.get_client().stream("POST", self.api_url, headers=headers, json=data) as response:
+            response.raise_for_status()
+            async for event in self.iter_sse_events(response):
+                event_type = event.get("type")
+                if event_type == "content_block_delta":
+                    text = event.get("delta", {}).get("text")
+                    if text:
+                        yield text
+                elif event_type == "error":
+                    raise RuntimeError(event.get("error", {}).get("message", "Anthropic 스트리밍 오류"))
+                elif event_type == "message_stop":
+                    break
+    
+    def _build_request(
+        self,
+        prompt: str,
+        api_key: Optional[str],
+        model: str
+    ) -> Tuple[Dict[str, str], Dict[str, Any]]:
+        """요청 헤더와 본문 생성"""
         key = api_key or settings.anthropic_api_key
         if not key:
             raise ValueError("Anthropic API 키가 설정되지 않았습니다.")
         
-        # config.json에서 API URL과 인증 방식 가져오기
-        anthropic_config = provider_configs.get('anthropic', {})
-        api_url = anthropic_config.get('api_url', 'https://api.anthropic.com/v1/messages')
-        auth_header = anthropic_config.get('auth_header', 'x-api-key')
-        auth_prefix = anthropic_config.get('auth_prefix', '')
+        # config.json에서 인증 방식 가져오기
+        auth_header = self.config.get('auth_header', 'x-api-key')
+        auth_prefix = self.config.get('auth_prefix', '')
         
         headers = {
             auth_header: f"{auth_prefix}{key}".strip(),
@@ -40,14 +82,4 @@ class AnthropicProvider(BaseAIProvider):
                 {"role": "user", "content": prompt}
             ]
         }
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                api_url,
-                headers=headers,
-                json=data,
-                timeout=30.0
-            )
-            response.raise_for_status()
-            result = response.json()
-            return result["content"][0]["text"] or ""
+        return headers, data
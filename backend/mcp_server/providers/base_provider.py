@@ -1,12 +1,37 @@
 """
 기본 AI 제공자 추상 클래스
 """
+import json
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, Optional
+import httpx
+from .client_pool import HTTPClientPool
+from ..config.settings import provider_configs
 
 class BaseAIProvider(ABC):
     """AI 제공자 기본 클래스"""
     
+    # config.json providers 키
+    name: str = ""
+    # config.json에 api_url이 없을 때 사용할 주소
+    default_api_url: str = ""
+    
+    def __init__(self, client_pool: Optional[HTTPClientPool] = None):
+        self.client_pool = client_pool or HTTPClientPool()
+    
+    @property
+    def config(self) -> Dict[str, Any]:
+        """config.json의 제공자 설정"""
+        return provider_configs.get(self.name, {})
+    
+    @property
+    def api_url(self) -> str:
+        return self.config.get('api_url', self.default_api_url)
+    
+    def get_client(self) -> httpx.AsyncClient:
+        """제공자 기본 URL의 공유 클라이언트 (연결 재사용)"""
+        return self.client_pool.get_client(self.name, self.api_url)
+    
     @abstractmethod
     async def call_api(
         self,
@@ -26,3 +51,29 @@ class BaseAIProvider(ABC):
             AI 응답
         """
         pass
+    
+    async def stream_api(
+        self,
+        prompt: str,
+        api_key: Optional[str] = None,
+        model: str = "gpt-4"
+    ) -> AsyncIterator[str]:
+        """
+        AI API 스트리밍 호출
+        
+        생성되는 텍스트 조각(delta)을 도착하는 즉시 내보냅니다.
+        스트리밍을 지원하지 않는 제공자는 전체 응답을 한 조각으로 내보냅니다.
+        """
+        yield await self.call_api(prompt, api_key, model)
+    
+    @staticmethod
+    async def iter_sse_events(response: httpx.Response) -> AsyncIterator[Dict[str, Any]]:
+        """SSE 응답의 data 줄을 JSON으로 파싱하여 순서대로 반환 ([DONE]에서 종료)"""
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if data == "[DONE]":
+                break
+            if data:
+                yield json.loads(data)
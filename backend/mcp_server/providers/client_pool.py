@@ -0,0 +1,110 @@
+"""
+HTTP 클라이언트 풀
+AI 제공자와 기본 URL별로 keep-alive(가능하면 HTTP/2) 연결을 유지하는 httpx 클라이언트를 공유하여
+요청마다 DNS 조회와 TCP/TLS 연결 비용을 다시 내지 않게 합니다.
+"""
+import asyncio
+from typing import Dict, Iterable, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+from loguru import logger
+
+from ..config.settings import settings
+
+try:
+    import h2  # noqa: F401 - httpx[http2]
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+def base_url_of(url: str) -> str:
+    """URL의 scheme://host[:port] 부분"""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+class HTTPClientPool:
+    """제공자/기본 URL별 공유 httpx 클라이언트 풀"""
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: Optional[bool] = None,
+        timeout: Optional[float] = None,
+        connect_timeout: Optional[float] = None
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections or settings.http_max_connections,
+            max_keepalive_connections=max_keepalive_connections or settings.http_max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry or settings.http_keepalive_expiry
+        )
+        self.timeout = httpx.Timeout(
+            timeout or settings.http_timeout,
+            connect=connect_timeout or settings.http_connect_timeout
+        )
+        http2 = settings.http2 if http2 is None else http2
+        if http2 and not HTTP2_AVAILABLE:
+            logger.warning("h2 패키지가 없어 HTTP/1.1 keep-alive로 연결합니다 (pip install httpx[http2]).")
+        self.http2 = http2 and HTTP2_AVAILABLE
+        # (제공자, 기본 URL) -> 클라이언트
+        self._clients: Dict[Tuple[str, str], httpx.AsyncClient] = {}
+
+    def get_client(self, provider: str, url: str) -> httpx.AsyncClient:
+        """제공자와 URL의 기본 주소에 해당하는 공유 클라이언트 (없으면 생성)"""
+        key = (provider, base_url_of(url))
+        client = self._clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(http2=self.http2, limits=self.limits, timeout=self.timeout)
+            self._clients[key] = client
+        return client
+
+    async def prewarm(self, targets: Iterable[Tuple[str, str]], timeout: float = 5.0) -> Dict[str, bool]:
+        """
+        연결 미리 열기
+
+        기본 주소로 HEAD 요청을 보내 응답 상태와 관계없이 TCP/TLS(HTTP/2) 연결을 풀에 남겨둡니다.
+
+        Args:
+            targets: (제공자, URL) 목록
+            timeout: 연결당 제한 시간 (초)
+
+        Returns:
+            제공자별 예열 성공 여부
+        """
+        async def warm(provider: str, url: str) -> bool:
+            try:
+                await self.get_client(provider, url).head(base_url_of(url), timeout=timeout)
+                return True
+            except Exception as e:
+                logger.debug(f"연결 예열 실패 ({provider}): {str(e)}")
+                return False
+
+        targets = list(targets)
+        results = await asyncio.gather(*(warm(provider, url) for provider, url in targets))
+        warmed = {provider: result for (provider, _), result in zip(targets, results)}
+        logger.info(f"AI 제공자 연결 예열: {sum(results)}/{len(results)}개 성공")
+        return warmed
+
+    def stats(self) -> Dict[str, object]:
+        """풀 설정과 열린 클라이언트 목록"""
+        return {
+            "http2": self.http2,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "keepalive_expiry": self.limits.keepalive_expiry,
+            "clients": [
+                f"{provider} {base_url}"
+                for (provider, base_url), client in self._clients.items()
+                if not client.is_closed
+            ]
+        }
+
+    async def aclose(self) -> None:
+        """모든 클라이언트와 연결 닫기"""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        await asyncio.gather(*(client.aclose() for client in clients), return_exceptions=True)
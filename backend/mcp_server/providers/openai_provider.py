@@ -1,15 +1,17 @@
 """
 OpenAI 제공자
 """
-import httpx
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 from .base_provider import BaseAIProvider
-from ..config.settings import settings, provider_configs
+from ..config.settings import settings
 from loguru import logger
 
 class OpenAIProvider(BaseAIProvider):
     """OpenAI API 제공자"""
     
+    name = "openai"
+    default_api_url = "https://api.openai.com/v1/chat/completions"
+    
     async def call_api(
         self,
         prompt: str,
@@ -17,15 +19,50 @@ class OpenAIProvider(BaseAIProvider):
         model: str = "gpt-4"
     ) -> str:
         """OpenAI API 호출"""
+        headers, data = self._build_request(prompt, api_key, model)
+        
+        # 공유 클라이언트로 keep-alive 연결 재사용
+        response = await self.get_client().post(
+            self.api_url,
+            headers=headers,
+            json=data
+        )
+        response.raise_for_status()
+        result = response.json()
+        return result["choices"][0]["message"]["content"]
+    
+    async def stream_api(
+        self,
+        prompt: str,
+        api_key: Optional[str] = None,
+        model: str = "gpt-4"
+    ) -> AsyncIterator[str]:
+        """OpenAI API 스트리밍 호출 (chat.completion.chunk의 delta.content)"""
+        headers, data = self._build_request(prompt, api_key, model)
+        data["stream"] = True
+        
+        async with self.get_client().stream("POST", self.api_url, headers=headers, json=data) as response:
+            response.raise_for_status()
+            async for event in self.iter_sse_events(response):
+                choices = event.get("choices") or []
+                delta = choices[0].get("delta", {}).get("content") if choices else None
+                if delta:
+                    yield delta
+    
+    def _build_request(
+        self,
+        prompt: str,
+        api_key: Optional[str],
+        model: str
+    ) -> Tuple[Dict[str, str], Dict[str, Any]]:
+        """요청 헤더와 본문 생성"""
         key = api_key or settings.openai_api_key
         if not key:
             raise ValueError("OpenAI API 키가 설정되지 않았습니다.")
         
-        # config.json에서 API URL과 인증 방식 가져오기
-        openai_config = provider_configs.get('openai', {})
-        api_url = openai_config.get('api_url', 'https://api.openai.com/v1/chat/completions')
-        auth_header = openai_config.get('auth_header', 'Authorization')
-        auth_prefix = openai_config.get('auth_prefix', 'Bearer')
+        # config.json에서 인증 방식 가져오기
+        auth_header = self.config.get('auth_header', 'Authorization')
+        auth_prefix = self.config.get('auth_prefix', 'Bearer')
         
         headers = {
             auth_header: f"{auth_prefix} {key}".strip(),
@@ -39,14 +76,4 @@ class OpenAIProvider(BaseAIProvider):
             ],
             "max_tokens": 2000
         }
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                api_url,
-                headers=headers,
-                json=data,
-                timeout=30.0
-            )
-            response.raise_for_status()
-            result = response.json()
-            return result["choices"][0]["message"]["content"]
+        return headers, data
@@ -1,15 +1,18 @@
 """
 Perplexity 제공자
 """
-from typing import Optional
+from typing import AsyncIterator, Optional
 from openai import AsyncOpenAI
 from .base_provider import BaseAIProvider
-from ..config.settings import settings, provider_configs
+from ..config.settings import settings
 from loguru import logger
 
 class PerplexityProvider(BaseAIProvider):
     """Perplexity API 제공자"""
     
+    name = "perplexity"
+    default_api_url = "https://api.perplexity.ai"
+    
     async def call_api(
         self,
         prompt: str,
@@ -17,16 +20,45 @@ class PerplexityProvider(BaseAIProvider):
         model: str = "gpt-4"
     ) -> str:
         """Perplexity API 호출"""
+        response = await self._create_client(api_key).chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "user", "content": prompt}
+            ]
+        )
+        return response.choices[0].message.content or ""
+    
+    async def stream_api(
+        self,
+        prompt: str,
+        api_key: Optional[str] = None,
+        model: str = "gpt-4"
+    ) -> AsyncIterator[str]:
+        """Perplexity API 스트리밍 호출"""
+        stream = await self._create_client(api_key).chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "user", "content": prompt}
+            ],
+            stream=True
+        )
+        try:
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    yield delta
+        finally:
+            await stream.response.aclose()
+    
+    def _create_client(self, api_key: Optional[str]) -> AsyncOpenAI:
         key = api_key or settings.perplexity_api_key
         if not key:
             raise ValueError("Perplexity API 키가 설정되지 않았습니다.")
         
-        # config.json에서 API URL 가져오기
-        perplexity_config = provider_configs.get('perplexity', {})
-        base_url = perplexity_config.get('api_url', 'https://api.perplexity.ai')
-        
-        client = AsyncOpenAI(
+        # 클라이언트 객체는 가볍고, 연결은 공유 httpx 클라이언트의 풀을 재사용
+        return AsyncOpenAI(
             api_key=key,
-            base_url=base_url
+            base_url=self.api_url,
+            http_client=self.get_client(),
+            max_retries=0  # 재시도는 AIProviderManager에서 처리
         )
-        
\ No newline at end of file